@@ -11,7 +11,7 @@ from fastapi import APIRouter
 
 def _collect_routers() -> list[APIRouter]:
     routers: list[APIRouter] = []
-    for name in ("choices", "play", "history", "health"):
+    for name in ("choices", "play", "history", "stats", "health", "debug"):
         module: ModuleType = import_module(f"app.api.v1.endpoints.{name}")
         router: APIRouter | None = getattr(module, "router", None)
         if router is not None:
@@ -2,22 +2,49 @@ from __future__ import annotations
 
 """Choice-related endpoints."""
 
-from fastapi import APIRouter
+import hashlib
 
+from fastapi import APIRouter, Header, Response, status
+from pydantic import TypeAdapter
+
+from app.core.config import get_settings
+from app.core.responses import etag_matches
 from app.schemas.game import ChoiceRead
 from app.utils.enums import Choice
 from app.utils.game_logic import random_choice
 
 router = APIRouter()
 
+# The gesture list is static: serialize it once and serve the bytes with a
+# strong validator so clients (and proxies) can revalidate for free.
+_CHOICES_JSON = TypeAdapter(list[ChoiceRead]).dump_json(
+    [ChoiceRead.from_enum(c) for c in Choice]
+)
+_CHOICES_ETAG = f'"{hashlib.blake2b(_CHOICES_JSON, digest_size=8).hexdigest()}"'
+_CHOICES_HEADERS = {
+    "ETag": _CHOICES_ETAG,
+    "Cache-Control": f"public, max-age={get_settings().CHOICES_CACHE_MAX_AGE}",
+}
+
 
 @router.get(
-    "/choices", response_model=list[ChoiceRead], summary="List available choices"
+    "/choices",
+    response_model=list[ChoiceRead],
+    summary="List available choices",
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "ETag matched"}},
 )
-async def list_choices() -> list[ChoiceRead]:
-    """Return all playable gestures (static)."""
-
-    return [ChoiceRead.from_enum(c) for c in Choice]
+async def list_choices(
+    if_none_match: str | None = Header(None, include_in_schema=False),
+) -> Response:
+    """Return all playable gestures (static, pre-serialized, cacheable)."""
+
+    if etag_matches(if_none_match, _CHOICES_ETAG):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=_CHOICES_HEADERS
+        )
+    return Response(
+        _CHOICES_JSON, media_type="application/json", headers=_CHOICES_HEADERS
+    )
 
 
 @router.get("/choice", response_model=ChoiceRead, summary="Get a random choice")
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+"""Admin-only debugging endpoints (off unless ``PROFILING_ENABLED``)."""
+
+import asyncio
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+
+from app.core.config import get_settings
+from app.utils.enums import ProfileFormat
+
+router = APIRouter()
+
+# One profile at a time – overlapping windows would distort each other.
+_PROFILE_LOCK = asyncio.Lock()
+
+
+def require_admin(
+    x_admin_token: str | None = Header(None, include_in_schema=False),
+) -> None:
+    """Reject requests unless profiling is enabled and the admin token matches.
+
+    A disabled (or token-less) deployment answers 404 so the endpoint's
+    existence is not advertised.
+    """
+
+    settings = get_settings()
+    if not settings.PROFILING_ENABLED or settings.ADMIN_TOKEN is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND)
+    expected = settings.ADMIN_TOKEN.get_secret_value().encode()
+    if x_admin_token is None or not hmac.compare_digest(
+        x_admin_token.encode(), expected
+    ):
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "invalid admin token")
+
+
+@router.post(
+    "/debug/profile",
+    dependencies=[Depends(require_admin)],
+    include_in_schema=False,
+    summary="Profile this worker's event loop for a few seconds",
+)
+async def profile(
+    seconds: float = Query(5.0, gt=0, description="Length of the profiling window"),
+    fmt: ProfileFormat = Query(
+        ProfileFormat.COLLAPSED, alias="format", description="collapsed | pstats"
+    ),
+    idle: bool = Query(False, description="Keep samples of the idle event loop"),
+) -> Response:
+    """Profile the live process while it keeps serving traffic.
+
+    ``collapsed`` samples the loop's stack every ``PROFILE_SAMPLE_INTERVAL_MS``
+    (low overhead) and returns ``frame;frame count`` lines for a flamegraph.
+    ``pstats`` traces every call with ``cProfile`` (slower) and returns a dump
+    for ``python -m pstats``.  Only the worker that receives the request is
+    profiled.
+    """
+
+    from app.utils.profiler import sample_stacks, trace_calls  # only when used
+
+    settings = get_settings()
+    if seconds > settings.PROFILE_MAX_SECONDS:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            f"seconds must not exceed {settings.PROFILE_MAX_SECONDS:g}",
+        )
+    if _PROFILE_LOCK.locked():
+        raise HTTPException(status.HTTP_409_CONFLICT, "a profile is already running")
+
+    async with _PROFILE_LOCK:
+        if fmt is ProfileFormat.PSTATS:
+            try:
+                dump = await trace_calls(seconds)
+            except ValueError as exc:  # another profiler (e.g. coverage) is active
+                raise HTTPException(status.HTTP_409_CONFLICT, str(exc)) from exc
+            return Response(
+                dump,
+                media_type="application/octet-stream",
+                headers={
+                    "Content-Disposition": 'attachment; filename="profile.pstats"'
+                },
+            )
+
+        sampler = await sample_stacks(
+            seconds,
+            interval=settings.PROFILE_SAMPLE_INTERVAL_MS / 1000.0,
+            include_idle=idle,
+        )
+        return Response(
+            sampler.collapsed(),
+            media_type="text/plain",
+            headers={
+                "X-Profile-Samples": str(sampler.samples),
+                "X-Profile-Idle-Samples": str(sampler.idle),
+            },
+        )
@@ -2,17 +2,34 @@ from __future__ import annotations
 
 """Game history / scoreboard endpoints."""
 
-from fastapi import APIRouter, Depends, Query, Response, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from collections.abc import AsyncIterator
+import csv
+import io
+import zlib
 
-from app.db.database import get_db_session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.db.database import get_db_session, get_session_factory
 from app.repositories.game_repository import GameRepository
 from app.schemas.game import GameRead
+from app.services.game_service import GameService
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.enums import ExportFormat
 
 router = APIRouter()
 
 _DEFAULT_LIMIT = 10
 _MAX_LIMIT = 100
+_NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+_CSV_FIELDS = list(GameRead.model_fields)
 
 
 @router.get(
@@ -21,18 +38,133 @@ _MAX_LIMIT = 100
     summary="Return most recent games (scoreboard)",
 )
 async def list_history(
+    response: Response,
     limit: int = Query(
         _DEFAULT_LIMIT, ge=1, le=_MAX_LIMIT, description="Number of records to return"
     ),
+    cursor: str | None = Query(
+        None, description="Opaque token from a previous page's X-Next-Cursor header"
+    ),
+    player_id: str | None = Query(
+        None, min_length=1, max_length=64, description="Only return this player's games"
+    ),
     session: AsyncSession = Depends(get_db_session),
 ) -> list[GameRead]:
-    """Return the *limit* most recently played games."""
+    """Return the *limit* most recently played games (keyset-paginated).
+
+    When more games exist an ``X-Next-Cursor`` response header carries the
+    token for the next (older) page.  With *player_id* only that player's
+    games are returned; the cursor keeps the filter's position.
+    """
+
+    try:
+        before = decode_cursor(cursor) if cursor is not None else None
+    except ValueError as exc:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(exc)) from exc
 
     repo = GameRepository(session)
-    games = await repo.list_recent(limit)
+    # Fetch one extra row to learn whether another page exists.
+    games = list(await repo.list_page(limit + 1, before, player_id=player_id))
+    if len(games) > limit:
+        games = games[:limit]
+        last = games[-1]
+        response.headers[_NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
     return [GameRead.from_model(g) for g in games]
 
 
+@router.get(
+    "/history/export",
+    response_class=StreamingResponse,
+    summary="Stream the full game history as NDJSON or CSV",
+)
+async def export_history(
+    request: Request,
+    fmt: ExportFormat = Query(
+        ExportFormat.NDJSON, alias="format", description="ndjson | csv"
+    ),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> StreamingResponse:
+    """Stream every game, newest first, using the *GameRead* column layout.
+
+    Rows are read through a server-side cursor in ``EXPORT_CHUNK_SIZE`` chunks
+    and written out as they arrive, so memory stays flat regardless of table
+    size.  The body is gzip-compressed when ``Accept-Encoding`` allows gzip
+    (``gzip`` or ``*`` with a non-zero q-value).
+    """
+
+    body = _export_chunks(session_factory, fmt, get_settings().EXPORT_CHUNK_SIZE)
+    headers = {
+        "Content-Disposition": f'attachment; filename="history.{fmt.value}"',
+        "Vary": "Accept-Encoding",
+    }
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        body = _gzip(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(body, media_type=_EXPORT_MEDIA_TYPES[fmt], headers=headers)
+
+
+async def _export_chunks(
+    session_factory: async_sessionmaker[AsyncSession],
+    fmt: ExportFormat,
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    """Yield one encoded block per database chunk."""
+
+    if fmt is ExportFormat.CSV:
+        yield (",".join(_CSV_FIELDS) + "\r\n").encode()
+
+    # The session lives inside the iterator: it must outlive the handler.
+    async with session_factory() as session:
+        async for rows in GameRepository(session).stream_rows(chunk_size):
+            games = [GameRead.from_row(r) for r in rows]
+            if fmt is ExportFormat.NDJSON:
+                yield "".join(f"{g.model_dump_json()}\n" for g in games).encode()
+            else:
+                buf = io.StringIO()
+                writer = csv.DictWriter(buf, fieldnames=_CSV_FIELDS)
+                writer.writerows(g.model_dump(mode="json") for g in games)
+                yield buf.getvalue().encode()
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an ``Accept-Encoding`` value allows gzip (RFC 9110 §12.5.3).
+
+    An explicit ``gzip`` (or ``x-gzip``) entry wins over ``*``; a missing or
+    malformed q-value counts as 1 and 0 respectively.
+    """
+
+    weights: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in weights:
+            return weights[coding] > 0
+    return False
+
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Compress a byte stream incrementally into a single gzip member."""
+
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+    yield compressor.flush()
+
+
 @router.delete(
     "/history",
     summary="Clear the scoreboard (delete all games)",
@@ -40,8 +172,7 @@ async def list_history(
 async def clear_history(session: AsyncSession = Depends(get_db_session)) -> Response:
     """Delete all game records and respond with *204 No Content*."""
 
-    repo = GameRepository(session)
-    await repo.clear()
+    await GameService(GameRepository(session)).clear_history()
 
     # Return an explicit empty 204 response to satisfy FastAPI's body restrictions.
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -5,9 +5,9 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db_session
+from app.db.database import commit_session, get_db_session
 from app.repositories.game_repository import GameRepository
-from app.schemas.game import PlayRequest, PlayResponse
+from app.schemas.game import PlayBatchRequest, PlayRequest, PlayResponse
 from app.services.game_service import GameService
 
 router = APIRouter()
@@ -27,7 +27,32 @@ async def play_round(
 
     repo = GameRepository(session)
     service = GameService(repo)
-    game = await service.play(payload.to_choice(), payload.mode)
+    game = await service.play(payload.to_choice(), payload.mode, payload.player_id)
+    await commit_session(session)
     return PlayResponse.from_round(
         game.player_choice, game.computer_choice, game.winner
     )
+
+
+@router.post(
+    "/play/batch",
+    response_model=list[PlayResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Play many rounds in one request",
+)
+async def play_batch(
+    payload: PlayBatchRequest,
+    session: AsyncSession = Depends(get_db_session),
+) -> list[PlayResponse]:
+    """Execute the rounds in order and persist them with a single INSERT."""
+
+    repo = GameRepository(session)
+    service = GameService(repo)
+    games = await service.play_batch(
+        [(r.to_choice(), r.mode, r.player_id) for r in payload.rounds]
+    )
+    await commit_session(session)
+    return [
+        PlayResponse.from_round(g.player_choice, g.computer_choice, g.winner)
+        for g in games
+    ]
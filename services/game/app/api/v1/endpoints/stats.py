@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+"""Scoreboard aggregate endpoint."""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_db_session
+from app.repositories.game_repository import GameRepository
+from app.schemas.game import StatsRead
+
+router = APIRouter()
+
+
+@router.get("/stats", response_model=StatsRead, summary="Scoreboard totals")
+async def get_stats(session: AsyncSession = Depends(get_db_session)) -> StatsRead:
+    """Return win/lose/tie, per-mode and per-gesture totals.
+
+    Served from the incrementally maintained aggregates table - a handful of
+    rows - so the cost does not grow with the number of games played.
+    """
+
+    repo = GameRepository(session)
+    return StatsRead.from_aggregates(await repo.get_stats())
@@ -14,7 +14,7 @@ from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version
 import os
 
-from pydantic import Field, field_validator
+from pydantic import Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings
 
 __all__ = ["Settings", "get_settings"]
@@ -43,6 +43,38 @@ class Settings(BaseSettings):
     API_V1_STR: str = Field("/api/v1", description="Base prefix for V1 endpoints")
     HOST: str = Field("0.0.0.0", description="Host for Uvicorn")
     PORT: int = Field(8000, description="Port for Uvicorn")
+    PLAY_BATCH_MAX_ROUNDS: int = Field(
+        500, ge=1, description="Maximum rounds accepted by POST /play/batch"
+    )
+    SERVER_TIMING_ENABLED: bool = Field(
+        False,
+        description="Send a Server-Timing header with each response's stage times "
+        "(exposes internal timings to clients; enable for debugging only)",
+    )
+    ORJSON_RESPONSES: bool = Field(
+        False,
+        description="Render JSON responses with orjson instead of FastAPI's default "
+        "(slower for response_model endpoints on FastAPI releases that serialize "
+        "them with Pydantic directly)",
+    )
+    CHOICES_CACHE_MAX_AGE: int = Field(
+        86400, ge=0, description="Cache-Control max-age (seconds) of GET /choices"
+    )
+
+    # ------------------------------------------------------------------––-
+    # Logging
+    # ------------------------------------------------------------------––-
+    LOG_QUEUE_ENABLED: bool = Field(
+        False, description="Render and write log lines on a background thread"
+    )
+    LOG_QUEUE_SIZE: int = Field(
+        10_000, ge=1, description="Log events buffered before new ones are dropped"
+    )
+    LOG_SAMPLE_RATES: dict[str, float] = Field(
+        default_factory=dict,
+        description="Fraction of debug/info events kept, by event name, e.g. "
+        '{"round_played": 0.01}; warnings and errors are always kept',
+    )
 
     # ------------------------------------------------------------------––-
     # Database
@@ -53,6 +85,74 @@ class Settings(BaseSettings):
         ),
         description="SQLAlchemy compatible DSN",
     )
+    DB_POOL_SIZE: int = Field(
+        5, ge=1, description="Connections kept open in the pool per worker"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        10, ge=0, description="Extra connections opened when the pool is exhausted"
+    )
+    DB_POOL_TIMEOUT: float = Field(
+        30.0, gt=0, description="Seconds to wait for a free connection before failing"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        -1, ge=-1, description="Replace connections older than this (seconds, -1 never)"
+    )
+    DB_POOL_PRE_PING: bool = Field(
+        True, description="Test each connection with a round trip on checkout"
+    )
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        100,
+        ge=0,
+        description="asyncpg prepared statements cached per connection (0 disables)",
+    )
+
+    WRITE_BEHIND_ENABLED: bool = Field(
+        False, description="Persist rounds asynchronously via a group-commit queue"
+    )
+    WRITE_BEHIND_QUEUE_SIZE: int = Field(
+        10_000, ge=1, description="Rounds buffered before /play applies backpressure"
+    )
+    WRITE_BEHIND_BATCH_SIZE: int = Field(
+        500, ge=1, description="Maximum rows per write-behind INSERT/COMMIT"
+    )
+    WRITE_BEHIND_FLUSH_MS: int = Field(
+        50, ge=1, description="Maximum time a queued round waits before a flush"
+    )
+
+    EXPORT_CHUNK_SIZE: int = Field(
+        1000, ge=1, description="Rows fetched per server-side cursor chunk on export"
+    )
+    SQL_SLOW_QUERY_MS: float = Field(
+        100.0, ge=0, description="Log statements slower than this (0 disables)"
+    )
+    SQL_METRICS_MAX_FINGERPRINTS: int = Field(
+        500,
+        ge=1,
+        description="Distinct statement fingerprints labelled before 'other' is used",
+    )
+
+    # ------------------------------------------------------------------––-
+    # Smart mode
+    # ------------------------------------------------------------------––-
+    SMART_HISTORY_WINDOW: int = Field(
+        5, ge=1, description="Recent player moves smart mode keeps in memory"
+    )
+    SMART_HISTORY_MAX_PLAYERS: int = Field(
+        10_000, ge=1, description="Per-player move windows cached before LRU eviction"
+    )
+
+    # ------------------------------------------------------------------––-
+    # Markov mode
+    # ------------------------------------------------------------------––-
+    MARKOV_ORDER: int = Field(
+        2, ge=1, le=4, description="Previous moves the Markov predictor conditions on"
+    )
+    MARKOV_MAX_SESSIONS: int = Field(
+        10_000, ge=1, description="Per-player predictors kept before LRU eviction"
+    )
+    MARKOV_WARMUP_ROUNDS: int = Field(
+        100, ge=0, description="Stored moves replayed into a player's new predictor"
+    )
 
     # ------------------------------------------------------------------––-
     # CORS
@@ -69,6 +169,71 @@ class Settings(BaseSettings):
         "https://codechallenge.boohma.com/random",
         description="Endpoint that returns a JSON payload with a 'random_number' key",
     )
+    RANDOM_API_TIMEOUT: float = Field(
+        2.0, description="Upper bound (seconds) on the RANDOM_API_URL timeout"
+    )
+    RANDOM_API_MIN_TIMEOUT: float = Field(
+        0.05, description="Lower bound (seconds) on the adaptive RANDOM_API_URL timeout"
+    )
+    RANDOM_API_TIMEOUT_MULTIPLIER: float = Field(
+        3.0, description="Adaptive timeout = observed p99 latency x this factor"
+    )
+    RANDOM_API_HEDGE_ENABLED: bool = Field(
+        False,
+        description="Send a second request once the first exceeds the p95 latency",
+    )
+    RANDOM_API_BREAKER_THRESHOLD: int = Field(
+        5, ge=1, description="Consecutive failures that open the circuit breaker"
+    )
+    RANDOM_API_BREAKER_RESET: float = Field(
+        30.0, description="Seconds the breaker stays open before probing again"
+    )
+    HTTP_MAX_CONNECTIONS: int = Field(
+        100, ge=1, description="Upper bound on pooled outbound HTTP connections"
+    )
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        20, ge=0, description="Idle keep-alive connections kept in the pool"
+    )
+    HTTP_KEEPALIVE_EXPIRY: float = Field(
+        30.0, description="Seconds an idle keep-alive connection stays open"
+    )
+    HTTP2_ENABLED: bool = Field(
+        True, description="Negotiate HTTP/2 when the 'h2' package is installed"
+    )
+    # Every worker fills its own buffer from a public API: keep bursts small.
+    ENTROPY_BUFFER_SIZE: int = Field(
+        32,
+        ge=0,
+        description="Pre-fetched random numbers kept in memory (0 disables the buffer)",
+    )
+    ENTROPY_LOW_WATER: int = Field(
+        8, ge=0, description="Buffer depth below which a background refill starts"
+    )
+    ENTROPY_REFILL_CONCURRENCY: int = Field(
+        4,
+        ge=1,
+        le=16,
+        description="Concurrent RANDOM_API_URL requests per refill batch",
+    )
+    ENTROPY_RETRY_DELAY: float = Field(
+        1.0, description="Seconds to wait before retrying a refill that failed"
+    )
+
+    # ------------------------------------------------------------------––-
+    # Admin / debugging
+    # ------------------------------------------------------------------––-
+    ADMIN_TOKEN: SecretStr | None = Field(
+        None, description="Token expected in X-Admin-Token by admin-only endpoints"
+    )
+    PROFILING_ENABLED: bool = Field(
+        False, description="Expose POST /debug/profile (also requires ADMIN_TOKEN)"
+    )
+    PROFILE_MAX_SECONDS: float = Field(
+        60.0, gt=0, description="Longest profiling window a request may ask for"
+    )
+    PROFILE_SAMPLE_INTERVAL_MS: float = Field(
+        5.0, gt=0, description="Stack sampling interval of the collapsed profiler"
+    )
 
     # ------------------------------------------------------------------––-
     # Misc / Build metadata
@@ -78,6 +243,14 @@ class Settings(BaseSettings):
     # ------------------------------------------------------------------––-
     # Validators & configuration
     # ------------------------------------------------------------------––-
+    @field_validator("LOG_SAMPLE_RATES")
+    @classmethod
+    def _check_sample_rates(cls, v: dict[str, float]) -> dict[str, float]:
+        for event, rate in v.items():
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"sample rate of {event!r} must be within 0-1")
+        return v
+
     @field_validator("VERSION", mode="before")
     @classmethod
     def _autodetect_version(
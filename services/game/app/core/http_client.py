@@ -0,0 +1,86 @@
+"""Shared outbound HTTP client.
+
+A single long-lived `httpx.AsyncClient` is created in the FastAPI *lifespan*
+and reused by every caller, so outbound requests (e.g. the random-number API)
+ride on pooled keep-alive connections instead of paying a fresh TCP + TLS
+handshake per round:
+
+    from app.core.http_client import get_http_client
+    resp = await get_http_client().get(url)
+"""
+
+from __future__ import annotations
+
+from importlib.util import find_spec
+
+import httpx
+
+from app.core.config import Settings, get_settings
+
+__all__ = [
+    "close_http_client",
+    "get_http_client",
+    "init_http_client",
+]
+
+# Process-wide client – created lazily or by the application lifespan.
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def _build_client(
+    settings: Settings, transport: httpx.AsyncBaseTransport | None = None
+) -> httpx.AsyncClient:
+    """Return a new client configured from *settings*."""
+
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+    # HTTP/2 needs the optional *h2* package – silently stay on HTTP/1.1 without it.
+    http2 = settings.HTTP2_ENABLED and find_spec("h2") is not None
+    return httpx.AsyncClient(
+        timeout=settings.RANDOM_API_TIMEOUT,
+        limits=limits,
+        http2=http2,
+        transport=transport,
+    )
+
+
+def init_http_client(
+    *, transport: httpx.AsyncBaseTransport | None = None
+) -> httpx.AsyncClient:
+    """Create the shared client (idempotent) and return it.
+
+    *transport* routes every request through a custom transport – e.g. an
+    ``httpx.MockTransport`` so benchmarks and load tests run offline.  It only
+    applies when a new client is built; close the current one first to swap.
+    """
+
+    global _CLIENT
+
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = _build_client(get_settings(), transport)
+    return _CLIENT
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use.
+
+    Lazy creation keeps scripts and tests that never run the FastAPI lifespan
+    working; in the service proper the lifespan has already built it.
+    """
+
+    if _CLIENT is None or _CLIENT.is_closed:
+        return init_http_client()
+    return _CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared client and release its pooled connections."""
+
+    global _CLIENT
+
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
@@ -0,0 +1,177 @@
+"""Background-thread sink for structlog events.
+
+With ``LOG_QUEUE_ENABLED`` the processor chain stops short of rendering: the
+event loop only merges context, stamps the time and level (cheap, and bound
+to the calling thread/task) and enqueues the event dict.  A daemon thread
+renders the JSON lines and writes them to stdout in batches, one ``write`` +
+``flush`` per batch, so a slow or blocked stdout pipe never stalls the loop.
+
+The queue is bounded (``LOG_QUEUE_SIZE``).  When it is full the event is
+dropped – never waited for – and counted in ``rpsls_log_dropped_total``.
+Stopping the queue drains it; afterwards events are rendered and written
+synchronously again, so nothing logged during shutdown is lost.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import contextlib
+import queue
+import sys
+import threading
+from typing import Any, TextIO, cast
+
+import structlog
+from structlog.typing import EventDict
+
+from app.core.metrics import LOG_DROPPED_TOTAL
+
+__all__ = ["LogQueue", "QueueLogger", "QueueLoggerFactory", "enqueue"]
+
+# Events rendered and written per write() call.
+_BATCH_SIZE = 256
+
+
+class LogQueue:
+    """Bounded queue of event dicts rendered and written by a daemon thread."""
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        file: TextIO | None = None,
+    ) -> None:
+        # ``None`` resolves ``sys.stdout`` per batch (it may be swapped, e.g. by
+        # pytest's capture).
+        self.file = file
+        self.dropped = 0
+        self._render = structlog.processors.JSONRenderer()
+        self._queue: queue.Queue[EventDict | None] = queue.Queue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def put(self, event_dict: EventDict) -> None:
+        """Enqueue *event_dict*; drop and count it when the queue is full."""
+
+        if self._thread is None:
+            self._write([event_dict])
+            return
+        try:
+            self._queue.put_nowait(event_dict)
+        except queue.Full:
+            self._drop(1)
+
+    def start(self) -> None:
+        """Spawn the writer thread (idempotent)."""
+
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="log-writer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write every queued event, then stop the writer thread."""
+
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        with contextlib.suppress(queue.Full):  # stuck writer: leftovers below
+            self._queue.put(None, timeout=timeout)
+        thread.join(timeout)
+        leftovers = []
+        while True:
+            try:
+                event_dict = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if event_dict is not None:
+                leftovers.append(event_dict)
+        if leftovers:
+            self._write(leftovers)
+
+    @contextlib.contextmanager
+    def redirect(self, file: TextIO) -> Iterator[None]:
+        """Write to *file* inside the block; queued events are flushed first."""
+
+        running, previous = self.running, self.file
+        self.stop()
+        self.file = file
+        if running:
+            self.start()
+        try:
+            yield
+        finally:
+            self.stop()
+            self.file = previous
+            if running:
+                self.start()
+
+    def _run(self) -> None:
+        done = False
+        while not done:
+            item = self._queue.get()
+            batch: list[EventDict] = []
+            while True:
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+                if len(batch) == _BATCH_SIZE:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(batch)
+
+    def _write(self, events: list[EventDict]) -> None:
+        out = self.file or sys.stdout
+        lines = "".join(f"{cast('str', self._render(None, '', e))}\n" for e in events)
+        with self._lock:
+            try:
+                out.write(lines)
+                out.flush()
+            except (OSError, ValueError):  # closed or broken stream
+                self._drop(len(events))
+
+    def _drop(self, n: int) -> None:
+        self.dropped += n
+        LOG_DROPPED_TOTAL.inc(n)
+
+
+def enqueue(_logger: Any, _method_name: str, event_dict: EventDict) -> Any:
+    """Final processor in queue mode: hand the unrendered dict to the logger."""
+
+    return (event_dict,), {}
+
+
+class QueueLogger:
+    """structlog logger whose every method forwards the event to a ``LogQueue``."""
+
+    def __init__(self, sink: LogQueue) -> None:
+        self._sink = sink
+
+    def msg(self, event_dict: EventDict) -> None:
+        self._sink.put(event_dict)
+
+    log = debug = info = warn = warning = msg
+    err = error = critical = exception = fatal = failure = msg
+
+
+class QueueLoggerFactory:
+    """``logger_factory`` handing out ``QueueLogger`` instances for *sink*."""
+
+    def __init__(self, sink: LogQueue) -> None:
+        self.sink = sink
+
+    def __call__(self, *_args: Any) -> QueueLogger:
+        return QueueLogger(self.sink)
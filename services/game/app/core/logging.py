@@ -11,22 +11,43 @@ function configures:
 The log-level is controlled with the environment variable `LOG_LEVEL` (DEBUG,
 INFO, WARNING, …).  If it's not set we fall back to `DEBUG` when the global
 `DEBUG` env-var is truthy, otherwise to `INFO`.
+
+Two settings shape the hot path:
+
+* `LOG_QUEUE_ENABLED` – structlog events are rendered and written by a
+  background thread (`app.core.log_queue`) instead of on the event loop.
+* `LOG_SAMPLE_RATES` – keep only a fraction of chatty debug/info events
+  (`{"round_played": 0.01}`); dropped before any other processor runs.
 """
 
 from __future__ import annotations
 
+import atexit
+from collections.abc import Callable, Mapping
 import logging
 import os
+import random
 import sys
-from typing import Final
+from typing import Any, Final
 
 import structlog
+from structlog.typing import EventDict
+
+from app.core.config import get_settings
+from app.core.log_queue import LogQueue, QueueLoggerFactory, enqueue
+from app.core.metrics import LOG_SAMPLED_OUT_TOTAL
 
-__all__: Final = ["init_logging"]
+__all__: Final = ["SampleEvents", "get_log_queue", "init_logging", "stop_log_queue"]
 
 # Internal flag so repeated init_logging() calls are no-ops (unless force_reinit=True)
 _CONFIGURED: bool = False
 
+# Process-wide background writer (``None`` unless LOG_QUEUE_ENABLED)
+_LOG_QUEUE: LogQueue | None = None
+
+# Only routine events are sampled; warnings and errors always get through.
+_SAMPLED_METHODS: Final = frozenset({"debug", "info"})
+
 
 def _detect_level() -> int:
     """Return an *int* log level from environment variables."""
@@ -44,6 +65,50 @@ def _detect_level() -> int:
     return logging.INFO
 
 
+class SampleEvents:
+    """structlog processor keeping a fraction of debug/info events by name.
+
+    *rates* maps an event name to the probability of keeping it; events not
+    listed, and anything logged at warning or above, always pass.
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[str, float],
+        *,
+        random_: Callable[[], float] = random.random,
+    ) -> None:
+        self._rates = {e: r for e, r in rates.items() if r < 1.0}
+        self._skipped = {e: LOG_SAMPLED_OUT_TOTAL.labels(event=e) for e in self._rates}
+        self._random = random_
+
+    def __call__(
+        self, _logger: Any, method_name: str, event_dict: EventDict
+    ) -> EventDict:
+        rate = self._rates.get(event_dict.get("event"))  # type: ignore[arg-type]
+        if (
+            rate is not None
+            and method_name in _SAMPLED_METHODS
+            and self._random() >= rate
+        ):
+            self._skipped[event_dict["event"]].inc()
+            raise structlog.DropEvent
+        return event_dict
+
+
+def get_log_queue() -> LogQueue | None:
+    """Return the background log writer, or ``None`` in synchronous mode."""
+
+    return _LOG_QUEUE
+
+
+def stop_log_queue() -> None:
+    """Flush and stop the background log writer (later events are written inline)."""
+
+    if _LOG_QUEUE is not None:
+        _LOG_QUEUE.stop()
+
+
 def init_logging(force_reinit: bool = False) -> None:  # pragma: no cover
     """Configure stdlib + structlog global settings.
 
@@ -52,12 +117,13 @@ def init_logging(force_reinit: bool = False) -> None:  # pragma: no cover
     e.g. unit tests that monkey-patch processors).
     """
 
-    global _CONFIGURED
+    global _CONFIGURED, _LOG_QUEUE
 
     if _CONFIGURED and not force_reinit:
         return  # already configured – skip
 
     level = _detect_level()
+    settings = get_settings()
 
     # ------------------------------------------------------------------
     # Stdlib logging – minimal handler writing raw messages to stdout.
@@ -73,17 +139,35 @@ def init_logging(force_reinit: bool = False) -> None:  # pragma: no cover
     # ------------------------------------------------------------------
     # structlog configuration
     # ------------------------------------------------------------------
+    processors: list[Any] = []
+    if settings.LOG_SAMPLE_RATES:
+        processors.append(SampleEvents(settings.LOG_SAMPLE_RATES))
+    processors += [
+        structlog.contextvars.merge_contextvars,  # include contextvars (e.g. request-id)
+        structlog.processors.TimeStamper(fmt="iso", key="ts"),
+        structlog.processors.add_log_level,
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+    ]
+
+    logger_factory: Any
+    if settings.LOG_QUEUE_ENABLED:
+        # Rendering (JSONRenderer) and the write happen on the writer thread.
+        if _LOG_QUEUE is None:
+            _LOG_QUEUE = LogQueue(max_size=settings.LOG_QUEUE_SIZE)
+            atexit.register(stop_log_queue)  # daemon thread: flush before exit
+        _LOG_QUEUE.start()
+        processors.append(enqueue)
+        logger_factory = QueueLoggerFactory(_LOG_QUEUE)
+    else:
+        stop_log_queue()
+        processors.append(structlog.processors.JSONRenderer())  # emits JSON per line
+        logger_factory = structlog.PrintLoggerFactory()
+
     structlog.configure(
         wrapper_class=structlog.make_filtering_bound_logger(level),
-        logger_factory=structlog.PrintLoggerFactory(),
-        processors=[
-            structlog.contextvars.merge_contextvars,  # include contextvars (e.g. request-id)
-            structlog.processors.TimeStamper(fmt="iso", key="ts"),
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),  # final output – emits JSON per line
-        ],
+        logger_factory=logger_factory,
+        processors=processors,
         cache_logger_on_first_use=True,
     )
 
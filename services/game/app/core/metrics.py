@@ -2,7 +2,11 @@ from __future__ import annotations
 
 """Prometheus metrics specific to the game service."""
 
-from prometheus_client import Counter
+from pathlib import Path
+import os
+import re
+
+from prometheus_client import Counter, Gauge, Histogram, multiprocess
 
 # ---------------------------------------------------------------------------
 # Custom counters
@@ -19,3 +23,229 @@ AI_OUTCOME_TOTAL = Counter(
     "AI outcomes by mode (win/lose/tie from player perspective)",
     labelnames=["mode", "outcome"],
 )
+
+# ---------------------------------------------------------------------------
+# Entropy buffer (pre-fetched random numbers)
+# ---------------------------------------------------------------------------
+
+ENTROPY_BUFFER_DEPTH = Gauge(
+    "rpsls_entropy_buffer_depth",
+    "Pre-fetched random numbers currently waiting in the entropy buffer",
+    multiprocess_mode="livesum",
+)
+
+ENTROPY_REFILLED_TOTAL = Counter(
+    "rpsls_entropy_refilled_total",
+    "Random numbers fetched from RANDOM_API_URL into the entropy buffer",
+)
+
+ENTROPY_FALLBACK_TOTAL = Counter(
+    "rpsls_entropy_fallback_total",
+    "Rounds whose computer move came from the local PRNG instead of the API",
+    labelnames=["reason"],
+)
+
+# ---------------------------------------------------------------------------
+# Random-number API resilience
+# ---------------------------------------------------------------------------
+
+RANDOM_API_LATENCY = Histogram(
+    "rpsls_random_api_latency_seconds",
+    "Latency of successful RANDOM_API_URL calls",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0),
+)
+
+RANDOM_API_HEDGED_TOTAL = Counter(
+    "rpsls_random_api_hedged_total",
+    "Hedged (second) requests sent to RANDOM_API_URL",
+)
+
+CIRCUIT_BREAKER_STATE = Gauge(
+    "rpsls_circuit_breaker_state",
+    "Circuit breaker state (0=closed, 1=half-open, 2=open)",
+    labelnames=["name"],
+    multiprocess_mode="livemax",  # one open breaker is what alerts care about
+)
+
+# ---------------------------------------------------------------------------
+# Write-behind persistence
+# ---------------------------------------------------------------------------
+
+WRITE_BEHIND_QUEUE_DEPTH = Gauge(
+    "rpsls_write_behind_queue_depth",
+    "Rounds waiting in the write-behind queue",
+    multiprocess_mode="livesum",
+)
+
+WRITE_BEHIND_FLUSH_SECONDS = Histogram(
+    "rpsls_write_behind_flush_seconds",
+    "Time to insert and commit one write-behind batch",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+WRITE_BEHIND_DROPPED_TOTAL = Counter(
+    "rpsls_write_behind_dropped_total",
+    "Rounds dropped after repeated write-behind flush failures",
+)
+
+# ---------------------------------------------------------------------------
+# Logging pipeline
+# ---------------------------------------------------------------------------
+
+LOG_DROPPED_TOTAL = Counter(
+    "rpsls_log_dropped_total",
+    "Log events dropped because the log queue was full or stdout failed",
+)
+
+LOG_SAMPLED_OUT_TOTAL = Counter(
+    "rpsls_log_sampled_out_total",
+    "Log events skipped by LOG_SAMPLE_RATES sampling",
+    labelnames=["event"],
+)
+
+# ---------------------------------------------------------------------------
+# Request latency breakdown (also sent as a Server-Timing header)
+# ---------------------------------------------------------------------------
+
+_STAGE_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+PLAY_STAGE_SECONDS = Histogram(
+    "rpsls_play_stage_seconds",
+    "Time spent in each stage of GameService.play (entropy/history/ai/persist)",
+    labelnames=["stage", "mode"],
+    buckets=_STAGE_BUCKETS,
+)
+
+DB_COMMIT_SECONDS = Histogram(
+    "rpsls_db_commit_seconds",
+    "Time to commit the request-scoped DB session (mode=none outside /play)",
+    labelnames=["mode"],
+    buckets=_STAGE_BUCKETS,
+)
+
+# ---------------------------------------------------------------------------
+# SQL statements (grouped by normalized fingerprint)
+# ---------------------------------------------------------------------------
+
+DB_STATEMENT_SECONDS = Histogram(
+    "rpsls_db_statement_seconds",
+    "Execution time of SQL statements per fingerprint",
+    labelnames=["fingerprint", "operation"],
+    buckets=_STAGE_BUCKETS,
+)
+
+DB_STATEMENT_ROWS = Counter(
+    "rpsls_db_statement_rows_total",
+    "Rows affected by SQL statements per fingerprint (as reported by the driver)",
+    labelnames=["fingerprint", "operation"],
+)
+
+DB_STATEMENT_INFO = Gauge(
+    "rpsls_db_statement_info",
+    "Normalized SQL of each fingerprint (always 1)",
+    labelnames=["fingerprint", "statement"],
+    multiprocess_mode="max",
+)
+
+# ---------------------------------------------------------------------------
+# Database connection pool
+# ---------------------------------------------------------------------------
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "rpsls_db_pool_checked_out",
+    "Pooled DB connections currently in use",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "rpsls_db_pool_overflow",
+    "DB connections open beyond DB_POOL_SIZE",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKOUT_WAIT_SECONDS = Histogram(
+    "rpsls_db_pool_checkout_wait_seconds",
+    "Time to obtain a pooled DB connection, including connecting a new one",
+    buckets=(
+        0.0001,
+        0.0005,
+        0.001,
+        0.005,
+        0.01,
+        0.05,
+        0.1,
+        0.5,
+        1.0,
+        5.0,
+        10.0,
+        30.0,
+    ),
+)
+
+# ---------------------------------------------------------------------------
+# Multi-process mode (uvicorn --workers)
+# ---------------------------------------------------------------------------
+#
+# With ``PROMETHEUS_MULTIPROC_DIR`` set *before* prometheus_client is imported
+# every metric is backed by an mmap'ed file in that directory and /metrics
+# merges the files of all workers.  Counters and histograms keep the totals
+# of exited workers; ``live*`` gauges only count workers still running, so a
+# worker removes its gauge files on shutdown and a starting one removes those
+# of workers that died without shutting down.
+
+_LIVE_GAUGE_FILE = re.compile(r"gauge_live\w+_(\d+)\.db")
+
+
+def multiprocess_dir() -> str | None:
+    """Directory shared by the workers' metric files, ``None`` when disabled."""
+
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # exists, owned by someone else
+        return True
+    return True
+
+
+def mark_worker_dead(pid: int | None = None, path: str | None = None) -> None:
+    """Remove the live-gauge files of worker *pid* (default: this process)."""
+
+    path = path or multiprocess_dir()
+    if path:
+        multiprocess.mark_process_dead(pid or os.getpid(), path)  # type: ignore[no-untyped-call]
+
+
+def sweep_dead_workers(path: str | None = None) -> list[int]:
+    """Remove live-gauge files of workers that exited without cleaning up."""
+
+    path = path or multiprocess_dir()
+    if not path:
+        return []
+    pids = {
+        int(m.group(1))
+        for f in Path(path).glob("gauge_live*.db")
+        if (m := _LIVE_GAUGE_FILE.fullmatch(f.name))
+    }
+    dead = sorted(pid for pid in pids if not _pid_alive(pid))
+    for pid in dead:
+        mark_worker_dead(pid, path)
+    return dead
@@ -1,47 +1,72 @@
-"""Shared FastAPI middleware utilities (logging, tracing, …)."""
+"""Shared ASGI middleware (logging, tracing, …)."""
 
 from __future__ import annotations
 
 import uuid
-from collections.abc import Awaitable, Callable
 
-from fastapi import Request, Response
+from fastapi.responses import JSONResponse
 import structlog
 from structlog.contextvars import bind_contextvars, clear_contextvars
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-__all__ = ["request_id_middleware"]
+__all__ = ["RequestIdMiddleware"]
 
+_HEADER = b"x-request-id"
 
-async def request_id_middleware(  # noqa: D401
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
+
+class RequestIdMiddleware:
     """Attach *request_id* to structlog context and response headers.
 
     The middleware honours an incoming **X-Request-ID** header; when absent it
-    generates a UUID4.  The id is injected into:
+    generates a random UUID4.  The id is injected into:
 
     1. *structlog* contextvars (so every subsequent `log.*` call in the same
        coroutine automatically includes it).
     2. The response headers - consumers can correlate requests ↔ logs easily.
+
+    Written as plain ASGI rather than ``@app.middleware("http")``: it only
+    touches the ``http.response.start`` message, so responses – streamed ones
+    included – pass through without ``BaseHTTPMiddleware``'s extra task and
+    memory streams.
     """
 
-    # Reset any leftover context from previous tasks (important in tests)
-    clear_contextvars()
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    req_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-    bind_contextvars(request_id=req_id, path=request.url.path, method=request.method)
+        # Reset any leftover context from previous tasks (important in tests)
+        clear_contextvars()
 
-    try:
-        response = await call_next(request)
-    except Exception:  # pragma: no cover – ensure we still log & respond
-        # Log stacktrace with the bound request context (request_id, path…)
-        structlog.get_logger().exception("Unhandled exception")
+        raw_id = next((v for k, v in scope["headers"] if k == _HEADER), None)
+        if raw_id is None:
+            req_id = str(uuid.uuid4())
+            raw_id = req_id.encode()
+        else:
+            req_id = raw_id.decode("latin-1")
+        bind_contextvars(request_id=req_id, path=scope["path"], method=scope["method"])
 
-        from fastapi.responses import JSONResponse  # local import to avoid circular
+        response_started = False
 
-        response = JSONResponse({"detail": "Internal Server Error"}, status_code=500)
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                headers = message.setdefault("headers", [])
+                # Ensure correlation id is returned even on errors
+                if not any(k.lower() == _HEADER for k, _ in headers):
+                    message["headers"] = [*headers, (_HEADER, raw_id)]
+            await send(message)
 
-    # Ensure correlation id is returned even on errors
-    response.headers.setdefault("X-Request-ID", req_id)
-    return response
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        except Exception:
+            # Log stacktrace with the bound request context (request_id, path…)
+            structlog.get_logger().exception("Unhandled exception")
+            if response_started:  # too late for a 500 – let the server abort
+                raise
+            response = JSONResponse({"detail": "Internal Server Error"}, 500)
+            await response(scope, receive, send_with_request_id)
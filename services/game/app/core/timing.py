@@ -0,0 +1,131 @@
+"""Per-request latency breakdown.
+
+``ServerTimingMiddleware`` puts a fresh, mutable ``ServerTiming`` into a
+context variable for every request.  Code further down the stack – the game
+service stages, the session commit in ``commit_session`` – adds its
+durations with ``timed_stage`` / ``record_stage``, and the middleware renders
+everything into a ``Server-Timing`` header as the response starts::
+
+    Server-Timing: history;dur=0.04, ai;dur=0.01, persist;dur=0.52, ...
+
+Outside a request (tests, scripts, batch jobs) there is no ``ServerTiming``
+and recording is a no-op; the Prometheus histograms are fed regardless.
+
+Only commits made before the response is built (the ``/play`` endpoints call
+``commit_session`` themselves) make it into the header; the commit that
+``get_db_session`` does on teardown is observed in the histogram alone.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import contextlib
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import time
+
+from prometheus_client import Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = [
+    "ServerTiming",
+    "ServerTimingMiddleware",
+    "current_mode",
+    "record_stage",
+    "set_mode",
+    "timed_stage",
+]
+
+_HEADER = b"server-timing"
+
+# Label used for requests that never reach a game mode (history, stats, ...).
+_NO_MODE = "none"
+
+
+@dataclass
+class ServerTiming:
+    """Stage durations (seconds, insertion ordered) of one request."""
+
+    mode: str = _NO_MODE
+    stages: dict[str, float] = field(default_factory=dict)
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def header(self, total: float) -> str:
+        parts = [f"{name};dur={s * 1000:.2f}" for name, s in self.stages.items()]
+        parts.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(parts)
+
+
+_TIMING: ContextVar[ServerTiming | None] = ContextVar("server_timing", default=None)
+
+
+def set_mode(mode: str) -> None:
+    """Tag the current request with the game *mode* (label for the commit)."""
+
+    timing = _TIMING.get()
+    if timing is not None:
+        timing.mode = mode
+
+
+def current_mode() -> str:
+    timing = _TIMING.get()
+    return timing.mode if timing is not None else _NO_MODE
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Add *seconds* to *stage* of the current request's breakdown, if any."""
+
+    timing = _TIMING.get()
+    if timing is not None:
+        timing.add(stage, seconds)
+
+
+@contextlib.contextmanager
+def timed_stage(histogram: Histogram, stage: str, mode: str) -> Iterator[None]:
+    """Observe the block's duration in *histogram* and the request breakdown.
+
+    The histogram must be labelled by ``stage`` and ``mode``.  Time is recorded
+    even when the block raises, so failing stages still show up.
+    """
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        histogram.labels(stage=stage, mode=mode).observe(elapsed)
+        record_stage(stage, elapsed)
+
+
+class ServerTimingMiddleware:
+    """Collect the request's stage timings into a ``Server-Timing`` header.
+
+    Plain ASGI like ``RequestIdMiddleware``: the header is added to the
+    ``http.response.start`` message, so ``total`` is the time until the
+    response starts and streamed bodies are not buffered.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = ServerTiming()
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                value = timing.header(time.perf_counter() - start).encode("latin-1")
+                message["headers"] = [*message.get("headers", []), (_HEADER, value)]
+            await send(message)
+
+        token = _TIMING.set(timing)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _TIMING.reset(token)
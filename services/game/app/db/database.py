@@ -7,6 +7,8 @@ coupling to SQLAlchemy internals.
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
+import functools
+import time
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -17,12 +19,17 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import get_settings
+from app.core.metrics import DB_COMMIT_SECONDS
+from app.core.timing import current_mode, record_stage
+from app.db.instrumentation import instrument_engine
+from app.db.pool import engine_options, instrument_pool
 
 __all__ = [
     "Base",
-    "async_session_factory",
+    "commit_session",
     "get_db_session",
-    "engine",
+    "get_engine",
+    "get_session_factory",
 ]
 
 
@@ -33,81 +40,89 @@ class Base(DeclarativeBase):
 # ---------------------------------------------------------------------------
 # Engine & session factory
 # ---------------------------------------------------------------------------
-settings = get_settings()
-
-engine: AsyncEngine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,  # disable raw SA echo; we implement structured timing below
-    pool_pre_ping=True,
-)
-
-# expire_on_commit=False   - don't expire objects so we can use them after commit
-# autoflush=False         - let service layer decide when to flush/commit
-async_session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
-)
+# Created on first use rather than at import: importing the app (or a model)
+# must not load the DB driver or open a pool.
+@functools.cache
+def get_engine() -> AsyncEngine:
+    """Return the process-wide engine, creating it on first use."""
+
+    settings = get_settings()
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=False,  # disable raw SA echo; we implement structured timing below
+        **engine_options(settings),  # DB_POOL_* sizing + pool saturation metrics
+    )
+    instrument_pool(engine.sync_engine)
+
+    # Statement metrics + slow-query log (every statement is logged with DEBUG).
+    instrument_engine(
+        engine.sync_engine,
+        slow_query_ms=settings.SQL_SLOW_QUERY_MS,
+        max_fingerprints=settings.SQL_METRICS_MAX_FINGERPRINTS,
+        log_all=settings.DEBUG,
+    )
+    return engine
+
+
+@functools.cache
+def _session_factory() -> async_sessionmaker[AsyncSession]:
+    # expire_on_commit=False   - don't expire objects so we can use them after commit
+    # autoflush=False         - let service layer decide when to flush/commit
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
 
 
 # ---------------------------------------------------------------------------
 # FastAPI dependency
 # ---------------------------------------------------------------------------
+async def commit_session(session: AsyncSession) -> None:
+    """Commit *session*, timing it into ``rpsls_db_commit_seconds``.
+
+    Endpoints that write call this themselves before building the response:
+    ``yield``-dependency teardown runs after the response has been sent, too
+    late for the ``commit`` entry of the Server-Timing header (and for
+    turning a failed commit into an error response).
+    """
+
+    start = time.perf_counter()
+    await session.commit()
+    elapsed = time.perf_counter() - start
+    DB_COMMIT_SECONDS.labels(mode=current_mode()).observe(elapsed)
+    record_stage("commit", elapsed)
+
+
 async def get_db_session() -> AsyncIterator[AsyncSession]:  # noqa: D401 – imperative mood for FastAPI Depends
     """Provide an *AsyncSession* for a single request.
 
     Usage:
         async def endpoint(session: AsyncSession = Depends(get_db_session)):
             ...
-    The session is committed if the request handler exits without exceptions;
-    otherwise it rolls back.
+    A transaction still open when the request handler exits without
+    exceptions is committed (see ``commit_session``); otherwise the session
+    rolls back.
     """
 
-    async with async_session_factory() as session:
+    session_factory = _session_factory()
+    async with session_factory() as session:
         try:
             yield session
-            await session.commit()
+            if session.in_transaction():
+                await commit_session(session)
         except Exception:  # noqa: BLE001 – re-raise after rollback
             await session.rollback()
             raise
 
 
-# ---------------------------------------------------------------------------
-# Optional query timing when DEBUG flag is set
-# ---------------------------------------------------------------------------
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return the session factory for handlers that manage sessions themselves.
+
+    Streaming responses outlive the request-scoped ``get_db_session``
+    dependency, so they open (and close) their own session inside the body
+    iterator instead.
+    """
 
-if settings.DEBUG:
-    import time
-    import structlog
-    from typing import Any
-    from sqlalchemy import event
-
-    _sqllog = structlog.get_logger("sqlalchemy")
-
-    @event.listens_for(engine.sync_engine, "before_cursor_execute")
-    def _before_cursor_execute(
-        _conn: Any,
-        _cursor: Any,
-        _statement: str,
-        _parameters: Any,
-        context: Any,
-        _executemany: bool,
-    ) -> None:
-        context._query_start_time = time.perf_counter()
-
-    @event.listens_for(engine.sync_engine, "after_cursor_execute")
-    def _after_cursor_execute(
-        _conn: Any,
-        _cursor: Any,
-        statement: str,
-        _parameters: Any,
-        context: Any,
-        _executemany: bool,
-    ) -> None:
-        duration_ms = (time.perf_counter() - context._query_start_time) * 1000.0
-        _sqllog.debug(
-            "sql",
-            sql=statement.strip().replace("\n", " ")[:500],
-            duration_ms=round(duration_ms, 3),
-        )
+    return _session_factory()
@@ -0,0 +1,184 @@
+"""Always-on SQL statement metrics and slow-query log.
+
+Two cursor-level engine listeners time every statement.  Statements are
+grouped by *fingerprint* – the SQL with comments, literals and bind
+parameters stripped, whitespace collapsed and repeated ``VALUES`` rows /
+``IN`` lists folded – so ``LIMIT 5`` and ``LIMIT 50`` or a 3-row and a
+500-row multi-``VALUES`` insert count as one statement.  Per fingerprint:
+
+* ``rpsls_db_statement_seconds{fingerprint, operation}`` – latency histogram,
+* ``rpsls_db_statement_rows_total{fingerprint, operation}`` – rows affected
+  (whenever the driver reports a row count),
+* ``rpsls_db_statement_info{fingerprint, statement}`` – maps the short
+  fingerprint id used as a label to the normalized SQL.
+
+Statements slower than ``SQL_SLOW_QUERY_MS`` are logged as ``slow_query``
+with the ``request_id`` bound by ``RequestIdMiddleware`` (``None`` outside
+a request), the fingerprint, duration and rows.  With ``DEBUG`` on every
+statement is logged as before.
+
+SQLAlchemy reuses the same SQL string for a cached compiled statement, so the
+fingerprint (and labelled metric children) are computed once per distinct
+string; the per-statement cost is two ``perf_counter`` calls, a dict lookup
+and two metric updates.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import re
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import structlog
+from structlog.contextvars import get_contextvars
+
+from app.core.metrics import DB_STATEMENT_INFO, DB_STATEMENT_ROWS, DB_STATEMENT_SECONDS
+
+__all__ = ["fingerprint", "instrument_engine"]
+
+# Fingerprint id used once ``max_fingerprints`` distinct statements were seen.
+_OVERFLOW = "other"
+# Distinct SQL strings remembered; beyond that they are fingerprinted per call.
+_MAX_CACHED_STATEMENTS = 4096
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PARAM = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\?")
+_NUMBER = re.compile(r"(?<![\w.$])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_REPEATED_ROWS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+
+
+def fingerprint(statement: str) -> str:
+    """Return *statement* normalized so that only its shape remains."""
+
+    sql = _COMMENT.sub(" ", statement)
+    sql = _STRING.sub("?", sql)
+    sql = _PARAM.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _PLACEHOLDER_LIST.sub("(...)", sql)
+    return _REPEATED_ROWS.sub("(...)", sql)
+
+
+@dataclass(frozen=True, slots=True)
+class _Statement:
+    fingerprint_id: str
+    normalized: str
+    seconds: Any  # labelled Histogram child
+    rows: Any  # labelled Counter child
+
+
+class _Instrumentation:
+    def __init__(
+        self,
+        *,
+        slow_query_ms: float,
+        max_fingerprints: int,
+        log_all: bool,
+    ) -> None:
+        self._slow_query_s = slow_query_ms / 1000.0
+        self._max_fingerprints = max_fingerprints
+        self._log_all = log_all
+        self._fingerprints: set[str] = set()
+        self._statements: dict[str, _Statement] = {}
+        self._log = structlog.get_logger("sqlalchemy")
+
+    def _lookup(self, statement: str) -> _Statement:
+        found = self._statements.get(statement)
+        if found is not None:
+            return found
+
+        normalized = fingerprint(statement)
+        fingerprint_id = hashlib.blake2b(normalized.encode(), digest_size=6).hexdigest()
+        if fingerprint_id not in self._fingerprints:
+            if len(self._fingerprints) < self._max_fingerprints:
+                self._fingerprints.add(fingerprint_id)
+                DB_STATEMENT_INFO.labels(
+                    fingerprint=fingerprint_id, statement=normalized[:1000]
+                ).set(1)
+            else:
+                fingerprint_id = _OVERFLOW
+        operation = normalized.split(" ", 1)[0].upper() or "UNKNOWN"
+        found = _Statement(
+            fingerprint_id,
+            normalized,
+            DB_STATEMENT_SECONDS.labels(
+                fingerprint=fingerprint_id, operation=operation
+            ),
+            DB_STATEMENT_ROWS.labels(fingerprint=fingerprint_id, operation=operation),
+        )
+        if len(self._statements) < _MAX_CACHED_STATEMENTS:
+            self._statements[statement] = found
+        return found
+
+    def before_cursor_execute(
+        self,
+        _conn: Any,
+        _cursor: Any,
+        _statement: str,
+        _parameters: Any,
+        context: Any,
+        _executemany: bool,
+    ) -> None:
+        context._query_start_time = time.perf_counter()
+
+    def after_cursor_execute(
+        self,
+        _conn: Any,
+        cursor: Any,
+        statement: str,
+        _parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        duration = time.perf_counter() - context._query_start_time
+        stmt = self._lookup(statement)
+        stmt.seconds.observe(duration)
+        rowcount = getattr(cursor, "rowcount", -1)
+        if rowcount is not None and rowcount > 0:
+            stmt.rows.inc(rowcount)
+
+        if self._slow_query_s and duration >= self._slow_query_s:
+            self._log.warning(
+                "slow_query",
+                request_id=get_contextvars().get("request_id"),
+                fingerprint=stmt.fingerprint_id,
+                sql=stmt.normalized[:1000],
+                duration_ms=round(duration * 1000.0, 3),
+                rows=rowcount,
+                executemany=executemany,
+            )
+        elif self._log_all:
+            self._log.debug(
+                "sql",
+                sql=statement.strip().replace("\n", " ")[:500],
+                duration_ms=round(duration * 1000.0, 3),
+            )
+
+
+def instrument_engine(
+    engine: Engine,
+    *,
+    slow_query_ms: float,
+    max_fingerprints: int,
+    log_all: bool = False,
+) -> None:
+    """Attach the statement listeners to *engine* (the ``sync_engine`` when async).
+
+    *slow_query_ms* = 0 disables the slow-query log; *log_all* logs every
+    statement at debug level.
+    """
+
+    instrumentation = _Instrumentation(
+        slow_query_ms=slow_query_ms,
+        max_fingerprints=max_fingerprints,
+        log_all=log_all,
+    )
+    event.listen(engine, "before_cursor_execute", instrumentation.before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", instrumentation.after_cursor_execute)
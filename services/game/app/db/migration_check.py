@@ -0,0 +1,117 @@
+"""Cheap "is the schema already at head?" check for the container entrypoint.
+
+``alembic upgrade head`` imports Alembic, SQLAlchemy and the whole model
+layer before finding out there is nothing to do – over a second on every
+container start.  This module answers the common case without any of that:
+the head revision(s) are read from the migration scripts' source and the
+current one(s) from ``alembic_version`` through the bare driver (``sqlite3``
+or ``asyncpg``)::
+
+    python -m app.db.migration_check && echo "at head" || alembic upgrade head
+
+Exit status is 0 only when both sets are known and equal.  Anything else – a
+behind or empty database, an unknown driver, a connection error – exits 1
+so the caller falls back to Alembic, which stays the single source of truth.
+"""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+import contextlib
+from pathlib import Path
+import sqlite3
+import sys
+
+from app.core.config import get_settings
+
+__all__ = ["current_revisions", "head_revisions"]
+
+_VERSIONS = Path(__file__).resolve().parents[2] / "migrations" / "versions"
+_QUERY = "SELECT version_num FROM alembic_version"
+
+
+def _revision_ids(node: ast.expr | None) -> set[str]:
+    value = ast.literal_eval(node) if node is not None else None
+    if value is None:
+        return set()
+    return {value} if isinstance(value, str) else set(value)
+
+
+def head_revisions(versions: Path = _VERSIONS) -> set[str]:
+    """Return the revisions no other migration script builds on."""
+
+    revisions: set[str] = set()
+    parents: set[str] = set()
+    for script in versions.glob("*.py"):
+        target: ast.expr
+        value: ast.expr | None
+        for stmt in ast.parse(script.read_text(encoding="utf-8")).body:
+            if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+                target, value = stmt.targets[0], stmt.value
+            elif isinstance(stmt, ast.AnnAssign):
+                target, value = stmt.target, stmt.value
+            else:
+                continue
+            if not isinstance(target, ast.Name):
+                continue
+            if target.id == "revision":
+                revisions |= _revision_ids(value)
+            elif target.id == "down_revision":
+                parents |= _revision_ids(value)
+    return revisions - parents
+
+
+async def _asyncpg_revisions(dsn: str) -> set[str]:
+    import asyncpg
+
+    conn = await asyncpg.connect(dsn, timeout=5)
+    try:
+        rows = await conn.fetch(_QUERY)
+    except asyncpg.UndefinedTableError:
+        return set()
+    finally:
+        await conn.close()
+    return {row[0] for row in rows}
+
+
+def current_revisions(url: str) -> set[str] | None:
+    """Return the revisions stamped in *url*'s database (``None``: can't tell)."""
+
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return None
+    dialect = scheme.partition("+")[0]
+
+    if dialect == "sqlite":
+        path = rest.removeprefix("/").partition("?")[0]
+        if not path or path == ":memory:" or not Path(path).exists():
+            return set()
+        with contextlib.closing(
+            sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        ) as conn:
+            try:
+                return {row[0] for row in conn.execute(_QUERY)}
+            except sqlite3.OperationalError:  # no alembic_version table yet
+                return set()
+
+    if scheme in {"postgresql", "postgresql+asyncpg"}:
+        return asyncio.run(_asyncpg_revisions(f"postgresql://{rest}"))
+
+    return None
+
+
+def main() -> int:
+    heads = head_revisions()
+    try:
+        current = current_revisions(get_settings().DATABASE_URL)
+    except Exception as exc:  # noqa: BLE001 – any doubt: let Alembic decide
+        print(f"migration check failed ({exc!r}); running Alembic", file=sys.stderr)
+        return 1
+    if current is None or not heads or current != heads:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
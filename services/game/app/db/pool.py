@@ -0,0 +1,126 @@
+"""Connection pool sizing and saturation metrics.
+
+``engine_options`` turns the ``DB_POOL_*`` settings into keyword arguments
+for ``create_async_engine``, and ``instrument_pool`` keeps three metrics
+current for the resulting SQLAlchemy async queue pool:
+
+* ``rpsls_db_pool_checked_out`` – connections in use,
+* ``rpsls_db_pool_overflow`` – connections open beyond ``DB_POOL_SIZE``,
+* ``rpsls_db_pool_checkout_wait_seconds`` – time to obtain a connection,
+  including waiting for a free one and connecting a new one.
+
+Only public SQLAlchemy API is used: the gauges follow the pool's
+``connect``/``close``/``detach``/``checkout``/``checkin`` events, and the
+wait is timed around ``Pool.connect()``, which every ``engine.connect()``
+goes through.  A checkout that waits ``DB_POOL_TIMEOUT`` seconds raises
+SQLAlchemy's ``TimeoutError`` and is still observed, so exhaustion shows up
+as waits creeping towards the timeout before requests start failing.
+In-memory SQLite keeps SQLAlchemy's single shared connection (``StaticPool``)
+and only ``DB_POOL_PRE_PING`` applies to it.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    PoolProxiedConnection,
+)
+
+from app.core.config import Settings
+from app.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_WAIT_SECONDS,
+    DB_POOL_OVERFLOW,
+)
+
+__all__ = ["InstrumentedPool", "engine_options", "instrument_pool"]
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` timing how long each checkout takes."""
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_CHECKOUT_WAIT_SECONDS.observe(time.perf_counter() - start)
+
+
+def instrument_pool(engine: Engine) -> None:
+    """Keep the pool usage gauges current from *engine*'s pool events.
+
+    A no-op unless the engine uses ``InstrumentedPool``.  Connections are
+    tracked as the events arrive rather than read back from the pool, since
+    ``checkin`` and ``close`` fire before the pool updates its own counts.
+    The listeners carry over when ``engine.dispose()`` recreates the pool.
+    """
+
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedPool):
+        return
+    pool_size = pool.size()
+    in_use: set[ConnectionPoolEntry] = set()
+    open_connections: set[int] = set()  # id() of each open DBAPI connection
+
+    def report() -> None:
+        DB_POOL_CHECKED_OUT.set(len(in_use))
+        DB_POOL_OVERFLOW.set(max(len(open_connections) - pool_size, 0))
+
+    @event.listens_for(pool, "connect")
+    def _connect(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:  # noqa: ARG001
+        open_connections.add(id(dbapi_connection))
+        report()
+
+    @event.listens_for(pool, "close")
+    def _close(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:  # noqa: ARG001
+        open_connections.discard(id(dbapi_connection))
+        report()
+
+    @event.listens_for(pool, "detach")
+    def _detach(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        open_connections.discard(id(dbapi_connection))
+        in_use.discard(record)
+        report()
+
+    @event.listens_for(pool, "checkout")
+    def _checkout(
+        dbapi_connection: Any,  # noqa: ARG001
+        record: ConnectionPoolEntry,
+        proxy: PoolProxiedConnection,  # noqa: ARG001
+    ) -> None:
+        in_use.add(record)
+        report()
+
+    @event.listens_for(pool, "checkin")
+    def _checkin(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:  # noqa: ARG001
+        in_use.discard(record)  # also sent for checkouts that failed half-way
+        report()
+
+
+def engine_options(settings: Settings) -> dict[str, Any]:
+    """Return pool keyword arguments for ``create_async_engine``."""
+
+    url = make_url(settings.DATABASE_URL)
+    options: dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if url.get_backend_name() == "sqlite" and url.database in {None, "", ":memory:"}:
+        return options
+
+    options |= {
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+        }
+    return options
@@ -7,6 +7,14 @@ The object `app` is imported by the ASGI server (Uvicorn) as
 
 from __future__ import annotations
 
+import gc
+
+# Importing FastAPI, pydantic and SQLAlchemy allocates hundreds of thousands
+# of objects that live as long as the process; collecting while they pile up
+# only re-scans them (~15 % of cold start).  Resumed at the end of the module.
+_gc_was_enabled = gc.isenabled()
+gc.disable()
+
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -14,7 +22,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings
-from app.db.database import engine  # ensure engine is created at import time
+from app.core.http_client import close_http_client, init_http_client
+from app.core.metrics import mark_worker_dead, sweep_dead_workers
+from app.core.responses import default_response_class
+from app.utils.entropy import start_entropy_buffer, stop_entropy_buffer
+from app.utils.game_logic import fetch_random_number
+from app.db.database import get_engine, get_session_factory
+from app.services.move_history import seed_recent_moves
+from app.services.write_behind import start_write_behind, stop_write_behind
 from app.api.v1.endpoints import all_routers
 
 # Initialise logging *before* anything else creates loggers
@@ -25,20 +40,34 @@ init_logging()
 # ---------------------------------------------------------------------------
 # Middleware – request correlation ID
 # ---------------------------------------------------------------------------
-from app.core.middleware import request_id_middleware
+from app.core.middleware import RequestIdMiddleware
+from app.core.timing import ServerTimingMiddleware
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncIterator[None]:
-    """Application lifespan: dispose DB engine on shutdown."""
+    """Application lifespan: own background workers, HTTP client and DB engine."""
 
-    yield  # startup – nothing special for now
-    await engine.dispose()
+    sweep_dead_workers()
+    init_http_client()
+    await seed_recent_moves(get_session_factory())
+    start_entropy_buffer(fetch_random_number)
+    start_write_behind(get_session_factory())
+    yield
+    await stop_write_behind()  # drain queued rounds before the engine goes away
+    await stop_entropy_buffer()
+    await close_http_client()
+    await get_engine().dispose()
+    mark_worker_dead()
 
 
 settings = get_settings()
 
-app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
+app = FastAPI(
+    title=settings.APP_NAME,
+    lifespan=lifespan,
+    default_response_class=default_response_class(settings),
+)
 
 # ---------------------------------------------------------------------------
 # API routers
@@ -59,12 +88,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # lets browser clients page /history
 )
 
 # ---------------------------------------------------------------------------
 # Middleware – request correlation ID
 # ---------------------------------------------------------------------------
-app.middleware("http")(request_id_middleware)
+app.add_middleware(RequestIdMiddleware)
+
+# ---------------------------------------------------------------------------
+# Middleware – per-stage latency breakdown (Server-Timing header)
+# ---------------------------------------------------------------------------
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
 
 # ---------------------------------------------------------------------------
 # Metrics – Prometheus (/metrics)
@@ -73,3 +109,9 @@ from prometheus_fastapi_instrumentator import Instrumentator
 
 # Expose default FastAPI metrics without adding them to the OpenAPI schema.
 Instrumentator().instrument(app).expose(app, include_in_schema=False)
+
+# Move everything allocated so far out of the collector's reach (later full
+# collections skip it) and resume collection.
+gc.freeze()
+if _gc_was_enabled:
+    gc.enable()
@@ -1,7 +1,9 @@
 """SQLAlchemy models."""
 
 from app.models.game import Game
+from app.models.stats import GameStat
 
 __all__ = [
     "Game",
+    "GameStat",
 ]
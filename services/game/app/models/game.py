@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 import uuid
 
-from sqlalchemy import DateTime, Enum
+from sqlalchemy import DateTime, Enum, Index, String, desc
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -17,6 +17,21 @@ class Game(Base):
     """Persisted representation of a single Rock-Paper-Scissors-Lizard-Spock game."""
 
     __tablename__ = "game"
+    __table_args__ = (
+        # Serves ORDER BY created_at DESC (recent history, smart AI) and the
+        # (created_at, id) keyset seeks behind /history pagination.
+        Index("ix_game_created_at_id", "created_at", "id"),
+        # Per-player history: newest-first seeks for one player (smart AI,
+        # filtered /history pages).  On PostgreSQL the gesture is INCLUDEd so
+        # loading a player's recent moves is an index-only scan.
+        Index(
+            "ix_game_player_id_created_at",
+            "player_id",
+            desc("created_at"),
+            desc("id"),
+            postgresql_include=["player_choice"],
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -43,6 +58,11 @@ class Game(Base):
         nullable=False,
         comment="Outcome of the game",
     )
+    player_id: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="Opaque client-supplied player identifier (NULL = anonymous)",
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
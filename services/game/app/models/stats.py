@@ -0,0 +1,38 @@
+"""SQLAlchemy model for incrementally maintained scoreboard aggregates."""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.database import Base
+
+
+class GameStat(Base):
+    """One running counter, e.g. ``("outcome", "player") -> 42``.
+
+    Rows are bumped in the same transaction that stores the rounds, so reads
+    never have to scan the *game* table.
+    """
+
+    __tablename__ = "game_stats"
+
+    dimension: Mapped[str] = mapped_column(
+        String(16),
+        primary_key=True,
+        comment="Aggregate family: outcome | mode | gesture",
+    )
+    bucket: Mapped[str] = mapped_column(
+        String(16),
+        primary_key=True,
+        comment="Value within the dimension, e.g. 'tie', 'smart', 'rock'",
+    )
+    total: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment="Number of rounds counted in this bucket",
+    )
+
+    def __repr__(self) -> str:  # noqa: D401
+        return f"<GameStat {self.dimension}:{self.bucket}={self.total}>"
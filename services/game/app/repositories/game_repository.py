@@ -1,19 +1,53 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
 import uuid
 
-from sqlalchemy import select, text
+from sqlalchemy import delete, event, insert, select, text, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.models.game import Game
-from app.utils.enums import Choice, GameResult
+from app.models.stats import GameStat
+from app.utils.enums import Choice, GameResult, Mode
+
+# ``Session.info`` key holding the callbacks registered with ``on_rollback``.
+_ROLLBACK_HOOKS = "rollback_hooks"
+
+
+def _run_rollback_hooks(session: Session) -> None:
+    hooks = session.info[_ROLLBACK_HOOKS]
+    pending, hooks[:] = hooks[:], []
+    for callback in pending:
+        callback()
+
+
+def _drop_rollback_hooks(session: Session) -> None:
+    session.info[_ROLLBACK_HOOKS].clear()
 
 
 class GameRepository:  # noqa: D101 – simple data-access layer
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    def on_rollback(self, callback: Callable[[], None]) -> None:
+        """Call *callback* if the session's current transaction is rolled back.
+
+        Pending callbacks are discarded on commit, so each fires at most once.
+        """
+
+        sync_session = self._session.sync_session
+        hooks = sync_session.info.get(_ROLLBACK_HOOKS)
+        if hooks is None:
+            hooks = sync_session.info[_ROLLBACK_HOOKS] = []
+            event.listen(sync_session, "after_rollback", _run_rollback_hooks)
+            event.listen(sync_session, "after_commit", _drop_rollback_hooks)
+        hooks.append(callback)
+
     # ---------------------------------------------------------------------
     # CRUD helpers
     # ---------------------------------------------------------------------
@@ -22,6 +56,7 @@ class GameRepository:  # noqa: D101 – simple data-access layer
         player_choice: Choice,
         computer_choice: Choice,
         winner: GameResult,
+        player_id: str | None = None,
     ) -> Game:
         """Persist a new *Game* instance and return it (uncommitted)."""
 
@@ -29,22 +64,196 @@ class GameRepository:  # noqa: D101 – simple data-access layer
             player_choice=player_choice,
             computer_choice=computer_choice,
             winner=winner,
+            player_id=player_id,
         )
         self._session.add(game)
         await self._session.flush()
         return game
 
+    async def add_many(
+        self,
+        rounds: Sequence[tuple[Choice, Choice, GameResult]],
+        player_ids: Sequence[str | None] | None = None,
+    ) -> list[Game]:
+        """Persist many rounds with one multi-row INSERT (uncommitted).
+
+        *rounds* holds ``(player_choice, computer_choice, winner)`` tuples in
+        play order; *player_ids*, when given, holds one entry per round.  Ids
+        and timestamps are assigned client-side; timestamps advance by one
+        microsecond per row so the batch keeps its order in ``list_recent``.
+        The returned entities are transient (not attached to the session).
+        """
+
+        if player_ids is None:
+            player_ids = [None] * len(rounds)
+
+        now = datetime.now(UTC)
+        games = [
+            Game(
+                id=uuid.uuid4(),
+                player_choice=player_choice,
+                computer_choice=computer_choice,
+                winner=winner,
+                player_id=player_id,
+                created_at=now + timedelta(microseconds=i),
+            )
+            for i, ((player_choice, computer_choice, winner), player_id) in enumerate(
+                zip(rounds, player_ids, strict=True)
+            )
+        ]
+        await self.add_all(games)
+        return games
+
+    async def add_all(self, games: Sequence[Game]) -> None:
+        """Insert pre-built *Game* entities (id and timestamp set) in one statement."""
+
+        if not games:
+            return
+
+        await self._session.execute(
+            insert(Game).values(
+                [
+                    {
+                        "id": g.id,
+                        "player_choice": g.player_choice,
+                        "computer_choice": g.computer_choice,
+                        "winner": g.winner,
+                        "player_id": g.player_id,
+                        "created_at": g.created_at,
+                    }
+                    for g in games
+                ]
+            )
+        )
+
     async def get(self, game_id: uuid.UUID) -> Game | None:
         stmt = select(Game).where(Game.id == game_id)
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list_recent(self, limit: int = 50) -> Sequence[Game]:
-        stmt = select(Game).order_by(Game.created_at.desc()).limit(limit)
+    async def list_recent(
+        self, limit: int = 50, player_id: str | None = None
+    ) -> Sequence[Game]:
+        return await self.list_page(limit, player_id=player_id)
+
+    async def list_page(
+        self,
+        limit: int,
+        before: tuple[datetime, uuid.UUID] | None = None,
+        player_id: str | None = None,
+    ) -> Sequence[Game]:
+        """Return up to *limit* games, newest first, strictly older than *before*.
+
+        *before* is the ``(created_at, id)`` key of the last row of the
+        previous page.  The row-value comparison lets the database seek
+        straight into the ``(created_at, id)`` index – or, when *player_id*
+        restricts the page to one player, the ``(player_id, created_at, id)``
+        index – so deep pages cost the same as the first one.
+        """
+
+        stmt = (
+            select(Game).order_by(Game.created_at.desc(), Game.id.desc()).limit(limit)
+        )
+        if player_id is not None:
+            stmt = stmt.where(Game.player_id == player_id)
+        if before is not None:
+            stmt = stmt.where(tuple_(Game.created_at, Game.id) < tuple_(*before))
         result = await self._session.execute(stmt)
         return result.scalars().all()
 
+    async def recent_moves(
+        self, limit: int, player_id: str | None = None
+    ) -> list[Choice]:
+        """Return the last *limit* gestures of *player_id*, newest first.
+
+        Unlike ``list_recent`` a ``None`` *player_id* selects the anonymous
+        rounds (``player_id IS NULL``), not every round.  Only the gesture
+        column is read, which the per-player index covers.
+        """
+
+        stmt = (
+            select(Game.player_choice)
+            .where(
+                Game.player_id.is_(None)
+                if player_id is None
+                else Game.player_id == player_id
+            )
+            .order_by(Game.created_at.desc(), Game.id.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars())
+
+    async def stream_rows(self, chunk_size: int = 1000) -> AsyncIterator[Sequence[Any]]:
+        """Yield every game, newest first, in chunks of *chunk_size* rows.
+
+        Uses a server-side cursor (``yield_per``) and plain column rows rather
+        than ORM entities, so memory stays flat however large the table is.
+        Each row exposes ``id``, ``created_at``, ``player_choice``,
+        ``computer_choice``, ``winner`` and ``player_id`` attributes.
+        """
+
+        stmt = (
+            select(
+                Game.id,
+                Game.created_at,
+                Game.player_choice,
+                Game.computer_choice,
+                Game.winner,
+                Game.player_id,
+            )
+            .order_by(Game.created_at.desc(), Game.id.desc())
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self._session.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
+
     async def clear(self) -> None:
-        """Delete all game records (scoreboard reset)."""
+        """Delete all game records and aggregates (scoreboard reset)."""
 
         await self._session.execute(text("DELETE FROM game"))
+        await self._session.execute(delete(GameStat))
+
+    # ---------------------------------------------------------------------
+    # Scoreboard aggregates
+    # ---------------------------------------------------------------------
+    async def increment_stats(
+        self, rounds: Iterable[tuple[Mode, Choice, GameResult]]
+    ) -> None:
+        """Bump the outcome / mode / gesture counters for *rounds* (uncommitted).
+
+        All buckets are updated with a single upsert; rows are written in a
+        fixed order so concurrent transactions cannot deadlock on them.
+        """
+
+        counts: Counter[tuple[str, str]] = Counter()
+        for mode, player_choice, winner in rounds:
+            counts["outcome", winner.value] += 1
+            counts["mode", mode.value] += 1
+            counts["gesture", player_choice.name.lower()] += 1
+        if not counts:
+            return
+
+        dialect = self._session.get_bind().dialect.name
+        upsert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = upsert(GameStat).values(
+            [
+                {"dimension": dimension, "bucket": bucket, "total": total}
+                for (dimension, bucket), total in sorted(counts.items())
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GameStat.dimension, GameStat.bucket],
+            set_={"total": GameStat.total + stmt.excluded.total},
+        )
+        await self._session.execute(stmt)
+
+    async def get_stats(self) -> dict[str, dict[str, int]]:
+        """Return ``{dimension: {bucket: total}}`` straight from the aggregates."""
+
+        result = await self._session.execute(select(GameStat))
+        stats: dict[str, dict[str, int]] = {}
+        for stat in result.scalars():
+            stats.setdefault(stat.dimension, {})[stat.bucket] = stat.total
+        return stats
@@ -8,13 +8,16 @@ from typing import Any
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
+from app.core.config import get_settings
 from app.utils.enums import Choice, GameResult, Mode
 
 __all__ = [
     "ChoiceRead",
     "PlayRequest",
+    "PlayBatchRequest",
     "PlayResponse",
     "GameRead",
+    "StatsRead",
 ]
 
 
@@ -60,7 +63,13 @@ class PlayRequest(BaseModel):
     player: int = Field(..., ge=1, le=5, description="Choice identifier 1-5")
     mode: Mode = Field(
         default=Mode.RANDOM,
-        description="AI strategy to use (random | smart).",
+        description="AI strategy to use (random | smart | markov).",
+    )
+    player_id: str | None = Field(
+        default=None,
+        min_length=1,
+        max_length=64,
+        description="Optional player identifier; adaptive modes learn per player.",
     )
 
     @field_validator("player")
@@ -76,6 +85,20 @@ class PlayRequest(BaseModel):
         return Choice(self.player)
 
 
+class PlayBatchRequest(BaseModel):
+    """Payload for POST /play/batch - rounds are played in list order."""
+
+    rounds: list[PlayRequest] = Field(..., min_length=1)
+
+    @field_validator("rounds")
+    @classmethod
+    def _validate_size(cls, v: list[PlayRequest]) -> list[PlayRequest]:
+        max_rounds = get_settings().PLAY_BATCH_MAX_ROUNDS
+        if len(v) > max_rounds:
+            raise ValueError(f"at most {max_rounds} rounds per batch")
+        return v
+
+
 class PlayResponse(BaseModel):
     """Response returned by POST /play."""
 
@@ -102,6 +125,7 @@ class GameRead(PlayResponse):
 
     id: uuid.UUID
     timestamp: datetime
+    player_id: str | None = None
 
     @classmethod
     def from_model(cls, game: Any) -> GameRead:
@@ -115,6 +139,51 @@ class GameRead(PlayResponse):
             results=_PLAYER_OUTCOME_MAP[game.winner],
             player=game.player_choice.value,
             computer=game.computer_choice.value,
+            player_id=game.player_id,
+        )
+
+    @classmethod
+    def from_row(cls, row: Any) -> GameRead:
+        """Build from any object exposing *Game*'s columns (e.g. a Core row).
+
+        Skips validation - values come straight from the database - which
+        keeps bulk exports cheap.
+        """
+
+        return cls.model_construct(
+            results=_PLAYER_OUTCOME_MAP[row.winner],
+            player=row.player_choice.value,
+            computer=row.computer_choice.value,
+            id=row.id,
+            timestamp=row.created_at,
+            player_id=row.player_id,
         )
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class StatsRead(BaseModel):
+    """Scoreboard totals served by GET /stats."""
+
+    total: int = Field(description="Rounds played")
+    outcomes: dict[str, int] = Field(description="win | lose | tie (player view)")
+    modes: dict[str, int] = Field(description="Rounds per AI strategy")
+    gestures: dict[str, int] = Field(description="Rounds per player gesture")
+
+    @classmethod
+    def from_aggregates(cls, stats: dict[str, dict[str, int]]) -> StatsRead:
+        """Build from ``GameRepository.get_stats`` output, zero-filling buckets."""
+
+        raw_outcomes = stats.get("outcome", {})
+        outcomes = {
+            label: raw_outcomes.get(result.value, 0)
+            for result, label in _PLAYER_OUTCOME_MAP.items()
+        }
+        modes = {m.value: 0 for m in Mode} | stats.get("mode", {})
+        gestures = {c.name.lower(): 0 for c in Choice} | stats.get("gesture", {})
+        return cls(
+            total=sum(outcomes.values()),
+            outcomes=outcomes,
+            modes=modes,
+            gestures=gestures,
+        )
@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+import uuid
+
 from app.models.game import Game
 from app.repositories.game_repository import GameRepository
-from app.utils.enums import Choice, Mode
-from app.utils.game_logic import decide_winner, random_choice
+from app.core.config import get_settings
+from app.services.move_history import RecentMoves, get_recent_moves_cache
+from app.services.write_behind import get_write_behind_queue
+from app.utils.enums import Choice, GameResult, Mode
+from app.utils.markov import MarkovPredictor, get_markov_sessions
+from app.utils.game_logic import decide_winner, decide_winners, random_choice
+from app.utils.rules import OUTCOME_RESULTS
 from app.utils import ai as ai_utils
-from app.core.metrics import AI_MODE_TOTAL, AI_OUTCOME_TOTAL
+from app.core.metrics import AI_MODE_TOTAL, AI_OUTCOME_TOTAL, PLAY_STAGE_SECONDS
+from app.core.timing import set_mode, timed_stage
 import structlog
 
 
@@ -15,36 +27,225 @@ class GameService:  # noqa: D101 – business-logic façade
     def __init__(self, repository: GameRepository) -> None:
         self._repo = repository
 
-    async def play(self, player_choice: Choice, mode: Mode = Mode.RANDOM) -> Game:  # noqa: D401 – imperative mood
-        """Execute a game round.
+    async def play(  # noqa: D401 – imperative mood
+        self,
+        player_choice: Choice,
+        mode: Mode = Mode.RANDOM,
+        player_id: str | None = None,
+    ) -> Game:
+        """Execute a game round for *player_id* (``None`` = anonymous).
 
-        1. Pick a random choice for the computer.
+        1. Pick the computer's move with the strategy for *mode*.
         2. Decide the winner.
-        3. Persist and return the *Game* entity.
+        3. Persist and return the *Game* entity - either directly through the
+           repository or, with write-behind enabled, via the group-commit queue.
+           Scoreboard aggregates are bumped in the same transaction.
+
+        Stages (``entropy`` or ``history`` + ``ai``, then ``persist``) are timed
+        into ``rpsls_play_stage_seconds`` and the request's Server-Timing header.
         """
 
         log = structlog.get_logger(__name__)
+        mode_label = mode.value
+        set_mode(mode_label)
 
-        if mode is Mode.SMART:
-            # Fetch recent history to feed the adaptive AI (bounded for perf)
-            recent_games = await self._repo.list_recent(limit=50)
-            history = [g.player_choice for g in recent_games]
-            computer_choice = ai_utils.smart_choice(history)
+        if mode is Mode.RANDOM:
+            with timed_stage(PLAY_STAGE_SECONDS, "entropy", mode_label):
+                computer_choice = await random_choice()
         else:
-            computer_choice = await random_choice()
+            with timed_stage(PLAY_STAGE_SECONDS, "history", mode_label):
+                state = await self._adaptive_state(mode, player_id)
+            with timed_stage(PLAY_STAGE_SECONDS, "ai", mode_label):
+                computer_choice = self._choose(state)
         winner = decide_winner(player_choice, computer_choice)
 
         # Metrics
-        AI_MODE_TOTAL.labels(mode=mode.value).inc()
-        AI_OUTCOME_TOTAL.labels(mode=mode.value, outcome=winner.value).inc()
+        AI_MODE_TOTAL.labels(mode=mode_label).inc()
+        AI_OUTCOME_TOTAL.labels(mode=mode_label, outcome=winner.value).inc()
 
         # Structured log
         log.info(
             "round_played",
-            mode=mode.value,
+            mode=mode_label,
             player_choice=player_choice.name.lower(),
             computer_choice=computer_choice.name.lower(),
             outcome=winner.value,
         )
 
-        return await self._repo.add(player_choice, computer_choice, winner)
+        with timed_stage(PLAY_STAGE_SECONDS, "persist", mode_label):
+            game = await self._persist(
+                mode, player_choice, computer_choice, winner, player_id
+            )
+        self._remember(player_id, player_choice)
+        return game
+
+    async def _persist(
+        self,
+        mode: Mode,
+        player_choice: Choice,
+        computer_choice: Choice,
+        winner: GameResult,
+        player_id: str | None,
+    ) -> Game:
+        """Store one finished round via the write-behind queue or the repository."""
+
+        queue = get_write_behind_queue()
+        if queue is not None:
+            game = Game(
+                id=uuid.uuid4(),
+                player_choice=player_choice,
+                computer_choice=computer_choice,
+                winner=winner,
+                player_id=player_id,
+                created_at=datetime.now(UTC),
+            )
+            await queue.submit(game, mode)
+            return game
+
+        game = await self._repo.add(player_choice, computer_choice, winner, player_id)
+        await self._repo.increment_stats([(mode, player_choice, winner)])
+        # The move is remembered once persisted; a failed commit must undo that.
+        self._repo.on_rollback(lambda: self._forget([player_id]))
+        return game
+
+    async def play_batch(  # noqa: D401 – imperative mood
+        self, rounds: Sequence[tuple[Choice, Mode, str | None]]
+    ) -> list[Game]:
+        """Execute many rounds at once and persist them with a single INSERT.
+
+        *rounds* holds ``(player_choice, mode, player_id)`` tuples in play
+        order.  All random-mode computer moves are resolved concurrently
+        up-front.  Smart- and Markov-mode rounds see their player's state
+        *including* every earlier move of the same batch, exactly as if the
+        rounds had been played one by one.
+        """
+
+        log = structlog.get_logger(__name__)
+
+        # Load adaptive players' state first so earlier rounds of the batch –
+        # not persisted yet – are recorded into it.  Should the batch not be
+        # committed after all, that state is dropped and reloaded next time.
+        adaptive = dict.fromkeys((m, p) for _, m, p in rounds if m is not Mode.RANDOM)
+        for adaptive_mode, adaptive_player in adaptive:
+            await self._adaptive_state(adaptive_mode, adaptive_player)
+        players = {player_id for *_, player_id in rounds}
+        self._repo.on_rollback(lambda: self._forget(players))
+
+        random_moves = iter(
+            await asyncio.gather(
+                *(random_choice() for _, mode, _ in rounds if mode is Mode.RANDOM)
+            )
+        )
+
+        computer_choices: list[Choice] = []
+        for player_choice, mode, player_id in rounds:
+            if mode is Mode.RANDOM:
+                computer_choice = next(random_moves)
+            else:
+                computer_choice = await self._adaptive_choice(mode, player_id)
+            computer_choices.append(computer_choice)
+            self._remember(player_id, player_choice)
+
+        # Score the whole batch in one vectorized lookup.
+        player_choices = [player_choice for player_choice, _, _ in rounds]
+        codes = decide_winners(player_choices, computer_choices)
+        results: list[tuple[Choice, Choice, GameResult]] = [
+            (player_choice, computer_choice, OUTCOME_RESULTS[code])
+            for player_choice, computer_choice, code in zip(
+                player_choices, computer_choices, codes.tolist(), strict=True
+            )
+        ]
+
+        # Metrics – one increment per label set rather than per round
+        modes = Counter(mode.value for _, mode, _ in rounds)
+        for mode_label, count in modes.items():
+            AI_MODE_TOTAL.labels(mode=mode_label).inc(count)
+        per_outcome = Counter(
+            (mode.value, winner.value)
+            for (_, mode, _), (*_, winner) in zip(rounds, results, strict=True)
+        )
+        for (mode_label, outcome), count in per_outcome.items():
+            AI_OUTCOME_TOTAL.labels(mode=mode_label, outcome=outcome).inc(count)
+
+        log.info(
+            "batch_played",
+            rounds=len(results),
+            modes=dict(modes),
+            outcomes=dict(Counter(winner.value for *_, winner in results)),
+        )
+
+        games = await self._repo.add_many(
+            results, player_ids=[player_id for *_, player_id in rounds]
+        )
+        await self._repo.increment_stats(
+            (mode, player_choice, winner)
+            for (player_choice, _, winner), (_, mode, _) in zip(
+                results, rounds, strict=True
+            )
+        )
+        return games
+
+    async def clear_history(self) -> None:
+        """Delete every game and aggregate and forget all in-memory AI state.
+
+        Rounds still in the write-behind queue are committed first; otherwise
+        they would be inserted – and counted – after the delete.
+        """
+
+        queue = get_write_behind_queue()
+        if queue is not None:
+            await queue.drain()
+        await self._repo.clear()
+        get_recent_moves_cache().clear()
+        get_markov_sessions().clear()
+
+    # ------------------------------------------------------------------
+    # Adaptive strategies
+    # ------------------------------------------------------------------
+    async def _adaptive_choice(self, mode: Mode, player_id: str | None) -> Choice:
+        """Return the computer move of a learning strategy (smart / markov)."""
+
+        return self._choose(await self._adaptive_state(mode, player_id))
+
+    @staticmethod
+    def _choose(state: RecentMoves | MarkovPredictor) -> Choice:
+        if isinstance(state, MarkovPredictor):
+            return state.choose()
+        return ai_utils.smart_choice(state.snapshot(), window=state.window)
+
+    async def _adaptive_state(
+        self, mode: Mode, player_id: str | None
+    ) -> RecentMoves | MarkovPredictor:
+        """Return the player's in-memory state for *mode*, loading it on a miss."""
+
+        if mode is Mode.MARKOV:
+            sessions = get_markov_sessions()
+            predictor = sessions.get(player_id)
+            if predictor is None:
+                limit = get_settings().MARKOV_WARMUP_ROUNDS
+                moves = await self._repo.recent_moves(limit, player_id) if limit else []
+                predictor = sessions.load(player_id, reversed(moves))
+            return predictor
+
+        cache = get_recent_moves_cache()
+        recent_moves = cache.get(player_id)
+        if recent_moves is None:
+            moves = await self._repo.recent_moves(cache.window, player_id)
+            recent_moves = cache.load(player_id, moves)
+        return recent_moves
+
+    @staticmethod
+    def _remember(player_id: str | None, player_choice: Choice) -> None:
+        """Feed the player's move to every strategy state that is loaded."""
+
+        get_recent_moves_cache().record(player_id, player_choice)
+        get_markov_sessions().record(player_id, player_choice)
+
+    @staticmethod
+    def _forget(player_ids: Iterable[str | None]) -> None:
+        """Drop the in-memory strategy state of *player_ids*."""
+
+        cache, sessions = get_recent_moves_cache(), get_markov_sessions()
+        for player_id in player_ids:
+            cache.discard(player_id)
+            sessions.discard(player_id)
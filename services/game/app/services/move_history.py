@@ -0,0 +1,157 @@
+"""Process-local ring buffers of each player's most recent moves.
+
+Smart mode only needs the last few gestures of the player it is facing.
+Rather than loading ORM entities from the database every round, the service
+keeps them in bounded deques (newest first), one per ``player_id``:
+
+* a window is loaded from the database the first time a player is seen
+  (an index-only seek) – the anonymous window is pre-loaded at startup,
+* every round appends to its player's window,
+* all windows are dropped when the scoreboard is cleared.
+
+At most ``SMART_HISTORY_MAX_PLAYERS`` windows are kept; the least recently
+used one is evicted (and simply reloaded if that player returns).  Each
+worker process has its own cache.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+import structlog
+
+from app.core.config import get_settings
+from app.repositories.game_repository import GameRepository
+from app.utils.enums import Choice
+
+__all__ = [
+    "RecentMoves",
+    "RecentMovesCache",
+    "get_recent_moves_cache",
+    "seed_recent_moves",
+]
+
+
+class RecentMoves:
+    """Fixed-size, newest-first window of player gestures."""
+
+    def __init__(self, window: int) -> None:
+        self._moves: deque[Choice] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._moves)
+
+    @property
+    def window(self) -> int:
+        assert self._moves.maxlen is not None
+        return self._moves.maxlen
+
+    def record(self, choice: Choice) -> None:
+        """Remember *choice* as the newest move (evicting the oldest)."""
+
+        self._moves.appendleft(choice)
+
+    def replace(self, newest_first: Iterable[Choice]) -> None:
+        """Reset the window to *newest_first* (truncated to the window size)."""
+
+        self._moves.clear()
+        self._moves.extend(newest_first)
+
+    def clear(self) -> None:
+        self._moves.clear()
+
+    def snapshot(self) -> list[Choice]:
+        """Return the moves newest first, as ``smart_choice`` expects."""
+
+        return list(self._moves)
+
+
+class RecentMovesCache:
+    """LRU map of ``player_id`` (``None`` = anonymous) to its *RecentMoves*."""
+
+    def __init__(self, window: int, *, max_players: int) -> None:
+        self.window = window
+        self._max_players = max_players
+        self._windows: OrderedDict[str | None, RecentMoves] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def get(self, player_id: str | None) -> RecentMoves | None:
+        """Return the loaded window for *player_id*, or ``None`` on a miss."""
+
+        moves = self._windows.get(player_id)
+        if moves is not None:
+            self._windows.move_to_end(player_id)
+        return moves
+
+    def load(
+        self, player_id: str | None, newest_first: Iterable[Choice]
+    ) -> RecentMoves:
+        """Install the window for *player_id*, evicting the least recently used."""
+
+        moves = RecentMoves(self.window)
+        moves.replace(newest_first)
+        self._windows[player_id] = moves
+        self._windows.move_to_end(player_id)
+        while len(self._windows) > self._max_players:
+            self._windows.popitem(last=False)
+        return moves
+
+    def record(self, player_id: str | None, choice: Choice) -> None:
+        """Append *choice* to the player's window if it is loaded.
+
+        Unloaded players are skipped: their next smart round reads the move
+        back from the database together with the rest of their history.
+        """
+
+        moves = self.get(player_id)
+        if moves is not None:
+            moves.record(choice)
+
+    def discard(self, player_id: str | None) -> None:
+        """Forget *player_id*'s window; the next smart round reloads it."""
+
+        self._windows.pop(player_id, None)
+
+    def clear(self) -> None:
+        self._windows.clear()
+
+
+_CACHE: RecentMovesCache | None = None
+
+
+def get_recent_moves_cache() -> RecentMovesCache:
+    """Return the process-wide cache, sized by the ``SMART_HISTORY_*`` settings."""
+
+    global _CACHE
+
+    if _CACHE is None:
+        settings = get_settings()
+        _CACHE = RecentMovesCache(
+            settings.SMART_HISTORY_WINDOW,
+            max_players=settings.SMART_HISTORY_MAX_PLAYERS,
+        )
+    return _CACHE
+
+
+async def seed_recent_moves(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """Pre-load the anonymous window from the database (once, at startup).
+
+    A failure (e.g. schema not migrated yet) is logged and leaves the window
+    unloaded – the first smart round then loads it on demand.
+    """
+
+    cache = get_recent_moves_cache()
+    try:
+        async with session_factory() as session:
+            moves = await GameRepository(session).recent_moves(cache.window)
+    except Exception as exc:  # noqa: BLE001 – never block startup on the seed
+        structlog.get_logger(__name__).warning(
+            "recent_moves_seed_failed", error=str(exc)
+        )
+        return
+
+    cache.load(None, moves)
@@ -0,0 +1,198 @@
+"""Write-behind persistence for game rounds.
+
+When enabled, `GameService.play` hands the finished *Game* to an in-process
+bounded queue instead of flushing + committing it inside the request.  A
+single background writer drains the queue in batches – every
+``WRITE_BEHIND_BATCH_SIZE`` rows or ``WRITE_BEHIND_FLUSH_MS`` milliseconds,
+whichever comes first – using one multi-row INSERT (plus the aggregate
+upsert) and one COMMIT per batch.
+
+Trade-off: a round is acknowledged before it is durable.  Rows still queued
+when the process is killed hard are lost; a graceful shutdown drains them, and
+so does ``DELETE /history`` before deleting, so queued rounds cannot reappear
+in a cleared scoreboard.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+import structlog
+
+from app.core.config import get_settings
+from app.core.metrics import (
+    WRITE_BEHIND_DROPPED_TOTAL,
+    WRITE_BEHIND_FLUSH_SECONDS,
+    WRITE_BEHIND_QUEUE_DEPTH,
+)
+from app.models.game import Game
+from app.repositories.game_repository import GameRepository
+from app.utils.enums import Mode
+
+__all__ = [
+    "WriteBehindQueue",
+    "get_write_behind_queue",
+    "start_write_behind",
+    "stop_write_behind",
+]
+
+# Attempts per batch before the rows are dropped (and counted).
+_FLUSH_ATTEMPTS = 3
+
+
+class WriteBehindQueue:
+    """Bounded queue of rounds flushed to the database in group commits."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue[tuple[Game, Mode]] = asyncio.Queue(maxsize=max_size)
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    async def submit(self, game: Game, mode: Mode) -> None:
+        """Enqueue *game* (played in *mode*); waits while the queue is full."""
+
+        await self._queue.put((game, mode))
+        WRITE_BEHIND_QUEUE_DEPTH.set(self._queue.qsize())
+
+    # ------------------------------------------------------------------
+    # Writer
+    # ------------------------------------------------------------------
+    async def _next_batch(self) -> list[tuple[Game, Mode]]:
+        """Block for the first row, then collect more until size/time limit."""
+
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval
+        while len(batch) < self._batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def flush(self, batch: list[tuple[Game, Mode]]) -> None:
+        """Insert + commit *batch*, retrying briefly before giving up."""
+
+        log = structlog.get_logger(__name__)
+
+        for attempt in range(1, _FLUSH_ATTEMPTS + 1):
+            start = time.perf_counter()
+            try:
+                async with self._session_factory() as session:
+                    repo = GameRepository(session)
+                    await repo.add_all([game for game, _ in batch])
+                    await repo.increment_stats(
+                        (mode, game.player_choice, game.winner) for game, mode in batch
+                    )
+                    await session.commit()
+            except Exception as exc:  # noqa: BLE001 – retry, then drop & count
+                log.warning(
+                    "write_behind_flush_failed",
+                    attempt=attempt,
+                    rows=len(batch),
+                    error=str(exc),
+                )
+                await asyncio.sleep(0.1 * attempt)
+                continue
+
+            WRITE_BEHIND_FLUSH_SECONDS.observe(time.perf_counter() - start)
+            return
+
+        WRITE_BEHIND_DROPPED_TOTAL.inc(len(batch))
+        log.error("write_behind_rows_dropped", rows=len(batch))
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self.flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+                WRITE_BEHIND_QUEUE_DEPTH.set(self._queue.qsize())
+
+    def start(self) -> None:
+        """Spawn the background writer (idempotent)."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="write-behind")
+
+    async def drain(self) -> None:
+        """Wait until every row queued so far is committed (or dropped)."""
+
+        if self._task is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """Drain every queued row, then cancel the writer."""
+
+        if self._task is None:
+            return
+
+        await self.drain()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance – owned by the application lifespan
+# ---------------------------------------------------------------------------
+_QUEUE: WriteBehindQueue | None = None
+
+
+def get_write_behind_queue() -> WriteBehindQueue | None:
+    """Return the running queue, or ``None`` when write-behind is disabled."""
+
+    return _QUEUE
+
+
+def start_write_behind(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> WriteBehindQueue | None:
+    """Create and start the process-wide queue if enabled in settings."""
+
+    global _QUEUE
+
+    settings = get_settings()
+    if not settings.WRITE_BEHIND_ENABLED:
+        return None
+
+    if _QUEUE is None:
+        _QUEUE = WriteBehindQueue(
+            session_factory,
+            max_size=settings.WRITE_BEHIND_QUEUE_SIZE,
+            batch_size=settings.WRITE_BEHIND_BATCH_SIZE,
+            flush_interval=settings.WRITE_BEHIND_FLUSH_MS / 1000.0,
+        )
+    _QUEUE.start()
+    return _QUEUE
+
+
+async def stop_write_behind() -> None:
+    """Drain and stop the process-wide queue (graceful shutdown)."""
+
+    global _QUEUE
+
+    if _QUEUE is not None:
+        await _QUEUE.stop()
+        _QUEUE = None
@@ -0,0 +1,12 @@
+"""Offline strategy tournament simulator.
+
+Run ``python -m app.sim --help`` (from ``services/game``) for the CLI.
+"""
+
+from app.sim.tournament import PairingResult, TournamentResult, run_tournament
+
+__all__ = [
+    "PairingResult",
+    "TournamentResult",
+    "run_tournament",
+]
@@ -0,0 +1,134 @@
+"""CLI: ``python -m app.sim`` – pit computer strategies against player models."""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+import json
+import math
+
+from app.sim.players import PLAYER_MODELS
+from app.sim.tournament import TournamentResult, run_tournament
+from app.utils.enums import Mode
+
+
+def _csv(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.sim",
+        description="Offline tournament of computer strategies vs synthetic players.",
+    )
+    parser.add_argument(
+        "--modes",
+        type=_csv,
+        default=[m.value for m in Mode],
+        help=f"comma-separated strategies (default: {','.join(Mode)})",
+    )
+    parser.add_argument(
+        "--players",
+        type=_csv,
+        default=list(PLAYER_MODELS),
+        help=f"comma-separated player models (default: {','.join(PLAYER_MODELS)})",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=1_000_000,
+        help="rounds per strategy/player pairing (default: 1,000,000)",
+    )
+    parser.add_argument(
+        "--chunk",
+        type=int,
+        default=50_000,
+        help="rounds per independent player session (default: 50,000)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="worker processes (default: CPUs)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="master RNG seed")
+    parser.add_argument("--json", action="store_true", help="emit JSON instead")
+    args = parser.parse_args(argv)
+
+    try:
+        args.modes = [Mode(m) for m in args.modes]
+    except ValueError as exc:
+        parser.error(str(exc))
+    if unknown := set(args.players) - PLAYER_MODELS.keys():
+        parser.error(f"unknown player model(s): {', '.join(sorted(unknown))}")
+    if args.rounds < 1 or args.chunk < 1:
+        parser.error("--rounds and --chunk must be positive")
+    return args
+
+
+def _pct(value: float) -> str:
+    return "   n/a" if math.isnan(value) else f"{value * 100:6.2f}"
+
+
+def _render(result: TournamentResult) -> str:
+    header = (
+        f"{'strategy':<8} {'player':<8} {'rounds':>11} "
+        f"{'cpu win%':>8} {'±95%':>6} {'tie%':>6} {'edge%':>7} {'±95%':>6}"
+    )
+    lines = [header, "-" * len(header)]
+    for p in result.pairings:
+        lines.append(
+            f"{p.mode.value:<8} {p.player:<8} {p.rounds:>11,} "
+            f"{_pct(p.win_rate):>8} {_pct(p.win_rate_ci)} "
+            f"{_pct(p.ties / p.rounds)} {_pct(p.edge):>7} {_pct(p.edge_ci)}"
+        )
+    lines.append("")
+    lines.append(
+        f"{result.rounds:,} rounds in {result.elapsed:.2f}s on {result.workers} "
+        f"worker(s) – {result.rounds_per_second:,.0f} rounds/s"
+    )
+    return "\n".join(lines)
+
+
+def _to_json(result: TournamentResult) -> str:
+    return json.dumps(
+        {
+            "rounds": result.rounds,
+            "elapsed_s": result.elapsed,
+            "workers": result.workers,
+            "rounds_per_second": result.rounds_per_second,
+            "pairings": [
+                {
+                    "mode": p.mode.value,
+                    "player": p.player,
+                    "rounds": p.rounds,
+                    "sessions": p.sessions,
+                    "computer_wins": p.computer_wins,
+                    "player_wins": p.player_wins,
+                    "ties": p.ties,
+                    "win_rate": p.win_rate,
+                    "win_rate_ci95": None
+                    if math.isnan(p.win_rate_ci)
+                    else p.win_rate_ci,
+                    "edge": p.edge,
+                    "edge_ci95": None if math.isnan(p.edge_ci) else p.edge_ci,
+                }
+                for p in result.pairings
+            ],
+        },
+        indent=2,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = _parse_args(argv)
+    result = run_tournament(
+        args.modes,
+        args.players,
+        rounds=args.rounds,
+        chunk=args.chunk,
+        workers=args.workers,
+        seed=args.seed,
+    )
+    print(_to_json(result) if args.json else _render(result))
+
+
+if __name__ == "__main__":
+    main()
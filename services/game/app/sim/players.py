@@ -0,0 +1,102 @@
+"""Synthetic player models for the strategy tournament.
+
+Each model is a small state machine: ``move(last)`` receives the previous
+round ``(player, computer, result)`` – ``None`` on the first round of a
+session – and returns the next gesture.  All randomness comes from the
+``random.Random`` passed in, so sessions are reproducible from a seed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import random
+from typing import Protocol
+
+from app.utils.enums import Choice, GameResult
+from app.utils.rules import COUNTERS
+
+__all__ = [
+    "PLAYER_MODELS",
+    "PlayerModel",
+    "Round",
+]
+
+Round = tuple[Choice, Choice, GameResult]
+
+_GESTURES: tuple[Choice, ...] = tuple(Choice)
+
+
+class PlayerModel(Protocol):
+    def move(self, last: Round | None) -> Choice: ...
+
+
+class UniformPlayer:
+    """Plays every gesture with equal probability (the unbeatable baseline)."""
+
+    def __init__(self, rng: random.Random) -> None:
+        self._rng = rng
+
+    def move(self, last: Round | None) -> Choice:  # noqa: ARG002 – memoryless
+        return self._rng.choice(_GESTURES)
+
+
+class BiasedPlayer:
+    """Favours one (randomly picked) gesture half of the time."""
+
+    def __init__(self, rng: random.Random, bias: float = 0.5) -> None:
+        self._rng = rng
+        self._bias = bias
+        self._favourite = rng.choice(_GESTURES)
+
+    def move(self, last: Round | None) -> Choice:  # noqa: ARG002 – memoryless
+        if self._rng.random() < self._bias:
+            return self._favourite
+        return self._rng.choice(_GESTURES)
+
+
+class CyclicPlayer:
+    """Walks rock → paper → scissors → lizard → spock → rock … from a random start."""
+
+    def __init__(self, rng: random.Random) -> None:
+        self._next = rng.randrange(len(_GESTURES))
+
+    def move(self, last: Round | None) -> Choice:  # noqa: ARG002 – fixed cycle
+        choice = _GESTURES[self._next]
+        self._next = (self._next + 1) % len(_GESTURES)
+        return choice
+
+
+class WinStayLoseShiftPlayer:
+    """Repeats a winning gesture; otherwise counters the computer's last move."""
+
+    def __init__(self, rng: random.Random) -> None:
+        self._rng = rng
+
+    def move(self, last: Round | None) -> Choice:
+        if last is None:
+            return self._rng.choice(_GESTURES)
+        player, computer, result = last
+        if result is GameResult.PLAYER:
+            return player
+        return self._rng.choice(COUNTERS[computer])
+
+
+class MirrorPlayer:
+    """Copies whatever the computer played last."""
+
+    def __init__(self, rng: random.Random) -> None:
+        self._rng = rng
+
+    def move(self, last: Round | None) -> Choice:
+        if last is None:
+            return self._rng.choice(_GESTURES)
+        return last[1]
+
+
+PLAYER_MODELS: dict[str, Callable[[random.Random], PlayerModel]] = {
+    "uniform": UniformPlayer,
+    "biased": BiasedPlayer,
+    "cyclic": CyclicPlayer,
+    "wsls": WinStayLoseShiftPlayer,
+    "mirror": MirrorPlayer,
+}
@@ -0,0 +1,256 @@
+"""Strategy-vs-player tournament engine.
+
+Every ``(Mode, player model)`` pairing is split into independent sessions of
+``chunk`` rounds.  Sessions run on a process pool and drive the *production*
+code: the computer move for a ``Mode`` is picked exactly like
+``GameService`` does (``RecentMoves`` window + ``ai.smart_choice``, a
+``MarkovPredictor``, or the random-number → gesture mapping of
+``random_choice``) and every round is scored by ``decide_winner``.
+
+Rounds inside a session are correlated (the smart AI learns from them), so
+the confidence intervals use the *batch-means* method: each session is one
+sample, and the interval is ``mean ± 1.96·s/√k`` over the *k* sessions.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import math
+import os
+import random
+import time
+
+from app.core.config import get_settings
+from app.services.move_history import RecentMoves
+from app.sim.players import PLAYER_MODELS, Round
+from app.utils import ai as ai_utils
+from app.utils.enums import Choice, GameResult, Mode
+from app.utils.game_logic import choice_from_number, decide_winner
+from app.utils.markov import MarkovPredictor
+
+__all__ = [
+    "PairingResult",
+    "TournamentResult",
+    "computer_move",
+    "play_session",
+    "run_tournament",
+]
+
+# Two-sided 95 % normal quantile.
+_Z95 = 1.96
+
+
+def computer_move(
+    mode: Mode,
+    recent: RecentMoves,
+    predictor: MarkovPredictor,
+    rng: random.Random | None = None,
+) -> Choice:
+    """Pick the computer's gesture the way ``GameService`` does, minus the I/O.
+
+    Random mode skips the randomness API and uses the same local-PRNG
+    fallback (a 1-100 number mapped onto a gesture).  Every random draw comes
+    from *rng* (default: the module-level PRNG).
+    """
+
+    if mode is Mode.SMART:
+        return ai_utils.smart_choice(recent.snapshot(), window=recent.window, rng=rng)
+    if mode is Mode.MARKOV:
+        return predictor.choose(rng)
+    if mode is Mode.RANDOM:
+        randint = random.randint if rng is None else rng.randint
+        return choice_from_number(randint(1, 100))
+    raise ValueError(f"no simulator strategy for mode {mode!r}")
+
+
+@dataclass(frozen=True, slots=True)
+class _Session:
+    mode: Mode
+    player: str
+    rounds: int
+    seed: int
+
+
+@dataclass(frozen=True, slots=True)
+class _SessionTally:
+    mode: Mode
+    player: str
+    computer_wins: int
+    player_wins: int
+    ties: int
+
+
+def play_session(
+    mode: Mode,
+    player: str,
+    rounds: int,
+    seed: int,
+    window: int,
+    markov_order: int = 2,
+) -> dict[GameResult, int]:
+    """Play *rounds* consecutive rounds of one player session; return the tally."""
+
+    # The computer draws from its own seeded PRNG, never the module-level one.
+    rng = random.Random(seed)
+    model = PLAYER_MODELS[player](random.Random(seed + 1))
+    recent = RecentMoves(window)
+    predictor = MarkovPredictor(markov_order)
+    tally = dict.fromkeys(GameResult, 0)
+
+    last: Round | None = None
+    for _ in range(rounds):
+        player_choice = model.move(last)
+        computer_choice = computer_move(mode, recent, predictor, rng)
+        result = decide_winner(player_choice, computer_choice)
+        recent.record(player_choice)
+        predictor.observe(player_choice)
+        tally[result] += 1
+        last = (player_choice, computer_choice, result)
+    return tally
+
+
+def _run_session(session: _Session) -> _SessionTally:
+    settings = get_settings()
+    tally = play_session(
+        session.mode,
+        session.player,
+        session.rounds,
+        session.seed,
+        settings.SMART_HISTORY_WINDOW,
+        settings.MARKOV_ORDER,
+    )
+    return _SessionTally(
+        mode=session.mode,
+        player=session.player,
+        computer_wins=tally[GameResult.COMPUTER],
+        player_wins=tally[GameResult.PLAYER],
+        ties=tally[GameResult.TIE],
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class PairingResult:
+    """Aggregated outcome of one strategy against one player model."""
+
+    mode: Mode
+    player: str
+    rounds: int
+    sessions: int
+    computer_wins: int
+    player_wins: int
+    ties: int
+    win_rate_ci: float
+    edge_ci: float
+
+    @property
+    def win_rate(self) -> float:
+        """Share of rounds the computer won."""
+
+        return self.computer_wins / self.rounds
+
+    @property
+    def edge(self) -> float:
+        """Computer wins minus player wins, per round (0 = break-even)."""
+
+        return (self.computer_wins - self.player_wins) / self.rounds
+
+
+@dataclass(frozen=True, slots=True)
+class TournamentResult:
+    pairings: list[PairingResult]
+    elapsed: float
+    workers: int
+
+    @property
+    def rounds(self) -> int:
+        return sum(p.rounds for p in self.pairings)
+
+    @property
+    def rounds_per_second(self) -> float:
+        return self.rounds / self.elapsed if self.elapsed > 0 else math.inf
+
+
+def _ci_half_width(samples: list[float]) -> float:
+    """Batch-means 95 % half-width (``nan`` with fewer than two sessions)."""
+
+    k = len(samples)
+    if k < 2:
+        return math.nan
+    mean = sum(samples) / k
+    variance = sum((x - mean) ** 2 for x in samples) / (k - 1)
+    return _Z95 * math.sqrt(variance / k)
+
+
+def _aggregate(mode: Mode, player: str, tallies: list[_SessionTally]) -> PairingResult:
+    sizes = [t.computer_wins + t.player_wins + t.ties for t in tallies]
+    return PairingResult(
+        mode=mode,
+        player=player,
+        rounds=sum(sizes),
+        sessions=len(tallies),
+        computer_wins=sum(t.computer_wins for t in tallies),
+        player_wins=sum(t.player_wins for t in tallies),
+        ties=sum(t.ties for t in tallies),
+        win_rate_ci=_ci_half_width(
+            [t.computer_wins / n for t, n in zip(tallies, sizes, strict=True)]
+        ),
+        edge_ci=_ci_half_width(
+            [
+                (t.computer_wins - t.player_wins) / n
+                for t, n in zip(tallies, sizes, strict=True)
+            ]
+        ),
+    )
+
+
+def run_tournament(
+    modes: Iterable[Mode],
+    players: Iterable[str],
+    *,
+    rounds: int,
+    chunk: int,
+    workers: int | None = None,
+    seed: int = 0,
+) -> TournamentResult:
+    """Play *rounds* rounds of every ``mode × player`` pairing.
+
+    Work is cut into sessions of at most *chunk* rounds and spread over
+    *workers* processes (default: all CPUs; ``1`` runs in-process).
+    """
+
+    modes, players = list(modes), list(players)
+    unknown = set(players) - PLAYER_MODELS.keys()
+    if unknown:
+        raise ValueError(f"unknown player model(s): {', '.join(sorted(unknown))}")
+
+    seeds = random.Random(seed)
+    sessions = [
+        _Session(mode, player, min(chunk, rounds - start), seeds.getrandbits(32))
+        for mode in modes
+        for player in players
+        for start in range(0, rounds, chunk)
+    ]
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    if workers == 1:
+        tallies = [_run_session(s) for s in sessions]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            tallies = list(pool.map(_run_session, sessions))
+    elapsed = time.perf_counter() - start
+
+    grouped: dict[tuple[Mode, str], list[_SessionTally]] = {}
+    for tally in tallies:
+        grouped.setdefault((tally.mode, tally.player), []).append(tally)
+    return TournamentResult(
+        pairings=[
+            _aggregate(mode, player, grouped[mode, player])
+            for mode in modes
+            for player in players
+        ],
+        elapsed=elapsed,
+        workers=workers,
+    )
@@ -3,27 +3,21 @@ from __future__ import annotations
 """Adaptive computer strategy helpers."""
 
 from collections import Counter
+import random
 from random import choice as rand_choice
 from collections.abc import Sequence
 
 from app.utils.enums import Choice
+from app.utils.rules import COUNTERS
 
 __all__ = [
     "smart_choice",
 ]
 
 
-# Mapping of player gesture -> set of gestures that beat it (reuse from game_logic)
-_BEATS: dict[Choice, set[Choice]] = {
-    Choice.ROCK: {Choice.PAPER, Choice.SPOCK},
-    Choice.PAPER: {Choice.SCISSORS, Choice.LIZARD},
-    Choice.SCISSORS: {Choice.ROCK, Choice.SPOCK},
-    Choice.LIZARD: {Choice.ROCK, Choice.SCISSORS},
-    Choice.SPOCK: {Choice.PAPER, Choice.LIZARD},
-}
-
-
-def smart_choice(history: Sequence[Choice], *, window: int = 5) -> Choice:
+def smart_choice(
+    history: Sequence[Choice], *, window: int = 5, rng: random.Random | None = None
+) -> Choice:
     """Return an adaptive computer move based on player's recent history.
 
     Strategy:
@@ -32,11 +26,13 @@ def smart_choice(history: Sequence[Choice], *, window: int = 5) -> Choice:
     3. Pick **randomly** among the gestures that beat that frequent choice.
 
     If the *history* is empty or no winner can be derived, a random gesture is
-    returned (uniform over the 5 choices).
+    returned (uniform over the 5 choices).  Random picks come from *rng* when
+    given, otherwise from the module-level PRNG.
     """
 
+    pick = rand_choice if rng is None else rng.choice
     if not history:
-        return rand_choice(list(Choice))
+        return pick(list(Choice))
 
     # History is expected to be ordered from newest -> oldest.
     # We want the *recent* window, i.e. the first *window* items.
@@ -45,5 +41,4 @@ def smart_choice(history: Sequence[Choice], *, window: int = 5) -> Choice:
     # Most common returns list of (choice, count) sorted desc
     most_common_choice, _ = counts.most_common(1)[0]
 
-    counters = _BEATS[most_common_choice]
-    return rand_choice(list(counters))
+    return pick(COUNTERS[most_common_choice])
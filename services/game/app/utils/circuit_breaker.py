@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+"""Circuit breaker and latency tracking for outbound calls.
+
+The breaker follows the classic three-state machine:
+
+* **closed** – calls flow; consecutive failures are counted.
+* **open** – calls are rejected immediately until *reset_timeout* elapses.
+* **half-open** – a single probe is let through; success closes the circuit,
+  failure re-opens it.
+
+`LatencyWindow` keeps a rolling sample of successful call latencies so
+callers can derive adaptive timeouts and hedge delays from live percentiles.
+"""
+
+from collections import deque
+from collections.abc import Callable
+from enum import StrEnum
+import math
+import time
+
+import structlog
+
+from app.core.metrics import CIRCUIT_BREAKER_STATE
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "LatencyWindow",
+]
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# Numeric encoding exported through the state gauge.
+_STATE_VALUE: dict[CircuitState, int] = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is short-circuited by an open breaker."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (not thread-safe; asyncio only)."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        CIRCUIT_BREAKER_STATE.labels(name=name).set(_STATE_VALUE[self._state])
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, promoting *open* to *half-open* once the timeout passed."""
+
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return ``True`` if a call may proceed right now."""
+
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probe_in_flight = False
+        if self._state is not CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def release(self) -> None:
+        """Give back a half-open probe slot without recording an outcome."""
+
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._probe_in_flight = False
+        if self._state is CircuitState.HALF_OPEN:
+            self._open()
+            return
+
+        self._failures += 1
+        if (
+            self._state is CircuitState.CLOSED
+            and self._failures >= self._failure_threshold
+        ):
+            self._open()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, new_state: CircuitState) -> None:
+        old_state, self._state = self._state, new_state
+        CIRCUIT_BREAKER_STATE.labels(name=self.name).set(_STATE_VALUE[new_state])
+
+        log = structlog.get_logger(__name__)
+        emit = log.warning if new_state is CircuitState.OPEN else log.info
+        emit(
+            "circuit_state_change",
+            breaker=self.name,
+            old_state=old_state.value,
+            new_state=new_state.value,
+            failures=self._failures,
+        )
+
+
+class LatencyWindow:
+    """Rolling window of observed latencies (seconds) with percentile lookup."""
+
+    def __init__(self, size: int = 256, *, min_samples: int = 20) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+        self._min_samples = min_samples
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """Return the *q*-th percentile (0-100) or ``None`` with too few samples."""
+
+        if len(self._samples) < self._min_samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(0, math.ceil(q / 100.0 * len(ordered)) - 1)
+        return ordered[rank]
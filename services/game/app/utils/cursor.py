@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+"""Opaque keyset-pagination cursors.
+
+A cursor encodes the ``(created_at, id)`` key of the last row a client has
+seen.  It is URL-safe base64 so clients treat it as an opaque token.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+import uuid
+
+__all__ = [
+    "decode_cursor",
+    "encode_cursor",
+]
+
+_SEP = "|"
+
+
+def encode_cursor(created_at: datetime, game_id: uuid.UUID) -> str:
+    """Return an opaque token for the row keyed by *created_at* / *game_id*."""
+
+    raw = f"{created_at.isoformat()}{_SEP}{game_id.hex}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[datetime, uuid.UUID]:
+    """Inverse of :func:`encode_cursor`; raises *ValueError* on bad input."""
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        ts, _, hex_id = raw.partition(_SEP)
+        return datetime.fromisoformat(ts), uuid.UUID(hex=hex_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("invalid cursor") from exc
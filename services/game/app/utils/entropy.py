@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+"""Background-refilled buffer of pre-fetched random numbers.
+
+Random-mode rounds pop a number from an in-memory ring buffer instead of
+waiting on a trip to ``RANDOM_API_URL``.  A background task tops the buffer
+up whenever it drops below a low-water mark, issuing several API requests
+concurrently per batch.  When the buffer is empty callers fall back to the
+local PRNG, so a slow upstream never stalls a round.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+import contextlib
+
+import structlog
+
+from app.core.config import get_settings
+from app.core.metrics import ENTROPY_BUFFER_DEPTH, ENTROPY_REFILLED_TOTAL
+
+__all__ = [
+    "EntropyBuffer",
+    "get_entropy_buffer",
+    "start_entropy_buffer",
+    "stop_entropy_buffer",
+]
+
+FetchFn = Callable[[], Awaitable[int]]
+
+
+class EntropyBuffer:
+    """Bounded FIFO of random numbers with a background refill task."""
+
+    def __init__(
+        self,
+        fetch: FetchFn,
+        *,
+        capacity: int,
+        low_water: int,
+        concurrency: int = 8,
+        retry_delay: float = 1.0,
+    ) -> None:
+        self._fetch = fetch
+        self._capacity = capacity
+        self._low_water = min(low_water, capacity)
+        self._concurrency = concurrency
+        self._retry_delay = retry_delay
+        self._items: deque[int] = deque(maxlen=capacity)
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+    def pop(self) -> int | None:
+        """Return the oldest buffered number, or ``None`` when empty.
+
+        Never awaits: dropping below the low-water mark only *signals* the
+        refill task.
+        """
+
+        try:
+            value: int | None = self._items.popleft()
+        except IndexError:
+            value = None
+
+        depth = len(self._items)
+        ENTROPY_BUFFER_DEPTH.set(depth)
+        if depth < self._low_water:
+            self._wakeup.set()
+        return value
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+    async def refill(self) -> int:
+        """Top the buffer up to capacity and return how many numbers were added.
+
+        Stops early as soon as a batch comes back incomplete, leaving the retry
+        to the background loop instead of hammering a failing upstream.
+        """
+
+        added = 0
+        while len(self._items) < self._capacity:
+            batch = min(self._concurrency, self._capacity - len(self._items))
+            results = await asyncio.gather(
+                *(self._fetch() for _ in range(batch)), return_exceptions=True
+            )
+            numbers = [r for r in results if isinstance(r, int)]
+            self._items.extend(numbers)
+            added += len(numbers)
+            ENTROPY_REFILLED_TOTAL.inc(len(numbers))
+            ENTROPY_BUFFER_DEPTH.set(len(self._items))
+            if len(numbers) < batch:
+                errors = [r for r in results if isinstance(r, Exception)]
+                structlog.get_logger(__name__).warning(
+                    "entropy_refill_incomplete",
+                    fetched=len(numbers),
+                    requested=batch,
+                    error=str(errors[0]) if errors else None,
+                )
+                break
+        return added
+
+    async def _run(self) -> None:
+        log = structlog.get_logger(__name__)
+
+        while True:
+            try:
+                await self.refill()
+            except Exception as exc:  # noqa: BLE001 – keep the refill loop alive
+                log.warning("entropy_refill_failed", error=str(exc))
+
+            self._wakeup.clear()
+            if len(self._items) < self._low_water:
+                # Upstream could not deliver – back off before the next attempt.
+                await asyncio.sleep(self._retry_delay)
+            else:
+                await self._wakeup.wait()
+
+    def start(self) -> None:
+        """Spawn the background refill task (idempotent)."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="entropy-refill")
+
+    async def stop(self) -> None:
+        """Cancel the refill task and wait for it to finish."""
+
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance – owned by the application lifespan
+# ---------------------------------------------------------------------------
+_BUFFER: EntropyBuffer | None = None
+
+
+def get_entropy_buffer() -> EntropyBuffer | None:
+    """Return the running buffer, or ``None`` when it is disabled/not started."""
+
+    return _BUFFER
+
+
+def start_entropy_buffer(fetch: FetchFn) -> EntropyBuffer | None:
+    """Create and start the process-wide buffer unless disabled in settings."""
+
+    global _BUFFER
+
+    settings = get_settings()
+    if settings.ENTROPY_BUFFER_SIZE <= 0:
+        return None
+
+    if _BUFFER is None:
+        _BUFFER = EntropyBuffer(
+            fetch,
+            capacity=settings.ENTROPY_BUFFER_SIZE,
+            low_water=settings.ENTROPY_LOW_WATER,
+            concurrency=settings.ENTROPY_REFILL_CONCURRENCY,
+            retry_delay=settings.ENTROPY_RETRY_DELAY,
+        )
+    _BUFFER.start()
+    return _BUFFER
+
+
+async def stop_entropy_buffer() -> None:
+    """Stop and discard the process-wide buffer."""
+
+    global _BUFFER
+
+    if _BUFFER is not None:
+        await _BUFFER.stop()
+        _BUFFER = None
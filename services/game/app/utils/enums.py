@@ -22,3 +22,18 @@ class Mode(StrEnum):
 
     RANDOM = "random"
     SMART = "smart"
+    MARKOV = "markov"
+
+
+class ExportFormat(StrEnum):
+    """Serialisation formats supported by the history export."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ProfileFormat(StrEnum):
+    """Output formats of ``POST /debug/profile``."""
+
+    COLLAPSED = "collapsed"  # sampled stacks, flamegraph input
+    PSTATS = "pstats"  # cProfile dump
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import random
 import time
 
@@ -7,21 +8,28 @@ import httpx
 import structlog
 
 from app.core.config import get_settings
+from app.core.http_client import get_http_client
+from app.core.metrics import (
+    ENTROPY_FALLBACK_TOTAL,
+    RANDOM_API_HEDGED_TOTAL,
+    RANDOM_API_LATENCY,
+)
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, LatencyWindow
+from app.utils.entropy import get_entropy_buffer
 from app.utils.enums import Choice, GameResult
+from app.utils.rules import OUTCOME_RESULTS, decide_winners, outcome_code
 
 __all__ = [
+    "choice_from_number",
     "decide_winner",
+    "decide_winners",
+    "fetch_random_number",
     "random_choice",
+    "reset_random_api_guard",
 ]
 
 
-_BEATS: dict[Choice, set[Choice]] = {
-    Choice.ROCK: {Choice.SCISSORS, Choice.LIZARD},
-    Choice.PAPER: {Choice.ROCK, Choice.SPOCK},
-    Choice.SCISSORS: {Choice.PAPER, Choice.LIZARD},
-    Choice.LIZARD: {Choice.SPOCK, Choice.PAPER},
-    Choice.SPOCK: {Choice.SCISSORS, Choice.ROCK},
-}
+_GESTURES: tuple[Choice, ...] = tuple(Choice)
 
 
 def decide_winner(player: Choice, computer: Choice) -> GameResult:  # noqa: D401 – imperative mood
@@ -39,44 +47,187 @@ def decide_winner(player: Choice, computer: Choice) -> GameResult:  # noqa: D401
         otherwise ``TIE``.
     """
 
-    if player == computer:
-        return GameResult.TIE
+    return OUTCOME_RESULTS[outcome_code(player, computer)]
 
-    if computer in _BEATS[player]:
-        return GameResult.PLAYER
 
-    return GameResult.COMPUTER
+# ---------------------------------------------------------------------------
+# RANDOM_API_URL resilience – breaker + latency window built lazily from settings
+# ---------------------------------------------------------------------------
+_BREAKER: CircuitBreaker | None = None
+_LATENCY = LatencyWindow()
 
 
-async def random_choice() -> Choice:  # noqa: D401 – imperative mood
-    """Return a random RPSLS choice for the computer.
+def _random_api_breaker() -> CircuitBreaker:
+    global _BREAKER
 
-    Attempts to obtain a truly random integer in the range 1-100 from the
-    public code-challenge endpoint and maps it deterministically to one of the
-    five RPSLS gestures. If the request fails for *any* reason - network
-    issues, non-2xx response, malformed JSON, etc. - the function falls back
-    to Python's local PRNG so the service remains responsive.
-    """
+    if _BREAKER is None:
+        settings = get_settings()
+        _BREAKER = CircuitBreaker(
+            "random_api",
+            failure_threshold=settings.RANDOM_API_BREAKER_THRESHOLD,
+            reset_timeout=settings.RANDOM_API_BREAKER_RESET,
+        )
+    return _BREAKER
+
+
+def reset_random_api_guard() -> None:
+    """Forget breaker state and latency samples (mainly for tests)."""
+
+    global _BREAKER, _LATENCY
+
+    _BREAKER = None
+    _LATENCY = LatencyWindow()
+
+
+def _adaptive_timeout() -> float:
+    """Return p99 x multiplier, clamped to the configured min/max timeout."""
 
     settings = get_settings()
+    p99 = _LATENCY.percentile(99)
+    if p99 is None:
+        return settings.RANDOM_API_TIMEOUT
+    return min(
+        settings.RANDOM_API_TIMEOUT,
+        max(
+            settings.RANDOM_API_MIN_TIMEOUT,
+            p99 * settings.RANDOM_API_TIMEOUT_MULTIPLIER,
+        ),
+    )
+
+
+async def _request_random_number(url: str) -> tuple[int, int]:
+    """Return ``(random_number, status_code)`` from one call to *url*.
+
+    A payload without a ``random_number`` in 1-100 raises, so it counts as a
+    failure like any other malformed response.
+    """
+
+    resp = await get_http_client().get(url)
+    resp.raise_for_status()
+    idx = int(resp.json()["random_number"])
+    if not 1 <= idx <= 100:
+        raise ValueError(f"random_number out of range: {idx}")
+    return idx, resp.status_code
+
+
+async def _hedged_request(url: str, hedge_delay: float) -> tuple[int, int]:
+    """Race a second request against the first once *hedge_delay* has passed."""
 
+    pending = {asyncio.create_task(_request_random_number(url))}
+    hedged = False
+    error: BaseException | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=None if hedged else hedge_delay,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                if (exc := task.exception()) is None:
+                    return task.result()
+                error = exc
+            if not done and not hedged:
+                hedged = True
+                RANDOM_API_HEDGED_TOTAL.inc()
+                pending.add(asyncio.create_task(_request_random_number(url)))
+    finally:
+        for task in pending:
+            task.cancel()
+
+    assert error is not None
+    raise error
+
+
+def choice_from_number(idx: int) -> Choice:
+    """Map a random integer (the API returns 1-100) onto one of the five gestures."""
+
+    return _GESTURES[(idx - 1) % len(_GESTURES)]
+
+
+async def fetch_random_number() -> int:  # noqa: D401 – imperative mood
+    """Return one integer from ``RANDOM_API_URL``.
+
+    Uses the shared, pooled HTTP client behind a circuit breaker.  The timeout
+    adapts to the observed p99 latency, and with ``RANDOM_API_HEDGE_ENABLED``
+    a second request is raced against the first once it exceeds the p95.
+    Any failure (open circuit, timeout, non-2xx response, malformed JSON, ...)
+    is propagated to the caller.
+    """
+
+    settings = get_settings()
     log = structlog.get_logger(__name__)
 
+    breaker = _random_api_breaker()
+    if not breaker.allow_request():
+        raise CircuitOpenError(f"circuit '{breaker.name}' is open")
+
+    hedge_delay = _LATENCY.percentile(95) if settings.RANDOM_API_HEDGE_ENABLED else None
+    start = time.perf_counter()
     try:
-        start = time.perf_counter()
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            resp = await client.get(settings.RANDOM_API_URL)
-        duration_ms = (time.perf_counter() - start) * 1000.0
-        resp.raise_for_status()
-        idx = int(resp.json().get("random_number", 0))
-        log.info(
-            "random_api",
-            status_code=resp.status_code,
-            duration_ms=round(duration_ms, 2),
-        )
-    except Exception as exc:  # noqa: BLE001 – broad except to ensure graceful fallback
-        idx = random.randint(1, 100)
-        log.warning("random_api_fallback", error=str(exc), idx=idx)
+        async with asyncio.timeout(_adaptive_timeout()):
+            if hedge_delay is None:
+                idx, status = await _request_random_number(settings.RANDOM_API_URL)
+            else:
+                idx, status = await _hedged_request(
+                    settings.RANDOM_API_URL, hedge_delay
+                )
+    except Exception:
+        breaker.record_failure()
+        raise
+    except asyncio.CancelledError:
+        breaker.release()
+        raise
+    duration = time.perf_counter() - start
+
+    breaker.record_success()
+    _LATENCY.observe(duration)
+    RANDOM_API_LATENCY.observe(duration)
+    log.info("random_api", status_code=status, duration_ms=round(duration * 1000.0, 2))
+    return idx
+
+
+async def random_choice() -> Choice:  # noqa: D401 – imperative mood
+    """Return a random RPSLS choice for the computer.
+
+    Obtains a truly random integer in the range 1-100 from the public
+    code-challenge endpoint and maps it deterministically to one of the five
+    RPSLS gestures.  When the entropy buffer is running the number is simply
+    popped from it, so the round never waits on the network; otherwise the
+    endpoint is called directly.  If no number is available for *any* reason -
+    empty buffer, network issues, non-2xx response, malformed JSON, etc. - the
+    function falls back to Python's local PRNG so the service remains
+    responsive.
+    """
+
+    log = structlog.get_logger(__name__)
 
-    gestures = list(Choice)
-    return gestures[(idx - 1) % len(gestures)]
+    buffer = get_entropy_buffer()
+    if buffer is not None:
+        buffered = buffer.pop()
+        if buffered is None:
+            idx = random.randint(1, 100)
+            ENTROPY_FALLBACK_TOTAL.labels(reason="buffer_empty").inc()
+            log.debug("entropy_buffer_empty", idx=idx)
+        else:
+            idx = buffered
+    else:
+        try:
+            idx = await fetch_random_number()
+        except CircuitOpenError:
+            # Breaker already logged the transition – fall back without noise.
+            idx = random.randint(1, 100)
+            ENTROPY_FALLBACK_TOTAL.labels(reason="circuit_open").inc()
+        except Exception as exc:  # noqa: BLE001 – broad except to ensure graceful fallback
+            idx = random.randint(1, 100)
+            ENTROPY_FALLBACK_TOTAL.labels(reason="api_error").inc()
+            status = (
+                exc.response.status_code
+                if isinstance(exc, httpx.HTTPStatusError)
+                else None
+            )
+            log.warning(
+                "random_api_fallback", error=str(exc), status_code=status, idx=idx
+            )
+
+    return choice_from_number(idx)
@@ -0,0 +1,160 @@
+"""Order-k Markov (n-gram) predictor of the player's next gesture.
+
+The predictor keeps a fixed ``(5**k, 5)`` table of transition counts: row =
+the player's last *k* gestures (encoded base-5), column = the gesture that
+followed.  ``observe`` bumps one cell and rolls the context forward;
+``choose`` reads one 5-wide row and counters the most likely next move.
+Both are O(1) regardless of how many rounds have been played.
+
+The table is a flat ``array('I')``: 4 bytes per cell and no per-element
+objects, with cheap scalar access – every round touches a single cell or
+row, where NumPy's per-call overhead would dominate.
+
+``MarkovSessions`` keeps one predictor per ``player_id`` in an LRU map so
+idle players are evicted once ``MARKOV_MAX_SESSIONS`` is reached.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable
+import random
+from random import choice as rand_choice
+
+from app.core.config import get_settings
+from app.utils.enums import Choice
+from app.utils.rules import COUNTERS
+
+__all__ = [
+    "MarkovPredictor",
+    "MarkovSessions",
+    "get_markov_sessions",
+]
+
+_GESTURES: tuple[Choice, ...] = tuple(Choice)
+_N = len(_GESTURES)
+
+
+class MarkovPredictor:
+    """Transition counts for one player (``5**order × 5`` unsigned 32-bit cells)."""
+
+    __slots__ = ("_context", "_counts", "_modulus", "_seen", "order")
+
+    def __init__(self, order: int = 2) -> None:
+        self.order = order
+        self._modulus = _N**order
+        self._counts = array("I", bytes(4 * self._modulus * _N))
+        self._context = 0  # last *order* moves, base-5, oldest most significant
+        self._seen = 0  # moves observed, capped at *order*
+
+    @property
+    def nbytes(self) -> int:
+        return self._counts.itemsize * len(self._counts)
+
+    def observe(self, move: Choice) -> None:
+        """Count *move* as following the current context, then advance it."""
+
+        symbol = move - 1
+        if self._seen >= self.order:
+            self._counts[self._context * _N + symbol] += 1
+        else:
+            self._seen += 1
+        self._context = (self._context * _N + symbol) % self._modulus
+
+    def replay(self, oldest_first: Iterable[Choice]) -> None:
+        for move in oldest_first:
+            self.observe(move)
+
+    def predict(self, rng: random.Random | None = None) -> Choice | None:
+        """Return the most likely next player move, or ``None`` without data.
+
+        Ties are broken with *rng* (default: the module-level PRNG).
+        """
+
+        if self._seen < self.order:
+            return None
+        start = self._context * _N
+        row = self._counts[start : start + _N]
+        best = max(row)
+        if best == 0:
+            return None
+        pick = rand_choice if rng is None else rng.choice
+        return pick([g for g, n in zip(_GESTURES, row, strict=True) if n == best])
+
+    def choose(self, rng: random.Random | None = None) -> Choice:
+        """Return a computer move that beats the predicted player move.
+
+        Falls back to a uniformly random gesture while the current context
+        has never been seen.
+        """
+
+        pick = rand_choice if rng is None else rng.choice
+        predicted = self.predict(rng)
+        if predicted is None:
+            return pick(_GESTURES)
+        return pick(COUNTERS[predicted])
+
+
+class MarkovSessions:
+    """LRU map of ``player_id`` (``None`` = anonymous) to its predictor."""
+
+    def __init__(self, order: int, *, max_sessions: int) -> None:
+        self.order = order
+        self._max_sessions = max_sessions
+        self._sessions: OrderedDict[str | None, MarkovPredictor] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, player_id: str | None) -> MarkovPredictor | None:
+        """Return the live predictor for *player_id*, or ``None`` on a miss."""
+
+        predictor = self._sessions.get(player_id)
+        if predictor is not None:
+            self._sessions.move_to_end(player_id)
+        return predictor
+
+    def load(
+        self, player_id: str | None, oldest_first: Iterable[Choice]
+    ) -> MarkovPredictor:
+        """Create a predictor warmed up with *oldest_first*, evicting the LRU one."""
+
+        predictor = MarkovPredictor(self.order)
+        predictor.replay(oldest_first)
+        self._sessions[player_id] = predictor
+        self._sessions.move_to_end(player_id)
+        while len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
+        return predictor
+
+    def record(self, player_id: str | None, move: Choice) -> None:
+        """Feed *move* to the player's predictor if it is live."""
+
+        predictor = self.get(player_id)
+        if predictor is not None:
+            predictor.observe(move)
+
+    def discard(self, player_id: str | None) -> None:
+        """Forget *player_id*'s predictor; the next Markov round reloads it."""
+
+        self._sessions.pop(player_id, None)
+
+    def clear(self) -> None:
+        self._sessions.clear()
+
+
+_SESSIONS: MarkovSessions | None = None
+
+
+def get_markov_sessions() -> MarkovSessions:
+    """Return the process-wide predictor map, sized by the ``MARKOV_*`` settings."""
+
+    global _SESSIONS
+
+    if _SESSIONS is None:
+        settings = get_settings()
+        _SESSIONS = MarkovSessions(
+            settings.MARKOV_ORDER, max_sessions=settings.MARKOV_MAX_SESSIONS
+        )
+    return _SESSIONS
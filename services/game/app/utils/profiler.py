@@ -0,0 +1,135 @@
+"""On-demand CPU profiling of the running event loop.
+
+Two strategies, both scoped to a time window while the loop keeps serving:
+
+* ``sample_stacks`` – a statistical profiler.  A daemon thread wakes every
+  ``interval`` seconds, grabs the event-loop thread's current frame via
+  ``sys._current_frames()`` and counts the whole stack.  A coroutine that is
+  running has its frames on that stack (``Task.__step`` → ``coro.send`` → …),
+  so samples land in ``GameService.play``, pydantic validation or a
+  middleware exactly as in synchronous code; suspended coroutines cost no
+  CPU and do not appear.  Overhead is one stack walk per interval – cheap
+  enough for production.  Output is in collapsed-stack format
+  (``frame;frame;frame count``), ready for ``flamegraph.pl`` or speedscope.
+* ``trace_calls`` – ``cProfile`` enabled on the loop thread for the window.
+  Deterministic, so every call is counted, but it slows the loop noticeably;
+  returns a marshalled ``pstats`` dump (``python -m pstats file``, snakeviz).
+
+Samples whose innermost frame is the selector wait (the loop has nothing to
+run) are counted as idle and left out unless asked for.
+
+The sampler needs the GIL to look at the loop thread, and the loop hands the
+GIL over voluntarily mostly at that selector wait – otherwise only after
+``sys.getswitchinterval()`` (5 ms by default).  CPU bursts shorter than that
+between two ``await``s would hardly ever be sampled, so ``sample_stacks``
+shortens the switch interval to a tenth of the sampling interval for the
+window and restores it afterwards.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from collections import Counter
+import marshal
+import sys
+import threading
+from types import CodeType, FrameType
+
+__all__ = ["StackSampler", "sample_stacks", "trace_calls"]
+
+# Innermost-frame module of a loop blocked in select/epoll.
+_IDLE_MODULE = "selectors"
+
+
+class StackSampler:
+    """Count the stacks of one thread from a background sampling thread."""
+
+    def __init__(
+        self, thread_id: int, *, interval: float, include_idle: bool = False
+    ) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.include_idle = include_idle
+        self.stacks: Counter[str] = Counter()
+        self.idle = 0
+        self._labels: dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+
+    @property
+    def samples(self) -> int:
+        return self.stacks.total() + (0 if self.include_idle else self.idle)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _label(self, frame: FrameType) -> str:
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            module = frame.f_globals.get("__name__", "?")
+            label = f"{module}:{code.co_qualname}".replace(";", ":")
+            self._labels[code] = label
+        return label
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame: FrameType | None = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            if frame.f_globals.get("__name__") == _IDLE_MODULE:
+                self.idle += 1
+                if not self.include_idle:
+                    continue
+            labels = []
+            while frame is not None:
+                labels.append(self._label(frame))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(labels))] += 1
+
+    def collapsed(self) -> str:
+        """Return ``stack count`` lines, most frequent first."""
+
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+
+async def sample_stacks(
+    seconds: float, *, interval: float, include_idle: bool = False
+) -> StackSampler:
+    """Sample the calling event loop's thread for *seconds* and return the result."""
+
+    sampler = StackSampler(
+        threading.get_ident(), interval=interval, include_idle=include_idle
+    )
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval / 10))
+    sampler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        sys.setswitchinterval(switch_interval)
+        await asyncio.to_thread(sampler.stop)
+    return sampler
+
+
+async def trace_calls(seconds: float) -> bytes:
+    """Run ``cProfile`` on the event loop for *seconds*; return the pstats dump.
+
+    Raises ``ValueError`` when another profiler is already active.
+    """
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.disable()
+    profiler.create_stats()
+    return marshal.dumps(profiler.stats)
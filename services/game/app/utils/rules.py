@@ -0,0 +1,127 @@
+"""RPSLS rules as precomputed lookup tables.
+
+Every "who beats whom" question in the code base is answered from here:
+
+* ``BEATS`` – gesture -> the gestures it defeats (the single source of truth).
+* ``OUTCOMES`` – a 6x6 ``uint8`` NumPy matrix indexed by ``Choice`` value
+  (row 0 / column 0 are unused) holding the outcome code of
+  ``(player, computer)`` from the player's point of view.
+* ``decide_winners`` – vectorized scoring of whole arrays of rounds.
+
+Outcome codes index ``OUTCOME_RESULTS``: 0 = tie, 1 = player, 2 = computer.
+
+NumPy takes longer to import than the rest of the game logic combined and
+only batch scoring needs it, so it is imported on first use of
+``OUTCOMES`` / ``decide_winners`` rather than at service start.
+"""
+
+from __future__ import annotations
+
+import functools
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from app.utils.enums import Choice, GameResult
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
+
+    OUTCOMES: NDArray[np.uint8]
+
+__all__ = [
+    "BEATS",
+    "COUNTERS",
+    "OUTCOMES",
+    "OUTCOME_RESULTS",
+    "decide_winners",
+    "outcome_code",
+]
+
+
+BEATS: MappingProxyType[Choice, frozenset[Choice]] = MappingProxyType(
+    {
+        Choice.ROCK: frozenset({Choice.SCISSORS, Choice.LIZARD}),
+        Choice.PAPER: frozenset({Choice.ROCK, Choice.SPOCK}),
+        Choice.SCISSORS: frozenset({Choice.PAPER, Choice.LIZARD}),
+        Choice.LIZARD: frozenset({Choice.SPOCK, Choice.PAPER}),
+        Choice.SPOCK: frozenset({Choice.SCISSORS, Choice.ROCK}),
+    }
+)
+
+# Gesture -> the gestures that defeat it (what the AI plays to counter it).
+COUNTERS: MappingProxyType[Choice, tuple[Choice, ...]] = MappingProxyType(
+    {target: tuple(c for c in Choice if target in BEATS[c]) for target in Choice}
+)
+
+OUTCOME_RESULTS: tuple[GameResult, ...] = (
+    GameResult.TIE,
+    GameResult.PLAYER,
+    GameResult.COMPUTER,
+)
+
+_SIZE = max(Choice) + 1
+
+
+def _outcome_table() -> tuple[tuple[int, ...], ...]:
+    table = [[0] * _SIZE for _ in range(_SIZE)]
+    for player in Choice:
+        for computer in Choice:
+            if computer in BEATS[player]:
+                table[player][computer] = 1
+            elif player in BEATS[computer]:
+                table[player][computer] = 2
+    return tuple(tuple(row) for row in table)
+
+
+# Plain tuples for scalar lookups (no NumPy scalar overhead per round) …
+_TABLE = _outcome_table()
+
+
+# … and the same table as a read-only matrix for vectorized scoring.
+@functools.cache
+def _outcomes() -> NDArray[np.uint8]:
+    import numpy as np
+
+    table = np.array(_TABLE, dtype=np.uint8)
+    table.setflags(write=False)
+    return table
+
+
+def __getattr__(name: str) -> Any:
+    if name == "OUTCOMES":
+        return _outcomes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def outcome_code(player: Choice, computer: Choice) -> int:
+    """Return the outcome code of a single round (index into ``OUTCOME_RESULTS``)."""
+
+    return _TABLE[player][computer]
+
+
+def decide_winners(players: ArrayLike, computers: ArrayLike) -> NDArray[np.uint8]:
+    """Score many rounds at once.
+
+    *players* and *computers* are equally shaped arrays of ``Choice`` values
+    (ideally ``uint8``).  Returns a ``uint8`` array of outcome codes; map
+    them through ``OUTCOME_RESULTS`` when ``GameResult`` members are needed.
+    Values outside 1-5 raise ``ValueError``.
+    """
+
+    import numpy as np
+
+    # Range-check in the input's own dtype: converting -1 or 300 to uint8
+    # first would raise OverflowError (or wrap around) instead.
+    p = np.asarray(players)
+    c = np.asarray(computers)
+    if p.shape != c.shape:
+        raise ValueError(f"shape mismatch: {p.shape} != {c.shape}")
+    if p.size and (
+        p.min() < Choice.ROCK
+        or p.max() > Choice.SPOCK
+        or c.min() < Choice.ROCK
+        or c.max() > Choice.SPOCK
+    ):
+        raise ValueError("choices must be between 1 and 5")
+    return _outcomes()[p.astype(np.uint8, copy=False), c.astype(np.uint8, copy=False)]
@@ -0,0 +1,9 @@
+"""Offline microbenchmarks and a load generator for the game service.
+
+Run from ``services/game``::
+
+    python -m benchmarks            # compare against baseline.json
+    python -m benchmarks --update   # record a new baseline
+    python -m benchmarks.load       # closed-loop load test of the API
+    python -m benchmarks.stub_api   # fault-injecting RANDOM_API_URL stand-in
+"""
@@ -0,0 +1,115 @@
+"""CLI: ``python -m benchmarks`` – run the suite and compare with the baseline."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Sequence
+import os
+from pathlib import Path
+import sys
+
+from benchmarks.harness import (
+    BenchResult,
+    compare,
+    load_baseline,
+    measure_reference,
+    registry,
+    run_benchmarks,
+    save_baseline,
+)
+from benchmarks.suite import offline_context
+
+_DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Microbenchmarks for the game hot paths (offline).",
+    )
+    parser.add_argument(
+        "-k", dest="pattern", default="", help="only run benchmarks containing this"
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=_DEFAULT_BASELINE, help="baseline JSON file"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=float(os.getenv("BENCH_THRESHOLD", "0.25")),
+        help="allowed slowdown vs baseline before failing (default: 0.25 = +25%%)",
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="write the results as the new baseline"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.5, help="seconds spent per benchmark"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timed runs per benchmark"
+    )
+    return parser.parse_args(argv)
+
+
+def _fmt(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:7.2f} {unit}"
+    return f"{ns:7.1f} ns"
+
+
+async def _run(args: argparse.Namespace) -> tuple[BenchResult, list[BenchResult]]:
+    names = [n for n in registry() if args.pattern in n]
+    baseline = load_baseline(args.baseline)
+    width = max(map(len, names), default=10)
+    print(
+        f"{'benchmark':<{width}}  {'best':>10}  {'median':>10}  {'baseline':>10}  delta"
+    )
+
+    reference = await measure_reference(min_time=args.min_time, repeat=args.repeat)
+    print(
+        f"{reference.name:<{width}}  {_fmt(reference.best_ns)}  "
+        f"{_fmt(reference.median_ns)}",
+        flush=True,
+    )
+
+    def report(r: BenchResult) -> None:
+        ratio = baseline.get(r.name)
+        base = ratio * reference.best_ns if ratio else None
+        delta = f"{(r.best_ns / base - 1) * 100:+6.1f}%" if base else "   new"
+        print(
+            f"{r.name:<{width}}  {_fmt(r.best_ns)}  {_fmt(r.median_ns)}  "
+            f"{_fmt(base) if base else '         -'}  {delta}",
+            flush=True,
+        )
+
+    async with offline_context() as ctx:
+        results = await run_benchmarks(
+            ctx, names, min_time=args.min_time, repeat=args.repeat, on_result=report
+        )
+    return reference, results
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    reference, results = asyncio.run(_run(args))
+
+    if args.update:
+        save_baseline(args.baseline, results, reference)
+        print(f"\nbaseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(
+        results, load_baseline(args.baseline), args.threshold, reference.best_ns
+    )
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond +{args.threshold:.0%}:")
+        for reg in regressions:
+            print(f"  {reg.name}: {_fmt(reg.baseline_ns)} -> {_fmt(reg.current_ns)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""Minimal timing harness: registry, calibration, baselines, comparison.
+
+A benchmark is an ``async`` *factory* registered with ``@benchmark(name)``.
+It receives a ``BenchContext`` (shared offline fixtures), performs any setup
+and returns the operation to time – a plain callable or a coroutine
+function.  The harness then works like ``timeit.autorange``: it grows the
+loop count until one run takes at least ``min_time / repeat``, repeats the
+run ``repeat`` times and keeps the best and median time per operation.
+
+Baselines are stored as *ratios* to a fixed pure-Python reference workload
+timed in the same run, not as absolute times, so a baseline recorded on one
+machine or interpreter still means something on another: a uniformly faster
+or slower host moves the reference and the benchmarks together.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import contextlib
+from dataclasses import asdict, dataclass, field
+import gc
+import inspect
+import json
+from pathlib import Path
+import platform
+import statistics
+import sys
+import time
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+__all__ = [
+    "BenchContext",
+    "BenchResult",
+    "Regression",
+    "benchmark",
+    "compare",
+    "load_baseline",
+    "measure_reference",
+    "registry",
+    "run_benchmarks",
+    "save_baseline",
+]
+
+Op = Callable[[], Any]
+Factory = Callable[["BenchContext"], Awaitable[Op]]
+
+_REGISTRY: dict[str, Factory] = {}
+
+REFERENCE = "reference"
+_REFERENCE_DATA = [(i * 7919) % 10007 for i in range(2000)]  # fixed permutation
+
+
+def benchmark(name: str) -> Callable[[Factory], Factory]:
+    """Register *factory* under *name* (names must be unique)."""
+
+    def decorator(factory: Factory) -> Factory:
+        if name in _REGISTRY:
+            raise ValueError(f"duplicate benchmark name: {name}")
+        _REGISTRY[name] = factory
+        return factory
+
+    return decorator
+
+
+def registry() -> dict[str, Factory]:
+    return dict(_REGISTRY)
+
+
+@dataclass
+class BenchContext:
+    """Fixtures shared by all benchmarks of one run."""
+
+    session_factory: async_sessionmaker[AsyncSession]
+    cleanup: contextlib.AsyncExitStack = field(
+        default_factory=contextlib.AsyncExitStack
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class BenchResult:
+    name: str
+    best_ns: float
+    median_ns: float
+    loops: int
+    repeat: int
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    name: str
+    baseline_ns: float  # baseline ratio × this run's reference time
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns
+
+
+async def _time_loop(op: Op, is_async: bool, loops: int) -> float:
+    # Like timeit: keep the cyclic GC from landing in random samples.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        if is_async:
+            for _ in range(loops):
+                await op()
+        else:
+            for _ in range(loops):
+                op()
+        return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+async def measure(
+    name: str, op: Op, *, min_time: float = 0.2, repeat: int = 5
+) -> BenchResult:
+    """Time *op* (sync or async) and return per-operation nanoseconds."""
+
+    is_async = inspect.iscoroutinefunction(op)
+    target = min_time / repeat
+    loops = 1
+    while (elapsed := await _time_loop(op, is_async, loops)) < target:
+        # Jump by 10x while far off, then creep up by 2x.
+        loops *= 10 if elapsed * 10 < target else 2
+
+    samples = [await _time_loop(op, is_async, loops) / loops for _ in range(repeat)]
+    return BenchResult(
+        name=name,
+        best_ns=min(samples) * 1e9,
+        median_ns=statistics.median(samples) * 1e9,
+        loops=loops,
+        repeat=repeat,
+    )
+
+
+def _reference_op() -> None:
+    # Sorting, hashing and string formatting: the interpreter work the suite
+    # is made of, with no I/O and no dependency on the code under test.
+    {str(x): x for x in sorted(_REFERENCE_DATA)}
+
+
+async def measure_reference(*, min_time: float = 0.2, repeat: int = 5) -> BenchResult:
+    """Time the reference workload that baselines are expressed against."""
+
+    return await measure(REFERENCE, _reference_op, min_time=min_time, repeat=repeat)
+
+
+async def run_benchmarks(
+    ctx: BenchContext,
+    names: list[str],
+    *,
+    min_time: float = 0.2,
+    repeat: int = 5,
+    on_result: Callable[[BenchResult], None] | None = None,
+) -> list[BenchResult]:
+    """Set up and measure every benchmark in *names*, in order."""
+
+    results = []
+    for name in names:
+        op = await _REGISTRY[name](ctx)
+        result = await measure(name, op, min_time=min_time, repeat=repeat)
+        if on_result is not None:
+            on_result(result)
+        results.append(result)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+def compare(
+    results: list[BenchResult],
+    baseline: dict[str, float],
+    threshold: float,
+    reference_ns: float,
+) -> list[Regression]:
+    """Return the benchmarks slower than baseline × (1 + threshold).
+
+    *baseline* maps names to ratios (see ``load_baseline``); *reference_ns*
+    is this run's reference time, which turns them back into nanoseconds.
+    """
+
+    return [
+        Regression(r.name, baseline[r.name] * reference_ns, r.best_ns)
+        for r in results
+        if r.name in baseline
+        and r.best_ns > baseline[r.name] * reference_ns * (1 + threshold)
+    ]
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    """Return ``{name: best_ns / reference_ns}`` from *path* (empty when missing)."""
+
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text())
+    return {name: entry["ratio"] for name, entry in data["results"].items()}
+
+
+def save_baseline(
+    path: Path, results: list[BenchResult], reference: BenchResult
+) -> None:
+    """Merge *results* into the baseline at *path* (other entries are kept).
+
+    Each entry keeps its absolute times for reference, but only ``ratio`` –
+    the best time over *reference*'s – is compared against.
+    """
+
+    existing: dict[str, Any] = (
+        json.loads(path.read_text())["results"] if path.exists() else {}
+    )
+    for r in results:
+        existing[r.name] = {
+            "ratio": round(r.best_ns / reference.best_ns, 6),
+            **{
+                k: round(v, 1) if isinstance(v, float) else v
+                for k, v in asdict(r).items()
+                if k != "name"
+            },
+        }
+    payload = {
+        "machine": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.machine(),
+            "reference_ns": round(reference.best_ns, 1),
+        },
+        "results": dict(sorted(existing.items())),
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n")
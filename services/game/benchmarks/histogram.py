@@ -0,0 +1,132 @@
+"""HDR-style latency histogram.
+
+Latencies are recorded as whole microseconds into log-linear buckets, the
+layout HdrHistogram uses: values below ``2**bits`` get one bucket each, and
+every further power of two is split into ``2**(bits - 1)`` equal buckets.  The
+relative error of any reported value is therefore below ``2**-(bits - 1)``
+(< 0.8 % for the default ``bits=8``) whatever the range, memory stays
+proportional to the number of *distinct* buckets hit, and two histograms –
+e.g. from separate runs or workers – merge by adding counts.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+import math
+from typing import Any
+
+__all__ = ["PERCENTILES", "LatencyHistogram"]
+
+# Percentiles printed in summaries and stored in JSON results.
+PERCENTILES: tuple[float, ...] = (50.0, 90.0, 95.0, 99.0, 99.9, 100.0)
+
+
+@dataclass
+class LatencyHistogram:
+    """Counts of latencies (µs) in log-linear buckets."""
+
+    bits: int = 8
+    counts: Counter[int] = field(default_factory=Counter)
+    total: int = 0
+    sum_us: int = 0
+    min_us: int = 0
+    max_us: int = 0
+
+    # -- bucket layout -----------------------------------------------------
+    def _index(self, value: int) -> int:
+        linear = 1 << self.bits
+        if value < linear:
+            return value
+        shift = value.bit_length() - self.bits
+        half = linear >> 1
+        return linear + (shift - 1) * half + ((value >> shift) - half)
+
+    def _highest_equivalent(self, index: int) -> int:
+        linear = 1 << self.bits
+        if index < linear:
+            return index
+        half = linear >> 1
+        shift, offset = divmod(index - linear, half)
+        shift += 1
+        return ((half + offset + 1) << shift) - 1
+
+    # -- recording ---------------------------------------------------------
+    def record(self, seconds: float) -> None:
+        value = max(0, round(seconds * 1e6))
+        self.counts[self._index(value)] += 1
+        if self.total == 0 or value < self.min_us:
+            self.min_us = value
+        self.max_us = max(self.max_us, value)
+        self.total += 1
+        self.sum_us += value
+
+    def merge(self, other: LatencyHistogram) -> None:
+        if other.bits != self.bits:
+            raise ValueError("cannot merge histograms with different precision")
+        if other.total == 0:
+            return
+        self.min_us = (
+            other.min_us if self.total == 0 else min(self.min_us, other.min_us)
+        )
+        self.max_us = max(self.max_us, other.max_us)
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.sum_us += other.sum_us
+
+    # -- queries -----------------------------------------------------------
+    @property
+    def mean_us(self) -> float:
+        return self.sum_us / self.total if self.total else 0.0
+
+    def percentile(self, pct: float) -> int:
+        """Return the latency (µs) at or below which *pct* % of samples fall.
+
+        Like HdrHistogram this is the highest value equivalent to the bucket
+        that holds the requested rank, clamped to the exact min/max seen.
+        """
+
+        if self.total == 0:
+            return 0
+        rank = max(1, math.ceil(pct / 100 * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                value = self._highest_equivalent(index)
+                return max(self.min_us, min(value, self.max_us))
+        return self.max_us
+
+    def distribution(self) -> Iterator[tuple[int, float, int]]:
+        """Yield ``(value_us, percentile, cumulative count)`` per non-empty bucket."""
+
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            value = min(self._highest_equivalent(index), self.max_us)
+            yield value, seen / self.total, seen
+
+    # -- (de)serialisation -------------------------------------------------
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.total,
+            "min_us": self.min_us,
+            "mean_us": round(self.mean_us, 1),
+            "max_us": self.max_us,
+            "sum_us": self.sum_us,
+            "percentiles_us": {f"p{p:g}": self.percentile(p) for p in PERCENTILES},
+            "bits": self.bits,
+            "buckets": {str(i): n for i, n in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LatencyHistogram:
+        return cls(
+            bits=data["bits"],
+            counts=Counter({int(i): n for i, n in data["buckets"].items()}),
+            total=data["count"],
+            sum_us=data["sum_us"],
+            min_us=data["min_us"],
+            max_us=data["max_us"],
+        )
@@ -0,0 +1,438 @@
+"""Closed-loop load generator for the public API.
+
+Run from ``services/game``::
+
+    python -m benchmarks.load                                  # in-process, 10 s
+    python -m benchmarks.load --url http://127.0.0.1:8000 -c 64 -d 30
+    python -m benchmarks.load --mix play_smart=3,history=1 --json > run.json
+    python -m benchmarks.load --compare run.json               # diff against a run
+
+``--concurrency`` workers each loop "pick an endpoint from the weighted mix →
+send → wait for the response".  By default requests go straight into the
+FastAPI ``app`` through ``httpx.ASGITransport`` – the application lifespan
+runs as usual, but the randomness API is answered by the in-process
+``benchmarks.stub_api`` (``--latency``, ``--error-rate``, … inject faults;
+``--live-random-api`` calls the real one) and logs are discarded.  Rounds go
+to a throwaway SQLite database created for the run; ``--database-url`` points
+the app elsewhere, but the tables are created without an Alembic stamp, so
+anything but SQLite is refused unless ``--allow-non-sqlite`` is given.  With
+``--url`` the same workload is sent to a running server instead, e.g.
+``uvicorn app.main:app``.
+
+Latencies land in one HDR-style histogram per endpoint.  Being a closed
+loop, the generator slows down with the server, so tail percentiles are
+those seen at the achieved throughput, not at a fixed arrival rate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator, Callable, Sequence
+import contextlib
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+from typing import Any
+
+import httpx
+from sqlalchemy.engine import make_url
+
+from app.core.config import get_settings
+from app.core.http_client import close_http_client, init_http_client
+from app.utils.enums import Mode
+from benchmarks.histogram import PERCENTILES, LatencyHistogram
+from benchmarks.offline import devnull_logs
+from benchmarks.stub_api import (
+    RandomApiStub,
+    add_profile_arguments,
+    profile_from_args,
+)
+
+__all__ = [
+    "DEFAULT_MIX",
+    "ENDPOINTS",
+    "Endpoint",
+    "LoadResult",
+    "asgi_client",
+    "parse_mix",
+    "run_load",
+]
+
+# Distinct player ids used by the /play workloads.
+_PLAYERS = 100
+
+
+@dataclass(frozen=True, slots=True)
+class Endpoint:
+    method: str
+    path: str
+    body: Callable[[random.Random], dict[str, Any]] | None = None
+
+
+def _play(mode: Mode) -> Callable[[random.Random], dict[str, Any]]:
+    def body(rng: random.Random) -> dict[str, Any]:
+        return {
+            "player": rng.randint(1, 5),
+            "mode": mode,
+            "player_id": f"load-{rng.randrange(_PLAYERS)}",
+        }
+
+    return body
+
+
+ENDPOINTS: dict[str, Endpoint] = {
+    "play_random": Endpoint("POST", "/play", _play(Mode.RANDOM)),
+    "play_smart": Endpoint("POST", "/play", _play(Mode.SMART)),
+    "history": Endpoint("GET", "/history?limit=20"),
+    "choices": Endpoint("GET", "/choices"),
+}
+
+DEFAULT_MIX = "play_random=4,play_smart=4,history=1,choices=1"
+
+
+def parse_mix(spec: str) -> dict[str, int]:
+    """Parse ``name=weight,...`` (a bare name means weight 1)."""
+
+    mix: dict[str, int] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, weight = item.partition("=")
+        if name not in ENDPOINTS:
+            raise ValueError(
+                f"unknown endpoint {name!r}; choose from {list(ENDPOINTS)}"
+            )
+        try:
+            mix[name] = int(weight or 1)
+        except ValueError:
+            raise ValueError(f"weight for {name!r} must be an integer") from None
+        if mix[name] < 0:
+            raise ValueError(f"weight for {name!r} must not be negative")
+    if not any(mix.values()):
+        raise ValueError("the workload mix is empty")
+    return mix
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+@dataclass
+class EndpointStats:
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: int = 0
+
+
+@dataclass
+class LoadResult:
+    target: str
+    concurrency: int
+    duration_s: float
+    endpoints: dict[str, EndpointStats]
+    # Responses served by the in-process random API stub, by kind.
+    upstream: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def overall(self) -> EndpointStats:
+        total = EndpointStats()
+        for stats in self.endpoints.values():
+            total.histogram.merge(stats.histogram)
+            total.errors += stats.errors
+        return total
+
+    def rps(self, stats: EndpointStats) -> float:
+        return stats.histogram.total / self.duration_s if self.duration_s else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "target": self.target,
+            "concurrency": self.concurrency,
+            "duration_s": round(self.duration_s, 3),
+            "endpoints": {
+                name: {
+                    "rps": round(self.rps(stats), 1),
+                    "errors": stats.errors,
+                    "latency": stats.histogram.to_dict(),
+                }
+                for name, stats in {**self.endpoints, "all": self.overall}.items()
+            },
+            "upstream": self.upstream,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LoadResult:
+        return cls(
+            target=data["target"],
+            concurrency=data["concurrency"],
+            duration_s=data["duration_s"],
+            endpoints={
+                name: EndpointStats(
+                    LatencyHistogram.from_dict(entry["latency"]), entry["errors"]
+                )
+                for name, entry in data["endpoints"].items()
+                if name != "all"
+            },
+            upstream=data.get("upstream", {}),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+async def run_load(
+    client: httpx.AsyncClient,
+    mix: dict[str, int],
+    *,
+    concurrency: int = 16,
+    duration: float = 10.0,
+    warmup: float = 1.0,
+    requests: int | None = None,
+    seed: int = 0,
+    target: str = "asgi",
+) -> LoadResult:
+    """Drive *client* with the weighted *mix* and return per-endpoint stats.
+
+    Requests started during the first *warmup* seconds are not recorded.  The
+    run stops after *duration* measured seconds or *requests* measured
+    requests, whichever comes first.
+    """
+
+    names = [name for name, weight in mix.items() if weight]
+    weights = [mix[name] for name in names]
+    stats = {name: EndpointStats() for name in names}
+    budget = requests if requests is not None else -1
+    measure_from = time.perf_counter() + warmup
+    deadline = measure_from + duration
+
+    async def worker(rng: random.Random) -> None:
+        nonlocal budget
+        while (start := time.perf_counter()) < deadline and budget != 0:
+            name = rng.choices(names, weights)[0]
+            endpoint = ENDPOINTS[name]
+            recorded = start >= measure_from
+            if recorded and budget > 0:
+                budget -= 1
+            body = endpoint.body(rng) if endpoint.body is not None else None
+            try:
+                response = await client.request(
+                    endpoint.method, endpoint.path, json=body
+                )
+                failed = response.is_error
+            except httpx.HTTPError:
+                failed = True
+            if recorded:
+                stats[name].histogram.record(time.perf_counter() - start)
+                stats[name].errors += failed
+
+    await asyncio.gather(*(worker(random.Random(seed + i)) for i in range(concurrency)))
+    elapsed = min(time.perf_counter(), deadline) - measure_from
+    return LoadResult(target, concurrency, max(elapsed, 0.0), stats)
+
+
+def _is_sqlite(database_url: str) -> bool:
+    return make_url(database_url).get_backend_name() == "sqlite"
+
+
+@contextlib.asynccontextmanager
+async def asgi_client(
+    *,
+    random_api: httpx.AsyncBaseTransport | None,
+    allow_non_sqlite: bool = False,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield a client wired straight into ``app`` with its lifespan running.
+
+    Outbound randomness requests go through the *random_api* transport, or
+    to the real ``RANDOM_API_URL`` when it is ``None``.  The schema is
+    created with ``create_all`` (no Alembic stamp), so databases other than
+    SQLite are refused unless *allow_non_sqlite* is set.
+    """
+
+    # Imported here so the CLI can pick DATABASE_URL before settings are read.
+    from app.db.database import Base, get_engine
+    from app.main import app
+
+    engine = get_engine()
+
+    if not allow_non_sqlite and engine.url.get_backend_name() != "sqlite":
+        raise ValueError(
+            f"refusing to create tables in {engine.url!r}; "
+            "pass allow_non_sqlite=True (--allow-non-sqlite) to load-test it"
+        )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    if random_api is not None:
+        await close_http_client()
+        init_http_client(transport=random_api)  # the lifespan reuses it
+
+    base_url = f"http://loadtest{get_settings().API_V1_STR}"
+    with devnull_logs():
+        async with (
+            app.router.lifespan_context(app),
+            httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url=base_url
+            ) as client,
+        ):
+            yield client
+
+
+@contextlib.asynccontextmanager
+async def url_client(url: str, concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield a keep-alive client for a running server at *url*."""
+
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    base_url = url.rstrip("/") + get_settings().API_V1_STR
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30
+    ) as client:
+        yield client
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load",
+        description="Closed-loop load test of /play, /history and /choices.",
+    )
+    parser.add_argument("--url", help="running server to target (default: in-process)")
+    parser.add_argument("-c", "--concurrency", type=int, default=16)
+    parser.add_argument("-d", "--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--warmup", type=float, default=1.0, help="unrecorded seconds")
+    parser.add_argument("-n", "--requests", type=int, help="stop after N requests")
+    parser.add_argument(
+        "--mix", default=DEFAULT_MIX, help=f"endpoint weights (default: {DEFAULT_MIX})"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--database-url",
+        help="in-process only: database to write to (default: a throwaway SQLite)",
+    )
+    parser.add_argument(
+        "--allow-non-sqlite",
+        action="store_true",
+        help="accept a non-SQLite --database-url (its tables get no Alembic stamp)",
+    )
+    parser.add_argument(
+        "--live-random-api",
+        action="store_true",
+        help="in-process only: call RANDOM_API_URL instead of the local stub",
+    )
+    add_profile_arguments(parser)
+    parser.add_argument(
+        "--hdr", action="store_true", help="print the full distribution"
+    )
+    parser.add_argument("--compare", type=Path, help="earlier --json result to diff")
+    parser.add_argument("--json", action="store_true", help="emit JSON instead")
+    args = parser.parse_args(argv)
+    try:
+        args.mix = parse_mix(args.mix)
+        args.profile = profile_from_args(args)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.database_url and not (
+        args.allow_non_sqlite or _is_sqlite(args.database_url)
+    ):
+        parser.error(
+            "--database-url is not SQLite; create_all would leave it without an "
+            "Alembic stamp – pass --allow-non-sqlite to use it anyway"
+        )
+    return args
+
+
+def _ms(us: float) -> str:
+    return f"{us / 1000:8.2f}"
+
+
+def _print_summary(result: LoadResult, previous: LoadResult | None) -> None:
+    print(
+        f"target: {result.target}  concurrency: {result.concurrency}  "
+        f"measured: {result.duration_s:.1f} s"
+    )
+    header = "".join(f"{f'p{p:g}':>9}" for p in PERCENTILES)
+    print(f"{'endpoint':<12} {'requests':>9} {'errors':>7} {'req/s':>9} {header}  (ms)")
+    rows = {**result.endpoints, "all": result.overall}
+    old = {**previous.endpoints, "all": previous.overall} if previous else {}
+    for name, stats in rows.items():
+        hist = stats.histogram
+        pcts = " ".join(_ms(hist.percentile(p)) for p in PERCENTILES)
+        print(
+            f"{name:<12} {hist.total:>9} {stats.errors:>7} "
+            f"{result.rps(stats):>9.1f} {pcts}"
+        )
+        if previous is not None and name in old:
+            before = old[name]
+            delta_rps = result.rps(stats) / (previous.rps(before) or 1) - 1
+            p99 = before.histogram.percentile(99)
+            delta_p99 = hist.percentile(99) / (p99 or 1) - 1
+            print(
+                f"{'':<12} vs. previous: req/s {delta_rps:+.1%}, p99 {delta_p99:+.1%}"
+            )
+    if result.upstream:
+        served = ", ".join(f"{kind}={n}" for kind, n in sorted(result.upstream.items()))
+        print(f"random API stub served: {served}")
+
+
+def _print_distribution(hist: LatencyHistogram) -> None:
+    print(f"\n{'Value(ms)':>12} {'Percentile':>14} {'TotalCount':>12}")
+    for value_us, fraction, count in hist.distribution():
+        print(f"{value_us / 1000:12.3f} {fraction:14.6f} {count:12}")
+
+
+async def _run(args: argparse.Namespace, database_dir: str) -> LoadResult:
+    stub = None
+    if args.url:
+        client_context = url_client(args.url, args.concurrency)
+    else:
+        os.environ["DATABASE_URL"] = (
+            args.database_url or f"sqlite+aiosqlite:///{database_dir}/load.db"
+        )
+        if args.live_random_api:
+            random_api = None
+        else:
+            stub = RandomApiStub(args.profile, seed=args.seed)
+            random_api = httpx.ASGITransport(app=stub)
+        client_context = asgi_client(
+            random_api=random_api, allow_non_sqlite=args.allow_non_sqlite
+        )
+
+    async with client_context as client:
+        result = await run_load(
+            client,
+            args.mix,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            warmup=args.warmup,
+            requests=args.requests,
+            seed=args.seed,
+            target=args.url or "asgi",
+        )
+    if stub is not None:
+        result.upstream = dict(stub.served)
+    return result
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="rpsls-load-") as database_dir:
+        result = asyncio.run(_run(args, database_dir))
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        previous = None
+        if args.compare is not None:
+            previous = LoadResult.from_dict(json.loads(args.compare.read_text()))
+        _print_summary(result, previous)
+        if args.hdr:
+            _print_distribution(result.overall.histogram)
+    return 1 if result.overall.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
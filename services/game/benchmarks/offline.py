@@ -0,0 +1,49 @@
+"""Offline stand-ins shared by the benchmarks and the load generator."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import contextlib
+import logging
+import os
+import random
+
+import httpx
+import structlog
+
+from app.core.log_queue import QueueLoggerFactory
+
+__all__ = ["devnull_logs", "stub_random_api"]
+
+
+def _random_api(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+    return httpx.Response(200, json={"random_number": random.randint(1, 100)})
+
+
+def stub_random_api() -> httpx.MockTransport:
+    """Return a transport answering the randomness API locally."""
+
+    return httpx.MockTransport(_random_api)
+
+
+@contextlib.contextmanager
+def devnull_logs() -> Iterator[None]:
+    """Keep rendering structlog events (their cost is real) but discard them.
+
+    With the background log queue configured, its writer thread is pointed at
+    ``os.devnull`` instead.  Stdlib records (e.g. httpx's per-request INFO
+    lines) are disabled as well.
+    """
+
+    config = structlog.get_config()
+    disabled = logging.root.manager.disable
+    with open(os.devnull, "w") as devnull, contextlib.ExitStack() as stack:  # noqa: PTH123
+        factory = config["logger_factory"]
+        if isinstance(factory, QueueLoggerFactory):
+            stack.enter_context(factory.sink.redirect(devnull))
+        else:
+            structlog.configure(logger_factory=structlog.PrintLoggerFactory(devnull))
+            stack.callback(lambda: structlog.configure(**config))
+        logging.disable(logging.CRITICAL)
+        stack.callback(logging.disable, disabled)
+        yield
@@ -0,0 +1,140 @@
+"""Cold-start import budget for the service.
+
+Imports ``app.main`` in fresh interpreters under ``-X importtime`` and
+reports the median total, the packages that account for it and whether any
+module meant to load lazily slipped into the import graph::
+
+    python -m benchmarks.startup                  # 5 runs, 700 ms budget
+    python -m benchmarks.startup --budget-ms 900 --top 20
+
+The default budget is the median import time of ``app.main`` before the
+performance work started (commit ``d1df718``), so the service may not start
+slower than it used to.  Exits with status 1 when the median exceeds
+``--budget-ms`` (or ``STARTUP_BUDGET_MS``) or a deferred module is imported at
+startup.  The interpreter's own start-up (``site``, encodings, …) is not
+counted.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+__all__ = ["DEFERRED_MODULES", "ImportProfile", "import_profile", "parse_importtime"]
+
+# Only needed by rarely used endpoints, or (DB drivers) once the engine is
+# first used; must not be imported by ``app.main``.
+DEFERRED_MODULES = ("numpy", "cProfile", "aiosqlite", "asyncpg")
+
+_ROOT = Path(__file__).resolve().parents[1]  # .../services/game
+# Median of 11 runs of ``import app.main`` at d1df718 on the reference machine.
+_DEFAULT_BUDGET_MS = 700.0
+
+
+@dataclass(frozen=True, slots=True)
+class ImportProfile:
+    """One interpreter's ``-X importtime`` report for the target module."""
+
+    total_us: int
+    self_us: dict[str, int]  # module -> self time
+
+    def by_package(self) -> Counter[str]:
+        """Self time summed per top-level package."""
+
+        packages: Counter[str] = Counter()
+        for module, us in self.self_us.items():
+            packages[module.partition(".")[0]] += us
+        return packages
+
+
+def parse_importtime(stderr: str, module: str) -> ImportProfile:
+    """Parse ``-X importtime`` output, keeping the subtree of *module*."""
+
+    rows: list[tuple[str, int, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative, name = line.removeprefix("import time:").split("|")
+        rows.append((name.rstrip(), int(self_us), int(cumulative)))
+
+    # Children are printed before their parent; the target is the last row
+    # at its depth, and its subtree is every deeper row just before it.
+    for end in range(len(rows) - 1, -1, -1):
+        if rows[end][0].strip() == module:
+            break
+    else:
+        raise ValueError(f"{module!r} not found in -X importtime output")
+    name, _, total = rows[end]
+    depth = len(name) - len(name.lstrip())
+    start = end
+    while start > 0:
+        prev = rows[start - 1][0]
+        if len(prev) - len(prev.lstrip()) <= depth:
+            break
+        start -= 1
+    return ImportProfile(total, {n.strip(): us for n, us, _ in rows[start : end + 1]})
+
+
+def import_profile(module: str = "app.main") -> ImportProfile:
+    """Import *module* in a fresh interpreter and return its profile."""
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr, module)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Measure the import time of the service and enforce a budget.",
+    )
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("STARTUP_BUDGET_MS", _DEFAULT_BUDGET_MS)),
+        help="fail when the median import time exceeds this (default: %(default)s)",
+    )
+    parser.add_argument("--top", type=int, default=12, help="packages to list")
+    args = parser.parse_args(argv)
+
+    import_profile(args.module)  # warm the OS page cache and __pycache__
+    profiles = [import_profile(args.module) for _ in range(args.runs)]
+    median_ms = statistics.median(p.total_us for p in profiles) / 1000
+    best_ms = min(p.total_us for p in profiles) / 1000
+
+    fastest = min(profiles, key=lambda p: p.total_us)
+    print(f"{'package':<32}{'self ms':>10}")
+    for package, us in fastest.by_package().most_common(args.top):
+        print(f"{package:<32}{us / 1000:>10.1f}")
+    print(
+        f"\nimport {args.module}: median {median_ms:.1f} ms, best {best_ms:.1f} ms "
+        f"({args.runs} runs, budget {args.budget_ms:.0f} ms)"
+    )
+
+    failed = False
+    leaked = [m for m in DEFERRED_MODULES if m in fastest.self_us]
+    if leaked:
+        print(f"deferred modules imported at startup: {', '.join(leaked)}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"over budget by {median_ms - args.budget_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""Local stand-in for ``RANDOM_API_URL`` with latency and failure injection.
+
+Serve it on a port and point the service at it::
+
+    python -m benchmarks.stub_api --port 9100 --latency lognormal:20ms:0.6 \\
+        --error-rate 0.02 --timeout-rate 0.005 --malformed-rate 0.01
+    RANDOM_API_URL=http://127.0.0.1:9100/random uvicorn app.main:app
+
+or mount it in-process with ``httpx.ASGITransport(app=RandomApiStub(...))``
+(``python -m benchmarks.load`` accepts the same flags).  Any ``GET`` path
+answers with the public API's contract, ``{"random_number": 1-100}``, after
+a delay drawn from the configured distribution – except for the injected
+faults:
+
+* **error**     – ``--error-status`` (503) with a JSON error body,
+* **timeout**   – no answer for ``--hang`` seconds, then a 504,
+* **malformed** – 200 with an HTML page, truncated JSON, a non-numeric or a
+  missing ``random_number``.
+
+``GET /_stub/stats`` returns how many responses of each kind were served.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import json
+import math
+import random
+import sys
+
+from starlette.types import Receive, Scope, Send
+import uvicorn
+
+__all__ = [
+    "FaultProfile",
+    "Latency",
+    "RandomApiStub",
+    "add_profile_arguments",
+    "profile_from_args",
+]
+
+_STATS_PATH = "/_stub/stats"
+
+# Payloads served for "malformed" responses, picked uniformly.
+_MALFORMED: tuple[tuple[bytes, bytes], ...] = (
+    (b"text/html", b"<html><body>502 Bad Gateway</body></html>"),
+    (b"application/json", b'{"random_number": 4'),
+    (b"application/json", b'{"random_number": "seven"}'),
+    (b"application/json", b"{}"),
+)
+
+
+def _seconds(text: str) -> float:
+    """Parse ``250us`` / ``20ms`` / ``1.5s`` / ``0.02`` (bare = seconds)."""
+
+    for suffix, scale in (("us", 1e-6), ("ms", 1e-3), ("s", 1.0)):
+        if text.endswith(suffix):
+            return float(text.removesuffix(suffix)) * scale
+    return float(text)
+
+
+@dataclass(frozen=True, slots=True)
+class Latency:
+    """A response-delay distribution (all times in seconds).
+
+    ``fixed:a`` · ``uniform:a:b`` · ``exp:mean`` · ``lognormal:median:sigma`` ·
+    ``pareto:scale:alpha`` (heavy tail: ``scale × Pareto(alpha)``).
+    """
+
+    kind: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    # kind -> parsers for its parameters
+    _KINDS = {
+        "fixed": (_seconds,),
+        "uniform": (_seconds, _seconds),
+        "exp": (_seconds,),
+        "lognormal": (_seconds, float),
+        "pareto": (_seconds, float),
+    }
+
+    @classmethod
+    def parse(cls, spec: str) -> Latency:
+        """Parse ``kind:param[:param]``; a bare duration means ``fixed``."""
+
+        kind, *params = spec.split(":")
+        if kind not in cls._KINDS:
+            kind, params = "fixed", [spec]
+        parsers = cls._KINDS[kind]
+        if len(params) != len(parsers):
+            raise ValueError(f"{kind!r} latency takes {len(parsers)} parameter(s)")
+        try:
+            values = [parse(p) for parse, p in zip(parsers, params, strict=True)]
+        except ValueError:
+            raise ValueError(f"invalid latency spec {spec!r}") from None
+        if any(v < 0 for v in values) or (kind == "pareto" and values[1] == 0):
+            raise ValueError(f"invalid latency spec {spec!r}")
+        return cls(kind, *values)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "exp":
+            return rng.expovariate(1 / self.a) if self.a else 0.0
+        if self.kind == "lognormal":
+            return rng.lognormvariate(math.log(self.a), self.b) if self.a else 0.0
+        if self.kind == "pareto":
+            return self.a * rng.paretovariate(self.b)
+        return self.a
+
+
+@dataclass(frozen=True, slots=True)
+class FaultProfile:
+    """How the stub misbehaves; the three rates are per-request probabilities."""
+
+    latency: Latency = field(default_factory=Latency)
+    error_rate: float = 0.0
+    error_status: int = 503
+    timeout_rate: float = 0.0
+    hang: float = 60.0
+    malformed_rate: float = 0.0
+
+    def __post_init__(self) -> None:
+        rates = (self.error_rate, self.timeout_rate, self.malformed_rate)
+        if any(not 0 <= r <= 1 for r in rates) or sum(rates) > 1:
+            raise ValueError("fault rates must be within 0-1 and sum to at most 1")
+
+
+class RandomApiStub:
+    """ASGI app speaking the ``{"random_number": n}`` contract, with faults."""
+
+    def __init__(self, profile: FaultProfile | None = None, *, seed: int | None = None):
+        self.profile = profile or FaultProfile()
+        self.served: Counter[str] = Counter()
+        self._rng = random.Random(seed)
+
+    def _outcome(self) -> str:
+        profile = self.profile
+        roll = self._rng.random()
+        for outcome, rate in (
+            ("error", profile.error_rate),
+            ("timeout", profile.timeout_rate),
+            ("malformed", profile.malformed_rate),
+        ):
+            if roll < rate:
+                return outcome
+            roll -= rate
+        return "ok"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            while (await receive())["type"] != "lifespan.shutdown":
+                await send({"type": "lifespan.startup.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+        if scope["path"] == _STATS_PATH:
+            await _respond(send, 200, json.dumps(self.served).encode())
+            return
+
+        outcome = self._outcome()
+        self.served[outcome] += 1
+        if outcome == "timeout":
+            await asyncio.sleep(self.profile.hang)
+            await _respond(send, 504, b'{"detail": "injected timeout"}')
+            return
+
+        await asyncio.sleep(self.profile.latency.sample(self._rng))
+        if outcome == "error":
+            await _respond(send, self.profile.error_status, b'{"detail": "injected"}')
+        elif outcome == "malformed":
+            content_type, body = self._rng.choice(_MALFORMED)
+            await _respond(send, 200, body, content_type)
+        else:
+            body = json.dumps({"random_number": self._rng.randint(1, 100)}).encode()
+            await _respond(send, 200, body)
+
+
+async def _respond(
+    send: Send, status: int, body: bytes, content_type: bytes = b"application/json"
+) -> None:
+    headers = [(b"content-type", content_type), (b"content-length", b"%d" % len(body))]
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``FaultProfile`` flags (shared with ``benchmarks.load``)."""
+
+    group = parser.add_argument_group("random API stub")
+    group.add_argument(
+        "--latency",
+        type=Latency.parse,
+        default=Latency(),
+        help="fixed:20ms | uniform:5ms:50ms | exp:10ms | lognormal:20ms:0.6 | "
+        "pareto:5ms:1.5 (default: 0)",
+    )
+    group.add_argument("--error-rate", type=float, default=0.0)
+    group.add_argument("--error-status", type=int, default=503)
+    group.add_argument("--timeout-rate", type=float, default=0.0)
+    group.add_argument(
+        "--hang", type=_seconds, default=60.0, help="delay of a timeout (default: 60s)"
+    )
+    group.add_argument("--malformed-rate", type=float, default=0.0)
+
+
+def profile_from_args(args: argparse.Namespace) -> FaultProfile:
+    return FaultProfile(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        timeout_rate=args.timeout_rate,
+        hang=args.hang,
+        malformed_rate=args.malformed_rate,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.stub_api",
+        description="Serve a fault-injecting stand-in for RANDOM_API_URL.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--seed", type=int)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        profile = profile_from_args(args)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    stub = RandomApiStub(profile, seed=args.seed)
+    print(f"random API stub on http://{args.host}:{args.port}/random – {profile}")
+    uvicorn.run(stub, host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+"""Benchmarks for the game hot paths.
+
+Everything runs offline: the database is an in-memory aiosqlite engine and
+the randomness API is answered by an ``httpx.MockTransport``.  Log events
+are still rendered (their cost is part of the hot path) but written to
+``os.devnull``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+import contextlib
+from datetime import UTC, datetime
+import random
+from typing import Any
+import uuid
+
+from fastapi import FastAPI
+import numpy as np
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.core.http_client import close_http_client, init_http_client
+from app.core.middleware import RequestIdMiddleware
+from app.core.timing import ServerTimingMiddleware
+from app.core.responses import default_response_class
+from app.db.database import Base
+from app.models.game import Game
+from app.repositories.game_repository import GameRepository
+from app.schemas.game import GameRead, PlayRequest
+from app.services.game_service import GameService
+from app.utils import ai as ai_utils
+from app.utils.enums import Choice, GameResult, Mode
+from app.utils.game_logic import (
+    decide_winner,
+    decide_winners,
+    random_choice,
+    reset_random_api_guard,
+)
+from app.utils.markov import MarkovPredictor
+from benchmarks.harness import BenchContext, Op, benchmark
+from benchmarks.offline import devnull_logs, stub_random_api
+
+__all__ = ["offline_context"]
+
+# Rows preloaded for the read benchmarks.
+_SEED_ROWS = 10_000
+
+
+@contextlib.asynccontextmanager
+async def offline_context() -> AsyncIterator[BenchContext]:
+    """Yield a ``BenchContext`` backed by in-memory SQLite and a stub API."""
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    await close_http_client()
+    init_http_client(transport=stub_random_api())
+    reset_random_api_guard()
+
+    with devnull_logs():
+        ctx = BenchContext(async_sessionmaker(engine, expire_on_commit=False))
+        try:
+            async with ctx.cleanup:
+                yield ctx
+        finally:
+            await close_http_client()
+            await engine.dispose()
+
+
+# ---------------------------------------------------------------------------
+# Pure game logic
+# ---------------------------------------------------------------------------
+@benchmark("decide_winner")
+async def _decide_winner(ctx: BenchContext) -> Op:  # noqa: ARG001
+    player, computer = Choice.LIZARD, Choice.SPOCK  # keep enum lookups out
+    return lambda: decide_winner(player, computer)
+
+
+@benchmark("decide_winners[10k]")
+async def _decide_winners(ctx: BenchContext) -> Op:  # noqa: ARG001
+    rng = np.random.default_rng(0)
+    players = rng.integers(1, 6, size=10_000, dtype=np.uint8)
+    computers = rng.integers(1, 6, size=10_000, dtype=np.uint8)
+    return lambda: decide_winners(players, computers)
+
+
+@benchmark("smart_choice")
+async def _smart_choice(ctx: BenchContext) -> Op:  # noqa: ARG001
+    history = [Choice.ROCK, Choice.PAPER, Choice.ROCK, Choice.SPOCK, Choice.ROCK]
+    return lambda: ai_utils.smart_choice(history, window=5)
+
+
+@benchmark("markov_round")
+async def _markov_round(ctx: BenchContext) -> Op:  # noqa: ARG001
+    predictor = MarkovPredictor(order=2)
+    predictor.replay(random.choices(list(Choice), k=1_000))
+
+    move = Choice.PAPER
+
+    def op() -> None:
+        predictor.choose()
+        predictor.observe(move)
+
+    return op
+
+
+# ---------------------------------------------------------------------------
+# Schemas
+# ---------------------------------------------------------------------------
+@benchmark("play_request_validate")
+async def _play_request(ctx: BenchContext) -> Op:  # noqa: ARG001
+    payload = {"player": 3, "mode": "smart", "player_id": "bench"}
+    return lambda: PlayRequest.model_validate(payload)
+
+
+@benchmark("game_read_serialize")
+async def _game_read(ctx: BenchContext) -> Op:  # noqa: ARG001
+    game = Game(
+        id=uuid.uuid4(),
+        player_choice=Choice.ROCK,
+        computer_choice=Choice.SPOCK,
+        winner=GameResult.COMPUTER,
+        created_at=datetime.now(UTC),
+    )
+    return lambda: GameRead.from_model(game).model_dump_json()
+
+
+# ---------------------------------------------------------------------------
+# Middleware – per-request overhead around a trivial ASGI app
+# ---------------------------------------------------------------------------
+_SCOPE: Scope = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "POST",
+    "scheme": "http",
+    "path": "/api/v1/play",
+    "raw_path": b"/api/v1/play",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"host", b"bench"), (b"content-type", b"application/json")],
+    "client": ("127.0.0.1", 50000),
+    "server": ("bench", 80),
+}
+
+
+async def _ok_app(scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG001
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def _asgi_request(app: ASGIApp, **scope: Any) -> Op:
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    async def op() -> None:
+        await app({**_SCOPE, **scope}, receive, send)
+
+    return op
+
+
+@benchmark("middleware[none]")
+async def _middleware_none(ctx: BenchContext) -> Op:  # noqa: ARG001
+    return _asgi_request(_ok_app)
+
+
+@benchmark("middleware[request_id]")
+async def _middleware_request_id(ctx: BenchContext) -> Op:  # noqa: ARG001
+    return _asgi_request(RequestIdMiddleware(_ok_app))
+
+
+@benchmark("middleware[server_timing]")
+async def _middleware_server_timing(ctx: BenchContext) -> Op:  # noqa: ARG001
+    return _asgi_request(ServerTimingMiddleware(_ok_app))
+
+
+@benchmark("middleware[app_stack]")
+async def _middleware_app_stack(ctx: BenchContext) -> Op:  # noqa: ARG001
+    """CORS, request id and Server-Timing, in the order ``app.main`` adds them."""
+
+    cors = CORSMiddleware(_ok_app, allow_origins=["*"], allow_methods=["*"])
+    return _asgi_request(ServerTimingMiddleware(RequestIdMiddleware(cors)))
+
+
+@benchmark("middleware[base_http_passthrough]")
+async def _middleware_base_http(ctx: BenchContext) -> Op:  # noqa: ARG001
+    """Reference: an empty ``@app.middleware("http")`` costs this much."""
+
+    return _asgi_request(
+        BaseHTTPMiddleware(
+            _ok_app, dispatch=lambda request, call_next: call_next(request)
+        )
+    )
+
+
+# ---------------------------------------------------------------------------
+# Response rendering – a 50-item response_model list, FastAPI default vs orjson
+# ---------------------------------------------------------------------------
+def _list_app(orjson_responses: bool) -> FastAPI:
+    settings = get_settings().model_copy(update={"ORJSON_RESPONSES": orjson_responses})
+    app = FastAPI(default_response_class=default_response_class(settings))
+    games = [
+        GameRead.from_model(
+            Game(
+                id=uuid.uuid4(),
+                player_choice=Choice.ROCK,
+                computer_choice=Choice.SPOCK,
+                winner=GameResult.COMPUTER,
+                created_at=datetime.now(UTC),
+            )
+        )
+        for _ in range(50)
+    ]
+
+    @app.get("/games", response_model=list[GameRead])
+    async def _games() -> list[GameRead]:
+        return games
+
+    return app
+
+
+@benchmark("response_model_list[default]")
+async def _response_default(ctx: BenchContext) -> Op:  # noqa: ARG001
+    return _asgi_request(
+        _list_app(orjson_responses=False),
+        method="GET",
+        path="/games",
+        raw_path=b"/games",
+    )
+
+
+@benchmark("response_model_list[orjson]")
+async def _response_orjson(ctx: BenchContext) -> Op:  # noqa: ARG001
+    return _asgi_request(
+        _list_app(orjson_responses=True),
+        method="GET",
+        path="/games",
+        raw_path=b"/games",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Database (aiosqlite) and outbound API (mock transport)
+# ---------------------------------------------------------------------------
+@benchmark("repo_add_commit")
+async def _repo_add(ctx: BenchContext) -> Op:
+    async def op() -> None:
+        async with ctx.session_factory() as session:
+            await GameRepository(session).add(
+                Choice.ROCK, Choice.PAPER, GameResult.COMPUTER
+            )
+            await session.commit()
+
+    return op
+
+
+@benchmark("repo_list_recent[50]")
+async def _repo_list_recent(ctx: BenchContext) -> Op:
+    async with ctx.session_factory() as session:
+        repo = GameRepository(session)
+        await repo.add_many(
+            [
+                (Choice(1 + i % 5), Choice.ROCK, GameResult.TIE)
+                for i in range(_SEED_ROWS)
+            ]
+        )
+        await session.commit()
+
+    async def op() -> None:
+        async with ctx.session_factory() as session:
+            await GameRepository(session).list_recent(limit=50)
+
+    return op
+
+
+@benchmark("random_choice[stub_api]")
+async def _random_choice(ctx: BenchContext) -> Op:  # noqa: ARG001
+    return random_choice
+
+
+@benchmark("game_service_play[random]")
+async def _service_play(ctx: BenchContext) -> Op:
+    async def op() -> None:
+        async with ctx.session_factory() as session:
+            await GameService(GameRepository(session)).play(Choice.SPOCK, Mode.RANDOM)
+            await session.commit()
+
+    return op
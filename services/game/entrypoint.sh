@@ -1,19 +1,28 @@
 #!/usr/bin/env bash
 # Entry point for the RPSLS Game Service container.
 #
-# 1. Applies any pending Alembic migrations (safe to run repeatedly).
+# 1. Applies any pending Alembic migrations (safe to run repeatedly).  A quick
+#    check of the alembic_version table skips Alembic's ~1 s bootstrap when
+#    the schema is already at head.
 # 2. Launches Uvicorn under PID 1 so it receives signals correctly.
 #
 # Environment variables respected:
 #   - HOST (default: 0.0.0.0)
 #   - PORT (default: 8000)
-#   - WORKERS (optional): number of Uvicorn workers.
+#   - WORKERS (optional): number of Uvicorn workers.  Enables Prometheus
+#     multi-process mode so /metrics aggregates every worker.
+#   - PROMETHEUS_MULTIPROC_DIR (default with WORKERS: /tmp/prometheus-multiproc):
+#     directory for the workers' metric files; stale files are removed here.
 #
 # Fail fast on any error and propagate signals.
 set -euo pipefail
 
-# Run migrations (no-op if already at head)
-alembic upgrade head
+# Run migrations unless the database is already at head
+if PYTHONPATH="services/game${PYTHONPATH:+:$PYTHONPATH}" python -m app.db.migration_check; then
+    echo "Database schema is at head – skipping Alembic"
+else
+    alembic upgrade head
+fi
 
 # Start the FastAPI service
 HOST="${HOST:-0.0.0.0}"
@@ -23,6 +32,11 @@ APP_MODULE="${ASGI_APP:-services.game.app.main:app}"
 
 # shellcheck disable=SC2236
 if [[ -n "${WORKERS:-}" ]]; then
+    # Each worker writes its metrics to mmap'ed files that /metrics merges.
+    # Files left by a previous container run would be counted again.
+    export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus-multiproc}"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+    find "$PROMETHEUS_MULTIPROC_DIR" -maxdepth 1 -name '*.db' -delete
     exec uvicorn "$APP_MODULE" --host "$HOST" --port "$PORT" --workers "$WORKERS"
 else
     exec uvicorn "$APP_MODULE" --host "$HOST" --port "$PORT"
@@ -17,7 +17,7 @@ sys.path.append(str(PROJECT_ROOT))
 
 from app.core.config import get_settings
 from app.db.database import Base
-from app.db.database import engine as sa_engine
+from app.db.database import get_engine
 
 # ---------------------------------------------------------------------------
 # Alembic configuration
@@ -67,7 +67,7 @@ def do_run_migrations(connection: Connection) -> None:
 def run_migrations_online() -> None:  # noqa: D401 – imperative mood
     """Run migrations in *online* mode."""
 
-    connectable: AsyncEngine = sa_engine
+    connectable: AsyncEngine = get_engine()
 
     async def run_async_migrations() -> None:  # noqa: D401 – imperative mood
         async with connectable.connect() as connection:
@@ -0,0 +1,48 @@
+"""Index game(created_at, id) for recent-history reads and keyset pagination.
+
+Revision ID: 20250720120000
+Revises: 20250704120000
+Create Date: 2025-07-20 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20250720120000"
+down_revision = "20250704120000"
+branch_labels = None
+depends_on = None
+
+_INDEX = "ix_game_created_at_id"
+
+
+def upgrade() -> None:  # noqa: D401 – imperative mood
+    """Apply the migration."""
+
+    if op.get_context().dialect.name == "postgresql":
+        # CONCURRENTLY avoids locking writes on a large table but cannot run
+        # inside a transaction block.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                _INDEX,
+                "game",
+                ["created_at", "id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        op.create_index(_INDEX, "game", ["created_at", "id"], if_not_exists=True)
+
+
+def downgrade() -> None:  # noqa: D401 – imperative mood
+    """Rollback the migration."""
+
+    if op.get_context().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                _INDEX, table_name="game", postgresql_concurrently=True, if_exists=True
+            )
+    else:
+        op.drop_index(_INDEX, table_name="game", if_exists=True)
@@ -0,0 +1,51 @@
+"""Create game_stats aggregates table and backfill it from existing games.
+
+Revision ID: 20250801120000
+Revises: 20250720120000
+Create Date: 2025-08-01 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20250801120000"
+down_revision = "20250720120000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:  # noqa: D401 – imperative mood
+    """Apply the migration."""
+
+    op.create_table(
+        "game_stats",
+        sa.Column("dimension", sa.String(16), nullable=False),
+        sa.Column("bucket", sa.String(16), nullable=False),
+        sa.Column("total", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("dimension", "bucket", name="pk__game_stats"),
+    )
+
+    # Backfill from rows played before the aggregates existed.  The strategy
+    # of those rounds was never stored, so they are counted as mode 'unknown'.
+    op.execute(
+        """
+        INSERT INTO game_stats (dimension, bucket, total)
+        SELECT 'outcome', CAST(winner AS VARCHAR), COUNT(*) FROM game
+        GROUP BY winner
+        UNION ALL
+        SELECT 'gesture', LOWER(CAST(player_choice AS VARCHAR)), COUNT(*) FROM game
+        GROUP BY player_choice
+        UNION ALL
+        SELECT 'mode', 'unknown', COUNT(*) FROM game
+        HAVING COUNT(*) > 0
+        """
+    )
+
+
+def downgrade() -> None:  # noqa: D401 – imperative mood
+    """Rollback the migration."""
+
+    op.drop_table("game_stats")
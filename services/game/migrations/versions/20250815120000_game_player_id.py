@@ -0,0 +1,68 @@
+"""Add game.player_id and the per-player (player_id, created_at DESC) index.
+
+Revision ID: 20250815120000
+Revises: 20250801120000
+Create Date: 2025-08-15 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20250815120000"
+down_revision = "20250801120000"
+branch_labels = None
+depends_on = None
+
+_INDEX = "ix_game_player_id_created_at"
+_COLUMNS: list[str | sa.TextClause] = [
+    "player_id",
+    sa.text("created_at DESC"),
+    sa.text("id DESC"),
+]
+
+
+def upgrade() -> None:  # noqa: D401 – imperative mood
+    """Apply the migration."""
+
+    # Nullable without a default: a catalog-only change, no table rewrite.
+    op.add_column(
+        "game",
+        sa.Column(
+            "player_id",
+            sa.String(64),
+            nullable=True,
+            comment="Opaque client-supplied player identifier (NULL = anonymous)",
+        ),
+    )
+
+    if op.get_context().dialect.name == "postgresql":
+        # CONCURRENTLY avoids locking writes on a large table but cannot run
+        # inside a transaction block.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                _INDEX,
+                "game",
+                _COLUMNS,
+                postgresql_include=["player_choice"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        op.create_index(_INDEX, "game", _COLUMNS, if_not_exists=True)
+
+
+def downgrade() -> None:  # noqa: D401 – imperative mood
+    """Rollback the migration."""
+
+    if op.get_context().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                _INDEX, table_name="game", postgresql_concurrently=True, if_exists=True
+            )
+    else:
+        op.drop_index(_INDEX, table_name="game", if_exists=True)
+
+    op.drop_column("game", "player_id")
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import csv
+import io
+import json
+
 import pytest
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import (
@@ -10,9 +14,11 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core.config import get_settings
-from app.db.database import Base, get_db_session
+from app.core.timing import ServerTimingMiddleware
+from app.db.database import Base, get_db_session, get_session_factory
 from app.utils.enums import Choice
 import app.services.game_service as gs
+from app.api.v1.endpoints import choices
 from app.main import app as fastapi_app
 from collections.abc import AsyncIterator
 
@@ -41,6 +47,7 @@ async def _client_fixture() -> AsyncIterator[AsyncClient]:
 
     # Override dependency
     fastapi_app.dependency_overrides[get_db_session] = _get_test_session
+    fastapi_app.dependency_overrides[get_session_factory] = lambda: session_factory
 
     transport = ASGITransport(app=fastapi_app)
     async with AsyncClient(transport=transport, base_url="http://test") as c:
@@ -53,10 +60,15 @@ async def _client_fixture() -> AsyncIterator[AsyncClient]:
 
 
 @pytest.mark.asyncio
-async def test_choices_endpoints(client: AsyncClient):
+async def test_choices_endpoints(client: AsyncClient, monkeypatch: pytest.MonkeyPatch):
     settings = get_settings()
     prefix = settings.API_V1_STR
 
+    async def _fixed_random_choice() -> Choice:  # noqa: D401
+        return Choice.LIZARD
+
+    monkeypatch.setattr(choices, "random_choice", _fixed_random_choice, raising=True)
+
     resp = await client.get(f"{prefix}/choices")
     assert resp.status_code == 200
     data = resp.json()
@@ -66,7 +78,26 @@ async def test_choices_endpoints(client: AsyncClient):
     resp_rand = await client.get(f"{prefix}/choice")
     assert resp_rand.status_code == 200
     rand_choice = resp_rand.json()
-    assert 1 <= rand_choice["id"] <= 5
+    assert rand_choice["id"] == Choice.LIZARD.value
+
+
+@pytest.mark.asyncio
+async def test_choices_support_conditional_requests(client: AsyncClient):
+    url = f"{get_settings().API_V1_STR}/choices"
+
+    first = await client.get(url)
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"].startswith("public, max-age=")
+    assert first.json() == [{"id": c.value, "name": c.name.lower()} for c in Choice]
+
+    cached = await client.get(url, headers={"If-None-Match": f'"stale", W/{etag}'})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    stale = await client.get(url, headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == first.content
 
 
 @pytest.mark.asyncio
@@ -103,3 +134,244 @@ async def test_play_and_history_endpoints(
     history_after = await client.get(f"{prefix}/history")
     assert history_after.status_code == 200
     assert history_after.json() == []
+
+
+@pytest.mark.asyncio
+async def test_play_batch_endpoint(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    settings = get_settings()
+    prefix = settings.API_V1_STR
+
+    async def _fixed_random_choice() -> Choice:  # noqa: D401
+        return Choice.SCISSORS
+
+    monkeypatch.setattr(gs, "random_choice", _fixed_random_choice, raising=True)
+
+    rounds = [{"player": Choice.ROCK.value}, {"player": Choice.PAPER.value}]
+    resp = await client.post(f"{prefix}/play/batch", json={"rounds": rounds})
+    assert resp.status_code == 201
+    assert resp.json() == [
+        {"results": "win", "player": Choice.ROCK.value, "computer": 3},
+        {"results": "lose", "player": Choice.PAPER.value, "computer": 3},
+    ]
+
+    history = await client.get(f"{prefix}/history")
+    # Newest first – the batch keeps its play order.
+    assert [g["player"] for g in history.json()] == [
+        Choice.PAPER.value,
+        Choice.ROCK.value,
+    ]
+
+    too_many = [{"player": 1}] * (settings.PLAY_BATCH_MAX_ROUNDS + 1)
+    resp = await client.post(f"{prefix}/play/batch", json={"rounds": too_many})
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_history_filters_by_player(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    prefix = get_settings().API_V1_STR
+
+    async def _fixed_random_choice() -> Choice:  # noqa: D401
+        return Choice.PAPER
+
+    monkeypatch.setattr(gs, "random_choice", _fixed_random_choice, raising=True)
+
+    await client.post(f"{prefix}/play", json={"player": 1, "player_id": "ann"})
+    await client.post(f"{prefix}/play", json={"player": 2})
+    await client.post(
+        f"{prefix}/play/batch",
+        json={"rounds": [{"player": 3, "player_id": "ann", "mode": "smart"}]},
+    )
+
+    resp = await client.get(f"{prefix}/history", params={"player_id": "ann"})
+    assert [(g["player"], g["player_id"]) for g in resp.json()] == [
+        (3, "ann"),
+        (1, "ann"),
+    ]
+    assert len((await client.get(f"{prefix}/history")).json()) == 3
+
+
+@pytest.mark.asyncio
+async def test_history_keyset_pagination(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    settings = get_settings()
+    prefix = settings.API_V1_STR
+
+    async def _fixed_random_choice() -> Choice:  # noqa: D401
+        return Choice.ROCK
+
+    monkeypatch.setattr(gs, "random_choice", _fixed_random_choice, raising=True)
+
+    rounds = [{"player": (i % 5) + 1} for i in range(5)]
+    await client.post(f"{prefix}/play/batch", json={"rounds": rounds})
+
+    seen: list[dict] = []
+    cursor: str | None = None
+    while True:
+        params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+        page = await client.get(f"{prefix}/history", params=params)
+        assert page.status_code == 200
+        seen.extend(page.json())
+        cursor = page.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert len({g["id"] for g in seen}) == 5
+    assert [g["player"] for g in seen] == [5, 4, 3, 2, 1]  # newest first
+
+    bad = await client.get(f"{prefix}/history", params={"cursor": "not-a-cursor"})
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_history_export_streams_ndjson_and_csv(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    settings = get_settings()
+    prefix = settings.API_V1_STR
+
+    async def _fixed_random_choice() -> Choice:  # noqa: D401
+        return Choice.ROCK
+
+    monkeypatch.setattr(gs, "random_choice", _fixed_random_choice, raising=True)
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 2)
+
+    rounds = [{"player": p} for p in (1, 2, 3)]
+    await client.post(f"{prefix}/play/batch", json={"rounds": rounds})
+    history = (await client.get(f"{prefix}/history")).json()
+
+    ndjson = await client.get(f"{prefix}/history/export")
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert lines == history  # same layout and order as GameRead
+
+    csv_resp = await client.get(
+        f"{prefix}/history/export",
+        params={"format": "csv"},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert csv_resp.headers["content-encoding"] == "gzip"
+    rows = list(csv.DictReader(io.StringIO(csv_resp.text)))  # httpx decompresses
+    assert [int(r["player"]) for r in rows] == [3, 2, 1]
+    assert list(rows[0]) == [
+        "results",
+        "player",
+        "computer",
+        "id",
+        "timestamp",
+        "player_id",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "accept_encoding,gzipped",
+    [
+        ("gzip", True),
+        ("br;q=1.0, gzip;q=0.5", True),
+        ("br, *;q=0.1", True),
+        ("gzip;q=0", False),
+        ("gzip;q=0.000, *", False),
+        ("*;q=0", False),
+        ("identity, nogzip, gzipx", False),
+        ("", False),
+    ],
+)
+async def test_history_export_honours_gzip_q_values(
+    client: AsyncClient, accept_encoding: str, gzipped: bool
+):
+    resp = await client.get(
+        f"{get_settings().API_V1_STR}/history/export",
+        headers={"Accept-Encoding": accept_encoding},
+    )
+
+    assert resp.status_code == 200
+    assert (resp.headers.get("content-encoding") == "gzip") is gzipped
+
+
+@pytest.mark.asyncio
+async def test_stats_endpoint_tracks_and_resets(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    settings = get_settings()
+    prefix = settings.API_V1_STR
+
+    async def _fixed_random_choice() -> Choice:  # noqa: D401
+        return Choice.ROCK
+
+    monkeypatch.setattr(gs, "random_choice", _fixed_random_choice, raising=True)
+
+    await client.post(f"{prefix}/play", json={"player": Choice.PAPER.value})
+    await client.post(
+        f"{prefix}/play/batch",
+        json={"rounds": [{"player": 3}, {"player": 1}]},
+    )
+
+    stats = (await client.get(f"{prefix}/stats")).json()
+    assert stats["total"] == 3
+    assert stats["outcomes"] == {"win": 1, "lose": 1, "tie": 1}
+    assert stats["modes"]["random"] == 3
+    assert stats["gestures"] == {
+        "rock": 1,
+        "paper": 1,
+        "scissors": 1,
+        "lizard": 0,
+        "spock": 0,
+    }
+
+    await client.delete(f"{prefix}/history")
+    cleared = (await client.get(f"{prefix}/stats")).json()
+    assert cleared["total"] == 0
+    assert set(cleared["modes"].values()) == {0}
+
+
+@pytest.mark.asyncio
+async def test_server_timing_is_off_by_default(client: AsyncClient):
+    resp = await client.post(
+        f"{get_settings().API_V1_STR}/play", json={"player": 1, "mode": "smart"}
+    )
+
+    assert resp.status_code == 201
+    assert "Server-Timing" not in resp.headers
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("client")  # in-memory DB overrides on fastapi_app
+async def test_play_reports_stage_timings(monkeypatch: pytest.MonkeyPatch):
+    """The /play commit lands in the header, whatever order FastAPI tears down
+    yield dependencies in relative to sending the response."""
+
+    prefix = get_settings().API_V1_STR
+
+    async def _fixed_random_choice() -> Choice:  # noqa: D401
+        return Choice.PAPER
+
+    monkeypatch.setattr(gs, "random_choice", _fixed_random_choice, raising=True)
+
+    def stages(resp) -> list[str]:
+        header = resp.headers["Server-Timing"]
+        return [part.split(";")[0] for part in header.split(", ")]
+
+    # Same position as in app.main when SERVER_TIMING_ENABLED is set: outermost.
+    transport = ASGITransport(app=ServerTimingMiddleware(fastapi_app))
+    async with AsyncClient(transport=transport, base_url="http://test") as timed:
+        random_round = await timed.post(f"{prefix}/play", json={"player": 1})
+        smart_round = await timed.post(
+            f"{prefix}/play", json={"player": 1, "mode": "smart"}
+        )
+        batch = await timed.post(
+            f"{prefix}/play/batch",
+            json={"rounds": [{"player": 1, "mode": "smart"}]},
+        )
+        history = await timed.get(f"{prefix}/history")
+
+    assert stages(random_round) == ["entropy", "persist", "commit", "total"]
+    assert stages(smart_round) == ["history", "ai", "persist", "commit", "total"]
+    assert stages(batch) == ["commit", "total"]
+    assert stages(history) == ["total"]
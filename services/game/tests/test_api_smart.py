@@ -56,7 +56,7 @@ async def test_play_smart_mode(
 
     # Monkeypatch smart_choice to deterministic return
     monkeypatch.setattr(
-        ai_mod, "smart_choice", lambda _hist: Choice.SPOCK, raising=True
+        ai_mod, "smart_choice", lambda _hist, **_kw: Choice.SPOCK, raising=True
     )
 
     settings = get_settings()
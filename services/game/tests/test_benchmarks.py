@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.harness import (
+    BenchResult,
+    compare,
+    load_baseline,
+    measure,
+    registry,
+    save_baseline,
+)
+
+
+def _result(name, best_ns):
+    return BenchResult(name, best_ns, best_ns, loops=10, repeat=3)
+
+
+def test_compare_flags_only_slowdowns_beyond_the_threshold():
+    baseline = {"fast": 2.0, "slow": 2.0, "gone": 2.0}  # × the reference time
+    results = [_result("fast", 240.0), _result("slow", 260.0), _result("new", 1e9)]
+
+    regressions = compare(results, baseline, threshold=0.25, reference_ns=100.0)
+
+    assert [r.name for r in regressions] == ["slow"]
+    assert regressions[0].baseline_ns == 200.0
+    assert regressions[0].ratio == pytest.approx(1.3)
+
+
+def test_compare_scales_the_baseline_with_the_reference():
+    """A host twice as slow overall is not a regression."""
+
+    baseline = {"op": 2.0}
+
+    assert compare([_result("op", 400.0)], baseline, 0.25, reference_ns=200.0) == []
+    assert compare([_result("op", 400.0)], baseline, 0.25, reference_ns=100.0)
+
+
+def test_save_baseline_merges_with_existing_entries(tmp_path):
+    path = tmp_path / "baseline.json"
+    assert load_baseline(path) == {}
+
+    reference = _result("reference", 5.0)
+    save_baseline(path, [_result("a", 10.0), _result("b", 20.0)], reference)
+    save_baseline(path, [_result("b", 25.0)], reference)
+
+    assert load_baseline(path) == {"a": 2.0, "b": 5.0}
+    machine = json.loads(path.read_text())["machine"]
+    assert "python" in machine
+    assert machine["reference_ns"] == 5.0
+
+
+@pytest.mark.asyncio
+async def test_measure_times_sync_and_async_ops():
+    calls = 0
+
+    async def op():
+        nonlocal calls
+        calls += 1
+
+    result = await measure("noop", op, min_time=0.01, repeat=2)
+
+    assert calls >= result.loops * result.repeat
+    assert 0 < result.best_ns <= result.median_ns
+    assert (await measure("sync", lambda: None, min_time=0.01)).best_ns > 0
+
+
+def test_cli_runs_offline_and_fails_on_regression(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    args = ["-k", "decide_winner", "--min-time", "0.01", "--baseline", str(baseline)]
+
+    assert main([*args, "--update"]) == 0
+    assert set(load_baseline(baseline)) == {"decide_winner", "decide_winners[10k]"}
+
+    # Pretend the committed baseline was impossibly fast.
+    data = json.loads(baseline.read_text())
+    data["results"]["decide_winner"]["ratio"] = 1e-6
+    baseline.write_text(json.dumps(data))
+
+    assert main(args) == 1
+    assert "decide_winner:" in capsys.readouterr().out
+
+
+def test_every_registered_benchmark_runs(tmp_path):
+    assert len(registry()) >= 10
+    baseline = tmp_path / "baseline.json"
+    args = ["--min-time", "0.001", "--repeat", "1", "--baseline", str(baseline)]
+
+    assert main([*args, "--update"]) == 0
+    assert set(load_baseline(baseline)) == set(registry())
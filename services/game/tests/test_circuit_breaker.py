@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.utils import game_logic as gl
+from app.utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    LatencyWindow,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_half_opens_and_closes():
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow_request()
+
+    clock.now = 10.0
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow_request()  # single probe …
+    assert not breaker.allow_request()  # … and only one
+
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_failed_probe_reopens_circuit():
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=5, clock=clock)
+
+    breaker.record_failure()
+    clock.now = 5.0
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow_request()
+
+
+def test_latency_window_percentiles():
+    window = LatencyWindow(size=100, min_samples=10)
+    for i in range(5):
+        window.observe(i / 100)
+    assert window.percentile(95) is None  # not enough samples yet
+
+    for i in range(5, 100):
+        window.observe(i / 100)
+    assert window.percentile(50) == pytest.approx(0.49)
+    assert window.percentile(99) == pytest.approx(0.98)
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_short_circuits_without_network(monkeypatch):
+    gl.reset_random_api_guard()
+    calls = 0
+
+    class ErrorClient:
+        async def get(self, _url):
+            nonlocal calls
+            calls += 1
+            raise gl.asyncio.TimeoutError()
+
+    monkeypatch.setattr(gl, "get_http_client", ErrorClient)
+    threshold = gl.get_settings().RANDOM_API_BREAKER_THRESHOLD
+
+    for _ in range(threshold):
+        with pytest.raises(TimeoutError):
+            await gl.fetch_random_number()
+
+    with pytest.raises(CircuitOpenError):
+        await gl.fetch_random_number()
+    assert calls == threshold
+
+    gl.reset_random_api_guard()
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_returns_fastest_response(monkeypatch):
+    responses = iter([(0.5, 1), (0.0, 2)])  # first call slow, hedge fast
+
+    async def _fake_request(_url: str) -> tuple[int, int]:
+        delay, value = next(responses)
+        await asyncio.sleep(delay)
+        return value, 200
+
+    monkeypatch.setattr(gl, "_request_random_number", _fake_request)
+
+    assert await gl._hedged_request("http://stub", hedge_delay=0.01) == (2, 200)
@@ -46,3 +46,14 @@ def test_version_is_non_empty(monkeypatch: pytest.MonkeyPatch):
 
     settings = _fresh_settings(monkeypatch)
     assert isinstance(settings.VERSION, str) and settings.VERSION
+
+
+def test_entropy_refill_concurrency_is_capped(monkeypatch: pytest.MonkeyPatch):
+    """A refill must not be able to burst the public random API."""
+
+    settings = _fresh_settings(monkeypatch)
+    assert settings.ENTROPY_BUFFER_SIZE == 32
+    assert settings.ENTROPY_REFILL_CONCURRENCY == 4
+
+    with pytest.raises(ValueError):
+        _fresh_settings(monkeypatch, ENTROPY_REFILL_CONCURRENCY="64")
@@ -0,0 +1,22 @@
+from datetime import UTC, datetime
+import uuid
+
+import pytest
+
+from app.utils.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    ts = datetime(2025, 7, 20, 12, 0, 0, 123456, tzinfo=UTC)
+    game_id = uuid.uuid4()
+
+    token = encode_cursor(ts, game_id)
+
+    assert "=" not in token
+    assert decode_cursor(token) == (ts, game_id)
+
+
+@pytest.mark.parametrize("token", ["", "###", "bm90LWEtY3Vyc29y"])
+def test_cursor_rejects_garbage(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token)
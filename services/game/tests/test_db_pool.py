@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import Settings
+from app.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_WAIT_SECONDS,
+    DB_POOL_OVERFLOW,
+)
+from app.db.pool import InstrumentedPool, engine_options, instrument_pool
+
+
+def _wait_count() -> float:
+    return next(
+        s.value
+        for metric in DB_POOL_CHECKOUT_WAIT_SECONDS.collect()
+        for s in metric.samples
+        if s.name.endswith("_count")
+    )
+
+
+def test_in_memory_sqlite_keeps_its_static_pool():
+    settings = Settings(DATABASE_URL="sqlite+aiosqlite://", DB_POOL_PRE_PING=False)
+
+    assert engine_options(settings) == {"pool_pre_ping": False}
+
+
+def test_asyncpg_gets_pool_sizing_and_statement_cache():
+    settings = Settings(
+        DATABASE_URL="postgresql+asyncpg://u:p@db/rpsls",
+        DB_POOL_SIZE=20,
+        DB_MAX_OVERFLOW=0,
+        DB_POOL_RECYCLE=1800,
+        DB_STATEMENT_CACHE_SIZE=0,
+    )
+
+    assert engine_options(settings) == {
+        "pool_pre_ping": True,
+        "poolclass": InstrumentedPool,
+        "pool_size": 20,
+        "max_overflow": 0,
+        "pool_timeout": 30.0,
+        "pool_recycle": 1800,
+        "connect_args": {"prepared_statement_cache_size": 0},
+    }
+
+
+@pytest.mark.asyncio
+async def test_pool_reports_checkouts_overflow_and_wait(tmp_path: Path):
+    settings = Settings(
+        DATABASE_URL=f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        DB_POOL_SIZE=1,
+        DB_MAX_OVERFLOW=1,
+        DB_POOL_TIMEOUT=0.05,
+    )
+    engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings))
+    instrument_pool(engine.sync_engine)
+    waits_before = _wait_count()
+
+    try:
+        async with engine.connect() as first, engine.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+            assert DB_POOL_CHECKED_OUT._value.get() == 2
+            assert DB_POOL_OVERFLOW._value.get() == 1
+
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        assert DB_POOL_CHECKED_OUT._value.get() == 0
+        assert DB_POOL_OVERFLOW._value.get() == 0  # overflow connection closed
+        assert _wait_count() == waits_before + 3
+
+        # dispose() recreates the pool; the listeners come along.
+        await engine.dispose()
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert DB_POOL_CHECKED_OUT._value.get() == 1
+        assert DB_POOL_CHECKED_OUT._value.get() == 0
+        assert _wait_count() == waits_before + 4
+    finally:
+        await engine.dispose()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+import pytest
+
+from app.utils import game_logic as gl
+from app.utils.entropy import EntropyBuffer
+from app.utils.enums import Choice
+
+
+def _counting_fetch():
+    counter = itertools.count(1)
+
+    async def _fetch() -> int:
+        return next(counter)
+
+    return _fetch
+
+
+@pytest.mark.asyncio
+async def test_refill_tops_up_to_capacity_in_fifo_order():
+    buf = EntropyBuffer(_counting_fetch(), capacity=10, low_water=3, concurrency=4)
+
+    added = await buf.refill()
+
+    assert added == 10
+    assert len(buf) == 10
+    assert [buf.pop() for _ in range(3)] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_refill_stops_on_failing_upstream():
+    async def _failing() -> int:
+        raise RuntimeError("upstream down")
+
+    buf = EntropyBuffer(_failing, capacity=10, low_water=3)
+
+    assert await buf.refill() == 0
+    assert buf.pop() is None
+
+
+@pytest.mark.asyncio
+async def test_background_task_refills_below_low_water():
+    buf = EntropyBuffer(_counting_fetch(), capacity=4, low_water=2, concurrency=2)
+    buf.start()
+    try:
+        for _ in range(50):
+            if len(buf) == 4:
+                break
+            await asyncio.sleep(0)
+        assert len(buf) == 4
+
+        buf.pop()
+        buf.pop()
+        buf.pop()  # depth 1 < low-water → refill is signalled
+        for _ in range(50):
+            if len(buf) == 4:
+                break
+            await asyncio.sleep(0)
+        assert len(buf) == 4
+    finally:
+        await buf.stop()
+
+
+@pytest.mark.asyncio
+async def test_random_choice_pops_from_buffer(monkeypatch):
+    async def _never_called() -> int:
+        raise AssertionError("random_choice must not hit the network")
+
+    buf = EntropyBuffer(_never_called, capacity=2, low_water=0)
+    buf._items.extend([42])
+    monkeypatch.setattr(gl, "get_entropy_buffer", lambda: buf)
+    monkeypatch.setattr(gl.random, "randint", lambda _a, _b: 3)  # noqa: ARG005
+
+    assert await gl.random_choice() is list(Choice)[(42 - 1) % 5]
+    # Buffer is now dry → local PRNG fallback.
+    assert await gl.random_choice() is list(Choice)[(3 - 1) % 5]
@@ -1,6 +1,10 @@
+import httpx
+
 from app.utils import game_logic as gl
+from app.utils.circuit_breaker import CircuitState
 from app.utils.enums import Choice, GameResult
 import pytest
+from structlog.testing import capture_logs
 
 
 @pytest.mark.parametrize(
@@ -43,7 +47,9 @@ def test_decide_winner_exhaustive(player, computer):
 async def test_random_choice_endpoint(monkeypatch):
     """*random_choice* should use the external endpoint when available."""
 
-    # Stub ``httpx.AsyncClient`` so no real HTTP request is made
+    gl.reset_random_api_guard()
+
+    # Stub the shared HTTP client so no real HTTP request is made
     class DummyResp:  # minimal subset used by the code under test
         def __init__(self, num: int):
             self._num = num
@@ -56,19 +62,10 @@ async def test_random_choice_endpoint(monkeypatch):
             return {"random_number": self._num}
 
     class DummyClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def get(self, _url):  # noqa: ARG002 – param required by interface
             return DummyResp(42)
 
-    monkeypatch.setattr(gl.httpx, "AsyncClient", DummyClient)
+    monkeypatch.setattr(gl, "get_http_client", DummyClient)
 
     choice = await gl.random_choice()
     expected_idx = (42 - 1) % 5
@@ -79,23 +76,81 @@ async def test_random_choice_endpoint(monkeypatch):
 async def test_random_choice_fallback(monkeypatch):
     """When the HTTP call fails the function must fall back to *random* module."""
 
+    gl.reset_random_api_guard()
+
     # Force the http client to raise so we hit the fallback branch
     class ErrorClient:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def get(self, _url):
-            raise gl.httpx.HTTPError("boom")
+            raise httpx.HTTPError("boom")
 
-    monkeypatch.setattr(gl.httpx, "AsyncClient", ErrorClient)
+    monkeypatch.setattr(gl, "get_http_client", ErrorClient)
     monkeypatch.setattr(gl.random, "randint", lambda _a, _b: 3)  # noqa: ARG005 – deterministic stub
 
     choice = await gl.random_choice()
     expected_idx = (3 - 1) % 5
     assert choice is list(Choice)[expected_idx]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [200, 503])
+async def test_random_api_logs_carry_the_status_code(monkeypatch, status):
+    """Success and fallback log lines both say what the upstream answered."""
+
+    gl.reset_random_api_guard()
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda _req: httpx.Response(status, json={"random_number": 7})
+        )
+    )
+    monkeypatch.setattr(gl, "get_http_client", lambda: client)
+
+    with capture_logs() as logs:
+        await gl.random_choice()
+    await client.aclose()
+
+    event = "random_api" if status == 200 else "random_api_fallback"
+    assert [e["status_code"] for e in logs if e["event"] == event] == [status]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload",
+    [{}, {"random_number": 0}, {"random_number": 101}, {"random_number": None}],
+)
+async def test_missing_or_out_of_range_numbers_fall_back(monkeypatch, payload):
+    """Only 1-100 is a valid answer; anything else takes the PRNG path."""
+
+    gl.reset_random_api_guard()
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _req: httpx.Response(200, json=payload))
+    )
+    monkeypatch.setattr(gl, "get_http_client", lambda: client)
+    monkeypatch.setattr(gl.random, "randint", lambda _a, _b: 3)  # noqa: ARG005
+
+    with capture_logs() as logs:
+        choice = await gl.random_choice()
+    await client.aclose()
+
+    assert choice is list(Choice)[2]
+    assert [e["event"] for e in logs] == ["random_api_fallback"]
+
+
+@pytest.mark.asyncio
+async def test_missing_random_number_counts_as_an_upstream_failure(monkeypatch):
+    """A payload without the field no longer maps to index 0 (always SPOCK):
+    it is an upstream fault, so it feeds the circuit breaker like a 5xx."""
+
+    gl.reset_random_api_guard()
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _req: httpx.Response(200, json={}))
+    )
+    monkeypatch.setattr(gl, "get_http_client", lambda: client)
+    monkeypatch.setattr(gl.random, "randint", lambda _a, _b: 1)  # noqa: ARG005
+
+    threshold = gl.get_settings().RANDOM_API_BREAKER_THRESHOLD
+    choices = [await gl.random_choice() for _ in range(threshold)]
+    await client.aclose()
+
+    assert set(choices) == {Choice.ROCK}
+    assert gl._random_api_breaker().state is CircuitState.OPEN
+    gl.reset_random_api_guard()
@@ -1,7 +1,8 @@
 import app.services.game_service as gs
+import app.services.move_history as mh
 from app.services.game_service import GameService
 from app.utils import game_logic as gl
-from app.utils.enums import Choice
+from app.utils.enums import Choice, Mode
 import pytest
 
 
@@ -11,10 +12,16 @@ class DummyRepository:
     def __init__(self):
         self.add_calls: list[tuple] = []
 
-    async def add(self, player_choice, computer_choice, winner):  # noqa: D401 – mimic repo
+    async def add(self, player_choice, computer_choice, winner, player_id=None):  # noqa: ARG002, D401 – mimic repo
         self.add_calls.append((player_choice, computer_choice, winner))
         return object()  # sentinel value to verify passthrough
 
+    async def increment_stats(self, rounds):  # noqa: D401 – mimic repo
+        self.stats_calls = list(rounds)
+
+    def on_rollback(self, callback):
+        pass
+
 
 @pytest.mark.asyncio
 async def test_play_uses_random_choice_and_repo(monkeypatch):
@@ -23,7 +30,7 @@ async def test_play_uses_random_choice_and_repo(monkeypatch):
     sentinel = object()
 
     class SentinelRepo(DummyRepository):
-        async def add(self, player_choice, computer_choice, winner):
+        async def add(self, player_choice, computer_choice, winner, player_id=None):  # noqa: ARG002
             self.add_calls.append((player_choice, computer_choice, winner))
             return sentinel
 
@@ -50,3 +57,92 @@ async def test_play_uses_random_choice_and_repo(monkeypatch):
 
     # Service should return whatever the repository returns (sentinel object)
     assert result is sentinel
+
+    # Aggregates are bumped alongside the insert
+    assert dummy_repo.stats_calls == [(Mode.RANDOM, player_move, recorded_winner)]
+
+
+@pytest.mark.asyncio
+async def test_play_batch_smart_sees_earlier_batch_moves(monkeypatch):
+    """Smart rounds in a batch must be fed the moves played before them."""
+
+    class BatchRepo:
+        def __init__(self):
+            self.batches: list[list[tuple]] = []
+
+        async def recent_moves(self, limit, player_id=None):  # noqa: ARG002
+            return []
+
+        async def add_many(self, rounds, player_ids=None):
+            self.batches.append(
+                [(*r, pid) for r, pid in zip(rounds, player_ids, strict=True)]
+            )
+            return rounds
+
+        async def increment_stats(self, rounds):
+            self.stats = list(rounds)
+
+        def on_rollback(self, callback):
+            pass
+
+    seen: list[list[Choice]] = []
+
+    def fake_smart_choice(history, *, window=5):  # noqa: ARG001
+        seen.append(list(history))
+        return Choice.PAPER
+
+    monkeypatch.setattr(gs.ai_utils, "smart_choice", fake_smart_choice)
+
+    async def fake_random_choice():
+        return Choice.LIZARD
+
+    monkeypatch.setattr(gs, "random_choice", fake_random_choice)
+
+    monkeypatch.setattr(mh, "_CACHE", mh.RecentMovesCache(5, max_players=10))
+
+    repo = BatchRepo()
+    service = GameService(repo)  # type: ignore[arg-type]
+    await service.play_batch(
+        [
+            (Choice.ROCK, Mode.RANDOM, "ann"),
+            (Choice.SPOCK, Mode.SMART, "ann"),
+            (Choice.PAPER, Mode.SMART, "bob"),
+            (Choice.SCISSORS, Mode.SMART, "ann"),
+        ]
+    )
+
+    # Each player only sees their own moves, including unpersisted ones.
+    assert seen == [[Choice.ROCK], [], [Choice.SPOCK, Choice.ROCK]]
+    assert len(repo.batches) == 1
+    assert [r[1] for r in repo.batches[0]] == [
+        Choice.LIZARD,
+        Choice.PAPER,
+        Choice.PAPER,
+        Choice.PAPER,
+    ]
+    assert [r[3] for r in repo.batches[0]] == ["ann", "ann", "bob", "ann"]
+
+
+@pytest.mark.asyncio
+async def test_play_smart_reads_window_not_repository(monkeypatch):
+    """Smart mode is fed from the in-memory window; every round extends it."""
+
+    cache = mh.RecentMovesCache(3, max_players=10)
+    cache.load(None, [Choice.PAPER, Choice.ROCK])
+    monkeypatch.setattr(mh, "_CACHE", cache)
+
+    seen: list[tuple[list[Choice], int]] = []
+
+    def fake_smart_choice(history, *, window=5):
+        seen.append((list(history), window))
+        return Choice.SPOCK
+
+    monkeypatch.setattr(gs.ai_utils, "smart_choice", fake_smart_choice)
+
+    repo = DummyRepository()  # no recent_moves – a DB read would raise
+    await GameService(repo).play(Choice.LIZARD, Mode.SMART)  # type: ignore[arg-type]
+
+    assert seen == [([Choice.PAPER, Choice.ROCK], 3)]
+    recent = cache.get(None)
+    assert recent is not None
+    assert recent.snapshot() == [Choice.LIZARD, Choice.PAPER, Choice.ROCK]
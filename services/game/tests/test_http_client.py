@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+from app.core import http_client as hc
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused_and_closed():
+    """The pooled client must be created once and torn down on close."""
+
+    await hc.close_http_client()
+
+    client = hc.init_http_client()
+    assert hc.get_http_client() is client
+    assert hc.init_http_client() is client  # idempotent
+
+    await hc.close_http_client()
+    assert client.is_closed
+
+    # A closed client is transparently replaced on next access.
+    fresh = hc.get_http_client()
+    assert fresh is not client and not fresh.is_closed
+    await hc.close_http_client()
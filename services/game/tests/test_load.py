@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from benchmarks.histogram import LatencyHistogram
+from benchmarks.load import LoadResult, _parse_args, parse_mix, run_load
+
+
+def test_histogram_percentiles_stay_within_relative_precision():
+    hist = LatencyHistogram()
+    for us in range(1, 100_001):  # 1 µs … 100 ms, uniform
+        hist.record(us / 1e6)
+
+    for pct in (50, 90, 99, 99.9):
+        exact = pct / 100 * 100_000
+        assert hist.percentile(pct) == pytest.approx(exact, rel=2 ** -(hist.bits - 1))
+    assert hist.percentile(100) == hist.max_us == 100_000
+    assert hist.percentile(0) == hist.min_us == 1
+    assert len(hist.counts) < 2_000  # buckets, not samples
+
+
+def test_histograms_merge_and_round_trip():
+    a, b = LatencyHistogram(), LatencyHistogram()
+    for ms in (1, 2, 3):
+        a.record(ms / 1000)
+    b.record(0.0005)
+
+    a.merge(b)
+    restored = LatencyHistogram.from_dict(a.to_dict())
+
+    assert (restored.total, restored.min_us, restored.max_us) == (4, 500, 3000)
+    assert restored.percentile(50) == a.percentile(50)
+    assert restored.mean_us == a.mean_us == 1625
+
+
+def test_parse_mix():
+    assert parse_mix("play_random=3, choices") == {"play_random": 3, "choices": 1}
+    for bad in ("nope=1", "history=x", "history=-1", "history=0", ""):
+        with pytest.raises(ValueError):
+            parse_mix(bad)
+
+
+@pytest.mark.asyncio
+async def test_run_load_records_latency_and_errors_per_endpoint():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503 if request.url.path == "/history" else 200)
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://test"
+    ) as client:
+        result = await run_load(
+            client,
+            {"choices": 1, "history": 1, "play_smart": 0},
+            concurrency=4,
+            warmup=0,
+            requests=200,
+        )
+
+    assert set(result.endpoints) == {"choices", "history"}
+    assert result.overall.histogram.total == 200
+    assert result.overall.errors == result.endpoints["history"].histogram.total > 0
+    assert result.endpoints["choices"].errors == 0
+
+    restored = LoadResult.from_dict(result.to_dict())
+    assert restored.overall.histogram.total == 200
+
+
+@pytest.mark.parametrize(
+    ("argv", "ok"),
+    [
+        ([], True),
+        (["--database-url", "sqlite+aiosqlite:///./other.db"], True),
+        (["--database-url", "postgresql+asyncpg://u:p@db/rpsls"], False),
+        (
+            [
+                "--database-url",
+                "postgresql+asyncpg://u:p@db/rpsls",
+                "--allow-non-sqlite",
+            ],
+            True,
+        ),
+    ],
+)
+def test_non_sqlite_databases_need_an_explicit_flag(argv, ok):
+    if ok:
+        assert _parse_args(argv).database_url == (argv[1] if argv else None)
+    else:
+        with pytest.raises(SystemExit):
+            _parse_args(argv)
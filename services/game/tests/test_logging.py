@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+
+import pydantic
+import pytest
+import structlog
+from structlog.contextvars import bound_contextvars
+
+from app.core.config import Settings
+from app.core.log_queue import LogQueue, QueueLogger, enqueue
+from app.core.logging import SampleEvents
+from app.core.metrics import LOG_DROPPED_TOTAL, LOG_SAMPLED_OUT_TOTAL
+
+
+class _BlockingStream(io.StringIO):
+    """A stdout whose writes wait until ``release`` is set."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+        self.writing = threading.Event()
+
+    def write(self, s: str) -> int:
+        self.writing.set()
+        self.release.wait(5)
+        return super().write(s)
+
+
+def _lines(stream: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_queue_renders_events_off_thread_with_the_callers_context():
+    out = io.StringIO()
+    sink = LogQueue(max_size=100, file=out)
+    sink.start()
+    log = structlog.wrap_logger(
+        QueueLogger(sink),
+        processors=[structlog.contextvars.merge_contextvars, enqueue],
+    )
+
+    with bound_contextvars(request_id="req-1"):
+        for i in range(3):
+            log.info("round_played", n=i)
+    sink.stop()
+
+    assert _lines(out) == [
+        {"request_id": "req-1", "n": i, "event": "round_played"} for i in range(3)
+    ]
+    assert not sink.running
+
+
+def test_full_queue_drops_and_counts_instead_of_blocking():
+    out = _BlockingStream()
+    sink = LogQueue(max_size=2, file=out)
+    dropped_before = LOG_DROPPED_TOTAL._value.get()
+    sink.start()
+
+    sink.put({"event": "first"})
+    assert out.writing.wait(5)  # writer now stuck in write()
+    for i in range(5):
+        sink.put({"event": f"queued-{i}"})
+
+    out.release.set()
+    sink.stop()
+
+    assert [e["event"] for e in _lines(out)] == ["first", "queued-0", "queued-1"]
+    assert sink.dropped == 3
+    assert LOG_DROPPED_TOTAL._value.get() == dropped_before + 3
+
+
+def test_stopped_queue_writes_inline():
+    out = io.StringIO()
+    sink = LogQueue(max_size=1, file=out)
+
+    sink.put({"event": "shutdown"})
+
+    assert _lines(out) == [{"event": "shutdown"}]
+
+
+def test_sampling_keeps_warnings_and_unlisted_events():
+    rolls = iter([0.5, 0.005])
+    sample = SampleEvents({"round_played": 0.01}, random_=lambda: next(rolls))
+    skipped = LOG_SAMPLED_OUT_TOTAL.labels(event="round_played")
+    before = skipped._value.get()
+
+    with pytest.raises(structlog.DropEvent):
+        sample(None, "info", {"event": "round_played"})
+    assert sample(None, "info", {"event": "round_played"}) == {"event": "round_played"}
+    assert sample(None, "warning", {"event": "round_played"})
+    assert sample(None, "info", {"event": "random_api"})
+    assert skipped._value.get() == before + 1
+
+
+@pytest.mark.parametrize("rate", [-0.1, 1.5])
+def test_sample_rates_must_be_probabilities(rate):
+    with pytest.raises(pydantic.ValidationError):
+        Settings(LOG_SAMPLE_RATES={"round_played": rate})
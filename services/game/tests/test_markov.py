@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pytest
+
+import app.services.game_service as gs
+from app.core.metrics import AI_MODE_TOTAL
+from app.services.game_service import GameService
+import app.utils.markov as markov_mod
+from app.utils.enums import Choice, Mode
+from app.utils.rules import COUNTERS
+
+_CYCLE = [Choice.ROCK, Choice.PAPER, Choice.SCISSORS, Choice.LIZARD, Choice.SPOCK]
+
+
+def test_predictor_learns_an_order_two_pattern_in_fixed_space():
+    predictor = markov_mod.MarkovPredictor(order=2)
+    size = predictor.nbytes
+    assert predictor.predict() is None
+
+    predictor.replay(_CYCLE * 200)
+
+    assert predictor.nbytes == size == 25 * 5 * 4
+    assert predictor.predict() is Choice.ROCK  # ... LIZARD, SPOCK -> ROCK
+    assert predictor.choose() in COUNTERS[Choice.ROCK]
+
+
+def test_unseen_context_falls_back_to_any_gesture():
+    predictor = markov_mod.MarkovPredictor(order=1)
+    predictor.replay([Choice.ROCK, Choice.PAPER])  # context PAPER never followed
+
+    assert predictor.predict() is None
+    assert isinstance(predictor.choose(), Choice)
+
+
+def test_sessions_evict_idle_players():
+    sessions = markov_mod.MarkovSessions(2, max_sessions=2)
+    sessions.load("ann", [])
+    sessions.load("bob", [])
+    sessions.record("ann", Choice.ROCK)  # touches ann
+    sessions.load("cid", [])
+
+    assert sessions.get("bob") is None
+    assert sessions.get("ann") is not None
+    assert len(sessions) == 2
+
+
+class _Repo:
+    def __init__(self, stored):
+        self.stored = stored  # newest first, like GameRepository.recent_moves
+        self.reads = 0
+
+    async def recent_moves(self, limit, player_id=None):  # noqa: ARG002
+        self.reads += 1
+        return self.stored[:limit]
+
+    async def add(self, player_choice, computer_choice, winner, player_id=None):  # noqa: ARG002
+        return (player_choice, computer_choice, winner)
+
+    async def increment_stats(self, rounds):
+        self.stats = list(rounds)
+
+    def on_rollback(self, callback):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_markov_mode_warms_up_from_history_and_updates_in_place(monkeypatch):
+    monkeypatch.setattr(
+        markov_mod, "_SESSIONS", markov_mod.MarkovSessions(1, max_sessions=10)
+    )
+    repo = _Repo([Choice.PAPER, Choice.ROCK] * 10)  # player alternates
+    service = GameService(repo)  # type: ignore[arg-type]
+    before = AI_MODE_TOTAL.labels(mode="markov")._value.get()
+
+    # Last stored move was PAPER, so ROCK is expected next – counter it.
+    _, computer, _ = await service.play(Choice.ROCK, Mode.MARKOV, "ann")
+    assert computer in COUNTERS[Choice.ROCK]
+    _, computer, _ = await service.play(Choice.PAPER, Mode.MARKOV, "ann")
+    assert computer in COUNTERS[Choice.PAPER]
+
+    assert repo.reads == 1  # loaded once, then updated in memory
+    assert AI_MODE_TOTAL.labels(mode="markov")._value.get() == before + 2
+    assert repo.stats == [(Mode.MARKOV, Choice.PAPER, repo.stats[0][2])]
+
+
+@pytest.mark.asyncio
+async def test_batch_markov_rounds_learn_within_the_batch(monkeypatch):
+    monkeypatch.setattr(
+        markov_mod, "_SESSIONS", markov_mod.MarkovSessions(1, max_sessions=10)
+    )
+
+    class BatchRepo(_Repo):
+        async def add_many(self, rounds, player_ids=None):  # noqa: ARG002
+            return rounds
+
+    async def fake_random_choice():
+        return Choice.LIZARD
+
+    monkeypatch.setattr(gs, "random_choice", fake_random_choice)
+
+    games = await GameService(BatchRepo([])).play_batch(  # type: ignore[arg-type]
+        [(move, Mode.MARKOV, "bob") for move in [Choice.ROCK, Choice.SPOCK] * 6]
+    )
+
+    # After a few rounds every move of the alternation is predicted.
+    assert all(computer in COUNTERS[player] for player, computer, _ in games[4:])
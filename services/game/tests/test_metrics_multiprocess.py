@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+from prometheus_client import CollectorRegistry, multiprocess
+
+from app.core.metrics import mark_worker_dead, sweep_dead_workers
+
+_ROOT = Path(__file__).resolve().parents[1]  # .../services/game
+
+# Plays the part of one uvicorn worker: record a round, report queue depth.
+_WORKER = """\
+from app.core.metrics import AI_MODE_TOTAL, WRITE_BEHIND_QUEUE_DEPTH, mark_worker_dead
+import os, sys
+AI_MODE_TOTAL.labels(mode="smart").inc()
+WRITE_BEHIND_QUEUE_DEPTH.set(int(sys.argv[1]))
+if sys.argv[2] == "clean":
+    mark_worker_dead()
+print(os.getpid())
+"""
+
+
+def _worker(path: Path, depth: int, *, clean: bool) -> int:
+    proc = subprocess.run(
+        [sys.executable, "-c", _WORKER, str(depth), "clean" if clean else "crash"],
+        cwd=_ROOT,
+        env={**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(proc.stdout)
+
+
+def _scrape(path: Path) -> dict[str, float]:
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=str(path))
+    return {
+        f"{s.name}{s.labels}": s.value
+        for metric in registry.collect()
+        for s in metric.samples
+    }
+
+
+def test_counters_aggregate_across_workers(tmp_path: Path):
+    _worker(tmp_path, 3, clean=False)
+    _worker(tmp_path, 4, clean=False)
+
+    samples = _scrape(tmp_path)
+
+    assert samples["rpsls_ai_mode_total{'mode': 'smart'}"] == 2
+    assert samples["rpsls_write_behind_queue_depth{}"] == 7
+
+
+def test_exited_workers_leave_counters_but_not_live_gauges(tmp_path: Path):
+    _worker(tmp_path, 3, clean=True)
+    crashed = _worker(tmp_path, 4, clean=False)
+
+    assert sweep_dead_workers(str(tmp_path)) == [crashed]
+    samples = _scrape(tmp_path)
+
+    assert samples["rpsls_ai_mode_total{'mode': 'smart'}"] == 2
+    assert "rpsls_write_behind_queue_depth{}" not in samples
+
+
+def test_single_process_mode_is_a_no_op(monkeypatch):
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+    mark_worker_dead()
+
+    assert sweep_dead_workers() == []
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+import uuid
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+import pytest
+from structlog.contextvars import get_contextvars
+from structlog.testing import capture_logs
+
+from app.core.middleware import RequestIdMiddleware
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/context")
+    async def context() -> dict[str, str]:
+        return get_contextvars()
+
+    @app.get("/own-id")
+    async def own_id() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"a"
+            yield b"b"
+
+        return StreamingResponse(chunks(), headers={"X-Request-ID": "mine"})
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    return app
+
+
+@pytest.fixture(name="client")
+async def _client_fixture() -> AsyncIterator[AsyncClient]:
+    transport = ASGITransport(app=_app(), raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.mark.asyncio
+async def test_incoming_request_id_is_bound_and_echoed(client: AsyncClient):
+    resp = await client.get("/context", headers={"X-Request-ID": "req-7"})
+
+    assert resp.headers["X-Request-ID"] == "req-7"
+    assert resp.json() == {"request_id": "req-7", "path": "/context", "method": "GET"}
+
+
+@pytest.mark.asyncio
+async def test_request_id_is_generated_when_absent(client: AsyncClient):
+    first = await client.get("/context")
+    second = await client.get("/context")
+
+    req_id = first.headers["X-Request-ID"]
+    assert str(uuid.UUID(req_id, version=4)) == req_id
+    assert first.json()["request_id"] == req_id
+    assert second.headers["X-Request-ID"] != req_id
+
+
+@pytest.mark.asyncio
+async def test_existing_header_and_streamed_body_pass_through(client: AsyncClient):
+    resp = await client.get("/own-id")
+
+    assert resp.headers.get_list("X-Request-ID") == ["mine"]
+    assert resp.content == b"ab"
+
+
+@pytest.mark.asyncio
+async def test_unhandled_errors_become_json_500_with_request_id(client: AsyncClient):
+    with capture_logs() as logs:
+        resp = await client.get("/boom", headers={"X-Request-ID": "req-500"})
+
+    assert resp.status_code == 500
+    assert resp.json() == {"detail": "Internal Server Error"}
+    assert resp.headers["X-Request-ID"] == "req-500"
+    assert [e["event"] for e in logs] == ["Unhandled exception"]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from app.db.migration_check import current_revisions, head_revisions
+
+
+def test_head_is_the_latest_migration():
+    assert head_revisions() == {"20250815120000"}
+
+
+def test_heads_of_a_branched_history(tmp_path: Path):
+    scripts = {
+        "base.py": 'revision = "a"\ndown_revision = None\n',
+        "left.py": 'revision = "b"\ndown_revision = "a"\n',
+        "right.py": 'revision: str = "c"\ndown_revision: str | None = "a"\n',
+    }
+    for name, source in scripts.items():
+        (tmp_path / name).write_text(source)
+    assert head_revisions(tmp_path) == {"b", "c"}
+
+    (tmp_path / "merge.py").write_text('revision = "d"\ndown_revision = ("b", "c")\n')
+    assert head_revisions(tmp_path) == {"d"}
+
+
+@pytest.fixture(name="sqlite_url")
+def _sqlite_url(tmp_path: Path) -> str:
+    return f"sqlite+aiosqlite:///{tmp_path / 'game.db'}"
+
+
+def test_sqlite_revisions(sqlite_url: str, tmp_path: Path):
+    assert current_revisions(sqlite_url) == set()  # no database file yet
+
+    with sqlite3.connect(tmp_path / "game.db") as conn:
+        conn.execute("CREATE TABLE game (id INTEGER)")
+    assert current_revisions(sqlite_url) == set()  # not stamped
+
+    with sqlite3.connect(tmp_path / "game.db") as conn:
+        conn.execute("CREATE TABLE alembic_version (version_num VARCHAR(32))")
+        conn.execute("INSERT INTO alembic_version VALUES ('20250815120000')")
+    assert current_revisions(sqlite_url) == {"20250815120000"}
+
+
+@pytest.mark.parametrize(
+    "url", ["mysql+aiomysql://u:p@db/rpsls", "not a url", "sqlite:///:memory:"]
+)
+def test_unknown_or_ephemeral_databases_are_never_at_head(url: str):
+    assert not current_revisions(url)
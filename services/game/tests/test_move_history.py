@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.database import Base
+from app.repositories.game_repository import GameRepository
+import app.services.move_history as mh
+from app.services.game_service import GameService
+from app.utils.enums import Choice, GameResult, Mode
+
+
+@pytest.fixture(name="session_factory")
+async def _session_factory_fixture():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def test_window_keeps_newest_first_and_evicts_oldest():
+    recent = mh.RecentMoves(2)
+    for move in (Choice.ROCK, Choice.PAPER, Choice.SPOCK):
+        recent.record(move)
+
+    assert recent.snapshot() == [Choice.SPOCK, Choice.PAPER]
+    recent.clear()
+    assert len(recent) == 0
+
+
+def test_cache_evicts_least_recently_used_player():
+    cache = mh.RecentMovesCache(3, max_players=2)
+    cache.load("ann", [Choice.ROCK])
+    cache.load("bob", [])
+    assert cache.get("ann") is not None  # ann is now the most recent
+    cache.load(None, [])
+
+    assert cache.get("bob") is None
+    cache.record("bob", Choice.PAPER)  # unloaded players are skipped
+    assert cache.get("bob") is None
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_recent_moves_and_pages_filter_by_player(session_factory):
+    async with session_factory() as session:
+        repo = GameRepository(session)
+        await repo.add(Choice.ROCK, Choice.ROCK, GameResult.TIE, "ann")
+        await repo.add(Choice.PAPER, Choice.ROCK, GameResult.PLAYER)
+        await repo.add(Choice.SPOCK, Choice.ROCK, GameResult.PLAYER, "ann")
+        await session.commit()
+
+        assert await repo.recent_moves(5, "ann") == [Choice.SPOCK, Choice.ROCK]
+        assert await repo.recent_moves(5) == [Choice.PAPER]  # anonymous only
+        assert len(await repo.list_recent()) == 3
+        page = await repo.list_page(1, player_id="ann")
+        assert [g.player_choice for g in page] == [Choice.SPOCK]
+        older = await repo.list_page(
+            5, (page[0].created_at, page[0].id), player_id="ann"
+        )
+        assert [g.player_choice for g in older] == [Choice.ROCK]
+
+
+@pytest.mark.asyncio
+async def test_seed_loads_anonymous_moves_and_clear_resets(
+    session_factory, monkeypatch
+):
+    monkeypatch.setattr(mh, "_CACHE", mh.RecentMovesCache(2, max_players=10))
+
+    async with session_factory() as session:
+        repo = GameRepository(session)
+        for move in (Choice.ROCK, Choice.PAPER, Choice.LIZARD):
+            await repo.add(move, Choice.ROCK, GameResult.TIE)
+        await repo.add(Choice.SPOCK, Choice.ROCK, GameResult.TIE, "ann")
+        await session.commit()
+
+    await mh.seed_recent_moves(session_factory)
+    recent = mh.get_recent_moves_cache().get(None)
+    assert recent is not None
+    assert recent.snapshot() == [Choice.LIZARD, Choice.PAPER]
+
+    async with session_factory() as session:
+        await GameService(GameRepository(session)).clear_history()
+        await session.commit()
+    assert len(mh.get_recent_moves_cache()) == 0
+
+
+@pytest.mark.asyncio
+async def test_seed_failure_leaves_window_unloaded(monkeypatch):
+    monkeypatch.setattr(mh, "_CACHE", mh.RecentMovesCache(5, max_players=10))
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")  # no tables
+
+    await mh.seed_recent_moves(async_sessionmaker(engine))
+
+    assert mh.get_recent_moves_cache().get(None) is None
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch", [False, True])
+async def test_rolled_back_rounds_do_not_stay_in_ai_state(
+    session_factory, monkeypatch, batch
+):
+    monkeypatch.setattr(mh, "_CACHE", mh.RecentMovesCache(3, max_players=10))
+
+    async with session_factory() as session:
+        service = GameService(GameRepository(session))
+        if batch:
+            await service.play_batch([(Choice.ROCK, Mode.SMART, "ann")])
+        else:
+            await service.play(Choice.ROCK, Mode.SMART, "ann")
+        assert mh.get_recent_moves_cache().get("ann").snapshot() == [Choice.ROCK]
+        await session.rollback()  # e.g. the commit failed
+
+    assert mh.get_recent_moves_cache().get("ann") is None
+    async with session_factory() as session:
+        service = GameService(GameRepository(session))
+        await service.play(Choice.PAPER, Mode.SMART, "ann")
+        await session.commit()
+        await session.rollback()  # after a commit the hook is gone
+    assert mh.get_recent_moves_cache().get("ann").snapshot() == [Choice.PAPER]
+
+
+@pytest.mark.asyncio
+async def test_failed_insert_is_not_remembered(session_factory, monkeypatch):
+    monkeypatch.setattr(mh, "_CACHE", mh.RecentMovesCache(3, max_players=10))
+
+    async def _broken_add(*_args):
+        raise RuntimeError("insert failed")
+
+    async with session_factory() as session:
+        repo = GameRepository(session)
+        await GameService(repo).play(Choice.ROCK, Mode.SMART, "ann")
+        await session.commit()
+        monkeypatch.setattr(repo, "add", _broken_add)
+        with pytest.raises(RuntimeError):
+            await GameService(repo).play(Choice.SPOCK, Mode.SMART, "ann")
+
+    assert mh.get_recent_moves_cache().get("ann").snapshot() == [Choice.ROCK]
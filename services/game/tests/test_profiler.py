@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+import sys
+import threading
+import time
+
+from httpx import ASGITransport, AsyncClient
+from pydantic import SecretStr
+import pytest
+
+from app.core.config import get_settings
+from app.main import app as fastapi_app
+from app.utils.profiler import StackSampler
+
+_TOKEN = "s3cret"
+
+
+@pytest.fixture(name="client")
+async def _client_fixture() -> AsyncIterator[AsyncClient]:
+    transport = ASGITransport(app=fastapi_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(name="profiling")
+def _profiling(monkeypatch: pytest.MonkeyPatch) -> str:
+    """Enable the profiling endpoint; return its URL."""
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", SecretStr(_TOKEN))
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_INTERVAL_MS", 1.0)
+    return f"{settings.API_V1_STR}/debug/profile"
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_sampler_counts_the_target_threads_stacks():
+    stop = threading.Event()
+
+    def busy() -> None:
+        while not stop.is_set():
+            _spin(0.001)
+
+    worker = threading.Thread(target=busy)
+    worker.start()
+    sampler = StackSampler(worker.ident or 0, interval=0.001)
+    sampler.start()
+    time.sleep(0.05)
+    sampler.stop()
+    stop.set()
+    worker.join()
+
+    assert sampler.samples > 0
+    assert "tests.test_profiler:_spin" in sampler.collapsed()
+    stack, count = sampler.collapsed().splitlines()[0].rsplit(" ", 1)
+    assert stack.split(";")[-1].startswith("tests.test_profiler:")
+    assert int(count) > 0
+
+
+@pytest.mark.asyncio
+async def test_profile_endpoint_is_hidden_when_disabled(client: AsyncClient):
+    url = f"{get_settings().API_V1_STR}/debug/profile"
+    resp = await client.post(url, headers={"X-Admin-Token": _TOKEN})
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "wrong"}])
+async def test_profile_endpoint_requires_the_admin_token(
+    client: AsyncClient, profiling: str, headers: dict[str, str]
+):
+    resp = await client.post(profiling, params={"seconds": 0.01}, headers=headers)
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_profile_window_is_capped(client: AsyncClient, profiling: str):
+    limit = get_settings().PROFILE_MAX_SECONDS
+    resp = await client.post(
+        profiling, params={"seconds": limit + 1}, headers={"X-Admin-Token": _TOKEN}
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_profile_samples_busy_coroutines(client: AsyncClient, profiling: str):
+    async def busy() -> None:
+        while True:
+            _spin(0.0005)
+            await asyncio.sleep(0)
+
+    switch_interval = sys.getswitchinterval()
+    task = asyncio.create_task(busy())
+    try:
+        resp = await client.post(
+            profiling, params={"seconds": 0.2}, headers={"X-Admin-Token": _TOKEN}
+        )
+    finally:
+        task.cancel()
+
+    assert resp.status_code == 200
+    assert sys.getswitchinterval() == switch_interval
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert int(resp.headers["X-Profile-Samples"]) > 0
+    assert "tests.test_profiler:_spin" in resp.text
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from app.core.config import Settings
+from app.core.responses import ORJSONResponse, default_response_class, etag_matches
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+
+_ETAG = '"abc123"'
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ("", False),
+        ('"abc123"', True),
+        ('W/"abc123"', True),
+        ('"other", "abc123"', True),
+        ("*", True),
+        ('"abc"', False),
+        ("abc123", False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(header, _ETAG) is expected
+
+
+def test_orjson_response_renders_like_json():
+    content = {"id": 1, "name": "rock", "scores": [1, 2], 3: None}
+
+    body = ORJSONResponse(content).body
+
+    assert json.loads(body) == {"id": 1, "name": "rock", "scores": [1, 2], "3": None}
+
+
+def test_orjson_response_rejects_numpy_values():
+    """NumPy values leaking into a payload are a bug, not something to render."""
+
+    with pytest.raises(TypeError):
+        ORJSONResponse({"scores": np.array([1, 2])})
+
+
+def test_default_response_class_is_selectable():
+    assert default_response_class(Settings(ORJSON_RESPONSES=True)) is ORJSONResponse
+    # Off: FastAPI's own placeholder, which keeps its Pydantic fast path.
+    default = default_response_class(Settings(ORJSON_RESPONSES=False))
+    assert isinstance(default, DefaultPlaceholder)
+    assert default.value is JSONResponse
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pytest
+
+from app.utils import game_logic as gl
+from app.utils.enums import Choice
+from app.utils.rules import COUNTERS, OUTCOME_RESULTS, decide_winners
+
+
+def test_decide_winners_matches_scalar_for_every_pair():
+    pairs = list(itertools.product(Choice, repeat=2))
+    players = np.array([p for p, _ in pairs], dtype=np.uint8)
+    computers = np.array([c for _, c in pairs], dtype=np.uint8)
+
+    codes = decide_winners(players, computers)
+
+    assert codes.dtype == np.uint8
+    assert [OUTCOME_RESULTS[code] for code in codes] == [
+        gl.decide_winner(p, c) for p, c in pairs
+    ]
+
+
+def test_decide_winners_scores_large_random_batches():
+    rng = np.random.default_rng(7)
+    players = rng.integers(1, 6, size=100_000, dtype=np.uint8)
+    computers = rng.integers(1, 6, size=100_000, dtype=np.uint8)
+
+    codes = decide_winners(players, computers)
+
+    # Symmetric game: swapping sides swaps wins and losses, ties stay ties.
+    swapped = decide_winners(computers, players)
+    assert np.array_equal((codes == 1), (swapped == 2))
+    assert np.array_equal((codes == 0), (players == computers))
+
+
+@pytest.mark.parametrize(
+    "players,computers",
+    [([1, 2], [1]), ([0], [1]), ([1], [6]), ([-1], [1]), ([1], [300])],
+)
+def test_decide_winners_rejects_bad_input(players, computers):
+    with pytest.raises(ValueError):
+        decide_winners(players, computers)
+
+
+def test_counters_beat_their_target():
+    for target, counters in COUNTERS.items():
+        assert len(counters) == 2
+        assert all(gl.decide_winner(c, target).value == "player" for c in counters)
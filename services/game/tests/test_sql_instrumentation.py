@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from structlog.contextvars import bound_contextvars
+from structlog.testing import capture_logs
+
+from app.core.metrics import DB_STATEMENT_INFO, DB_STATEMENT_ROWS
+from app.db.instrumentation import fingerprint, instrument_engine
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        (
+            "SELECT * FROM game WHERE player_id = 'ann' LIMIT 50",
+            "SELECT * FROM game WHERE player_id = ? LIMIT ?",
+        ),
+        (
+            "select a  -- trailing\n from t where id = $1 and b = %(b)s /* x */",
+            "select a from t where id = ? and b = ?",
+        ),
+        (
+            "INSERT INTO t (a, b) VALUES (?, ?), (?, ?), (?, ?)",
+            "INSERT INTO t (a, b) VALUES (...)",
+        ),
+        ("DELETE FROM t WHERE id IN (:id_1, :id_2)", "DELETE FROM t WHERE id IN (...)"),
+        ("SELECT x::text, t2.c FROM t2", "SELECT x::text, t2.c FROM t2"),
+    ],
+)
+def test_fingerprint_keeps_only_the_shape(statement, expected):
+    assert fingerprint(statement) == expected
+
+
+def _info_ids() -> dict[str, str]:
+    return {
+        s.labels["statement"]: s.labels["fingerprint"]
+        for s in DB_STATEMENT_INFO.collect()[0].samples
+    }
+
+
+@pytest.mark.asyncio
+async def test_statements_are_measured_per_fingerprint_and_slow_ones_logged():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine.sync_engine, slow_query_ms=1e-6, max_fingerprints=100)
+
+    with capture_logs() as logs, bound_contextvars(request_id="req-42"):
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE fp_t (a INTEGER)"))
+            for rows in ("(1)", "(1), (2), (3)"):
+                await conn.execute(text(f"INSERT INTO fp_t VALUES {rows}"))
+    await engine.dispose()
+
+    fp_id = _info_ids()["INSERT INTO fp_t VALUES (...)"]
+    rows = DB_STATEMENT_ROWS.labels(fingerprint=fp_id, operation="INSERT")
+    assert rows._value.get() == 4
+
+    slow = [e for e in logs if e["event"] == "slow_query" and e["fingerprint"] == fp_id]
+    assert len(slow) == 2
+    assert {e["request_id"] for e in slow} == {"req-42"}
+
+
+@pytest.mark.asyncio
+async def test_fingerprints_beyond_the_limit_share_one_label():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine.sync_engine, slow_query_ms=0, max_fingerprints=1)
+
+    with capture_logs() as logs:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1 AS limit_one"))
+            await conn.execute(text("SELECT 2 AS limit_two"))
+    await engine.dispose()
+
+    assert "SELECT ? AS limit_one" in _info_ids()
+    assert "SELECT ? AS limit_two" not in _info_ids()
+    assert not logs  # slow-query log disabled
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.startup import DEFERRED_MODULES, import_profile, parse_importtime
+
+_ROOT = Path(__file__).resolve().parents[1]  # .../services/game
+
+_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | site
+import time:        40 |         40 |     numpy.core
+import time:        60 |        100 |   numpy
+import time:        30 |         30 |   app.core
+import time:        20 |        150 | app.main
+"""
+
+
+def test_parse_importtime_keeps_the_target_subtree():
+    profile = parse_importtime(_IMPORTTIME, "app.main")
+
+    assert profile.total_us == 150
+    assert profile.self_us == {
+        "numpy.core": 40,
+        "numpy": 60,
+        "app.core": 30,
+        "app.main": 20,
+    }
+    assert profile.by_package() == {"numpy": 100, "app": 50}
+
+
+def test_parse_importtime_requires_the_module():
+    with pytest.raises(ValueError):
+        parse_importtime(_IMPORTTIME, "app.other")
+
+
+def test_app_main_does_not_import_deferred_modules():
+    imported = import_profile("app.main").self_us
+
+    assert "app.main" in imported
+    assert not [m for m in DEFERRED_MODULES if m in imported]
+
+
+def test_importing_app_main_leaves_the_gc_running():
+    """``app.main`` pauses the collector while importing and must resume it."""
+
+    check = "import gc, app.main; assert gc.isenabled() and gc.get_freeze_count()"
+    subprocess.run([sys.executable, "-c", check], cwd=_ROOT, check=True)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+import app.core.http_client as hc
+from app.core.metrics import ENTROPY_FALLBACK_TOTAL
+import app.utils.game_logic as gl
+from app.utils.enums import Choice
+from benchmarks.stub_api import FaultProfile, Latency, RandomApiStub
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        ("0", Latency("fixed", 0.0)),
+        ("20ms", Latency("fixed", 0.02)),
+        ("uniform:250us:1.5s", Latency("uniform", 0.00025, 1.5)),
+        ("exp:10ms", Latency("exp", 0.01)),
+        ("lognormal:20ms:0.6", Latency("lognormal", 0.02, 0.6)),
+        ("pareto:5ms:1.5", Latency("pareto", 0.005, 1.5)),
+    ],
+)
+def test_latency_specs(spec, expected):
+    assert Latency.parse(spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["fast", "uniform:1ms", "exp:-1ms", "pareto:1ms:0"])
+def test_invalid_latency_specs(spec):
+    with pytest.raises(ValueError):
+        Latency.parse(spec)
+
+
+def test_fault_rates_are_validated():
+    with pytest.raises(ValueError):
+        FaultProfile(error_rate=0.6, malformed_rate=0.6)
+
+
+@pytest.fixture(name="use_stub")
+async def _use_stub():
+    """Route the shared HTTP client to a ``RandomApiStub`` built per test."""
+
+    async def install(profile: FaultProfile) -> RandomApiStub:
+        stub = RandomApiStub(profile, seed=1)
+        await hc.close_http_client()
+        hc.init_http_client(transport=httpx.ASGITransport(app=stub))
+        gl.reset_random_api_guard()
+        return stub
+
+    yield install
+    await hc.close_http_client()
+    gl.reset_random_api_guard()
+
+
+@pytest.mark.asyncio
+async def test_stub_speaks_the_random_api_contract(use_stub):
+    stub = await use_stub(FaultProfile(latency=Latency.parse("1ms")))
+
+    numbers = [await gl.fetch_random_number() for _ in range(20)]
+
+    assert all(1 <= n <= 100 for n in numbers)
+    assert stub.served == {"ok": 20}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "profile",
+    [
+        FaultProfile(error_rate=1.0),
+        FaultProfile(timeout_rate=1.0, hang=30.0),
+        FaultProfile(malformed_rate=1.0),
+    ],
+    ids=["error", "timeout", "malformed"],
+)
+async def test_degraded_upstream_falls_back_to_the_local_prng(
+    use_stub, monkeypatch, profile
+):
+    monkeypatch.setattr(gl, "_adaptive_timeout", lambda: 0.05)
+    await use_stub(profile)
+    fallback = ENTROPY_FALLBACK_TOTAL.labels(reason="api_error")
+    before = fallback._value.get()
+
+    for _ in range(3):
+        assert isinstance(await gl.random_choice(), Choice)
+
+    assert fallback._value.get() == before + 3
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from app.core.metrics import DB_COMMIT_SECONDS, PLAY_STAGE_SECONDS
+import app.core.timing as timing
+from app.db.database import get_db_session
+
+
+def _count(histogram, **labels) -> float:
+    histogram.labels(**labels)  # create the child so its samples exist
+    return next(
+        s.value
+        for s in histogram.collect()[0].samples
+        if s.name.endswith("_count") and s.labels == labels
+    )
+
+
+def test_server_timing_header_accumulates_stages_in_order():
+    server_timing = timing.ServerTiming()
+    server_timing.add("history", 0.002)
+    server_timing.add("ai", 0.0001)
+    server_timing.add("history", 0.001)
+
+    assert (
+        server_timing.header(0.01) == "history;dur=3.00, ai;dur=0.10, total;dur=10.00"
+    )
+
+
+def test_timed_stage_observes_failures_and_only_records_inside_a_request():
+    labels = {"stage": "persist", "mode": "smart"}
+    before = _count(PLAY_STAGE_SECONDS, **labels)
+
+    with timing.timed_stage(PLAY_STAGE_SECONDS, "persist", "smart"):
+        pass  # no request context: histogram only
+
+    server_timing = timing.ServerTiming()
+    token = timing._TIMING.set(server_timing)
+    try:
+        with (
+            pytest.raises(RuntimeError),
+            timing.timed_stage(PLAY_STAGE_SECONDS, "persist", "smart"),
+        ):
+            raise RuntimeError
+    finally:
+        timing._TIMING.reset(token)
+
+    assert _count(PLAY_STAGE_SECONDS, **labels) == before + 2
+    assert list(server_timing.stages) == ["persist"]
+
+
+@pytest.mark.asyncio
+async def test_session_commit_is_timed_with_the_request_mode():
+    server_timing = timing.ServerTiming()
+    token = timing._TIMING.set(server_timing)
+    before = _count(DB_COMMIT_SECONDS, mode="markov")
+    try:
+        timing.set_mode("markov")
+        sessions = get_db_session()
+        session = await anext(sessions)
+        await session.execute(text("SELECT 1"))  # open a transaction to commit
+        with pytest.raises(StopAsyncIteration):
+            await anext(sessions)
+    finally:
+        timing._TIMING.reset(token)
+
+    assert _count(DB_COMMIT_SECONDS, mode="markov") == before + 1
+    assert "commit" in server_timing.stages
+    assert timing.current_mode() == "none"
+
+
+@pytest.mark.asyncio
+async def test_middleware_adds_the_header_when_the_response_starts():
+    async def app(scope, receive, send):  # noqa: ARG001
+        timing.record_stage("ai", 0.001)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        timing.record_stage("late", 0.001)  # after the header went out
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    await timing.ServerTimingMiddleware(app)(
+        {"type": "http", "path": "/", "headers": []}, None, send
+    )
+
+    ((name, value),) = sent[0]["headers"]
+    assert name == b"server-timing"
+    assert [p.split(";")[0] for p in value.decode().split(", ")] == ["ai", "total"]
+    assert sent[1]["body"] == b"ok"
+    assert timing._TIMING.get() is None
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.database import Base
+from app.models.game import Game
+from app.repositories.game_repository import GameRepository
+import app.services.game_service as gs
+from app.services.game_service import GameService
+from app.services.write_behind import WriteBehindQueue
+from app.utils.enums import Choice, GameResult, Mode
+
+
+def _game() -> Game:
+    return Game(
+        id=uuid.uuid4(),
+        player_choice=Choice.ROCK,
+        computer_choice=Choice.PAPER,
+        winner=GameResult.COMPUTER,
+        created_at=datetime.now(UTC),
+    )
+
+
+@pytest.fixture(name="session_factory")
+async def _session_factory_fixture():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rounds_are_group_committed_and_drained(session_factory, monkeypatch):
+    queue = WriteBehindQueue(
+        session_factory, max_size=100, batch_size=2, flush_interval=0.01
+    )
+    flushed: list[int] = []
+    original_flush = queue.flush
+
+    async def _recording_flush(batch):
+        flushed.append(len(batch))
+        await original_flush(batch)
+
+    monkeypatch.setattr(queue, "flush", _recording_flush)
+
+    queue.start()
+    for _ in range(5):
+        await queue.submit(_game(), Mode.RANDOM)
+    await queue.stop()  # graceful drain
+
+    assert sum(flushed) == 5
+    assert max(flushed) <= 2
+    async with session_factory() as session:
+        count = await session.scalar(select(func.count()).select_from(Game))
+    assert count == 5
+    async with session_factory() as session:
+        stats = await GameRepository(session).get_stats()
+    assert stats["mode"] == {"random": 5}
+
+
+@pytest.mark.asyncio
+async def test_play_enqueues_instead_of_flushing(monkeypatch):
+    submitted: list[Game] = []
+
+    class FakeQueue:
+        async def submit(self, game, mode):  # noqa: ARG002
+            submitted.append(game)
+
+    class NoWriteRepo:
+        async def add(self, *_args):
+            raise AssertionError("repository must not be used in write-behind mode")
+
+    async def fake_random_choice():
+        return Choice.SCISSORS
+
+    monkeypatch.setattr(gs, "get_write_behind_queue", FakeQueue)
+    monkeypatch.setattr(gs, "random_choice", fake_random_choice)
+
+    game = await GameService(NoWriteRepo()).play(Choice.ROCK)  # type: ignore[arg-type]
+
+    assert submitted == [game]
+    assert game.winner is GameResult.PLAYER
+    assert game.id is not None and game.created_at is not None
+
+
+@pytest.mark.asyncio
+async def test_clear_history_drains_queued_rounds_first(session_factory, monkeypatch):
+    queue = WriteBehindQueue(
+        session_factory, max_size=100, batch_size=100, flush_interval=0.05
+    )
+    monkeypatch.setattr(gs, "get_write_behind_queue", lambda: queue)
+    queue.start()
+    for _ in range(3):
+        await queue.submit(_game(), Mode.RANDOM)
+
+    async with session_factory() as session:
+        await GameService(GameRepository(session)).clear_history()
+        await session.commit()
+    await queue.stop()
+
+    async with session_factory() as session:
+        count = await session.scalar(select(func.count()).select_from(Game))
+        stats = await GameRepository(session).get_stats()
+    assert count == 0
+    assert stats == {}